@@ -0,0 +1,3 @@
+"""
+API HTTP de empleados sobre el repositorio compartido
+"""
@@ -0,0 +1,395 @@
+"""
+Servidor HTTP con las operaciones CRUD de empleados
+Todos los hilos del servidor comparten el mismo MongoClient (y su pool de conexiones);
+los listados se envían en streaming con Transfer-Encoding: chunked
+
+Uso (desde la raíz del proyecto):
+    python -m api.server --puerto 8000
+    python -m api.server --backend mongomock --scott
+
+Rutas:
+    GET    /salud                                   Estado de la conexión y del pool
+    GET    /latencias                               Percentiles de latencia por comando y por función
+    GET    /empleados?despues_de=&limite=           Página de empleados ordenada por empno
+    GET    /empleados/buscar?criterio=&valor=&limite=
+    GET    /empleados/{empno}
+    POST   /empleados                               Un objeto (crear) o un arreglo (crear en lote)
+    PATCH  /empleados/{empno}                       Campos a modificar (también PUT)
+    DELETE /empleados/{empno}
+"""
+import argparse
+import json
+import logging
+import os
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from pymongo.errors import DuplicateKeyError, PyMongoError
+from db.mongo_config import get_collection, close_connection, diagnostico_conexion, latencias_operaciones
+from services.repository import EmployeeRepository
+from services.search.queries import CRITERIOS, orden_por_nombre
+from services.shared.catalog import catalogo
+from services.shared.change_stream import vigilante_cambios
+from services.shared.constants import TAMANO_PAGINA
+from services.shared.validation import registro_a_documento, registro_a_cambios
+
+logger = logging.getLogger(__name__)
+
+# Límites de las peticiones
+LIMITE_MAXIMO = int(os.getenv("API_MAX_LIMIT", "100000"))
+TAMANO_MAXIMO_CUERPO = int(os.getenv("API_MAX_BODY_BYTES", str(16 * 1024 * 1024)))
+
+# Documentos por fragmento al enviar listados en streaming
+DOCUMENTOS_POR_FRAGMENTO = 200
+
+class ErrorHTTP(Exception):
+    """Error que se responde al cliente con un código de estado y un mensaje"""
+
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+
+def _json(valor):
+    return json.dumps(valor, ensure_ascii=False, default=str)
+
+def _empleado_json(empleado):
+    """Empleado como se responde al cliente (sin el campo interno ename_search)"""
+    return empleado.to_dict(incluir_busqueda=False)
+
+def _entero(parametros, nombre, defecto=None, minimo=None, maximo=None):
+    """Lee un parámetro entero de la query string"""
+    valores = parametros.get(nombre)
+    if not valores or valores[0] == "":
+        return defecto
+    try:
+        valor = int(valores[0])
+    except ValueError:
+        raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"'{nombre}' debe ser un número entero")
+    if minimo is not None and valor < minimo:
+        raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"'{nombre}' debe ser mayor o igual a {minimo}")
+    if maximo is not None:
+        valor = min(valor, maximo)
+    return valor
+
+def _empno_de_ruta(segmento):
+    try:
+        return int(segmento)
+    except ValueError:
+        raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: /empleados/{segmento}")
+
+class ManejadorEmpleados(BaseHTTPRequestHandler):
+    """
+    Atiende las peticiones de la API; el servidor crea una instancia por petición
+    El repositorio es compartido por todos los hilos (atributo de clase)
+    """
+    protocol_version = "HTTP/1.1"
+    server_version = "CRUDMongoDB"
+    repositorio = None
+
+    # Encabezados y cuerpo salen en un mismo segmento TCP (evita la espera por ACK retrasado)
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    # Despacho de rutas
+    def do_GET(self):
+        self._atender(self._rutas_get)
+
+    def do_POST(self):
+        self._atender(self._rutas_post)
+
+    def do_PATCH(self):
+        self._atender(self._rutas_patch)
+
+    do_PUT = do_PATCH
+
+    def do_DELETE(self):
+        self._atender(self._rutas_delete)
+
+    def _atender(self, rutas):
+        url = urlsplit(self.path)
+        segmentos = [s for s in url.path.split("/") if s]
+        parametros = parse_qs(url.query)
+        try:
+            rutas(segmentos, parametros)
+        except ErrorHTTP as e:
+            self._responder(e.estado, {"error": e.mensaje})
+        except PyMongoError as e:
+            logger.error(f"Error de MongoDB: {e}")
+            self._responder(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Error de base de datos"})
+        except Exception as e:
+            logger.exception(f"Error inesperado: {e}")
+            self._responder(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Error interno"})
+
+    def _rutas_get(self, segmentos, parametros):
+        match segmentos:
+            case ["salud"]:
+                self._salud()
+            case ["latencias"]:
+                self._responder(HTTPStatus.OK, latencias_operaciones())
+            case ["empleados"]:
+                self._listar(parametros)
+            case ["empleados", "buscar"]:
+                self._buscar(parametros)
+            case ["empleados", empno]:
+                self._obtener(_empno_de_ruta(empno))
+            case _:
+                raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {self.path}")
+
+    def _rutas_post(self, segmentos, parametros):
+        if segmentos != ["empleados"]:
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {self.path}")
+        cuerpo = self._leer_json()
+        if isinstance(cuerpo, list):
+            self._crear_lote(cuerpo)
+        else:
+            self._crear(cuerpo)
+
+    def _rutas_patch(self, segmentos, parametros):
+        if len(segmentos) != 2 or segmentos[0] != "empleados":
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {self.path}")
+        self._actualizar(_empno_de_ruta(segmentos[1]), self._leer_json())
+
+    def _rutas_delete(self, segmentos, parametros):
+        if len(segmentos) != 2 or segmentos[0] != "empleados":
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {self.path}")
+        self._eliminar(_empno_de_ruta(segmentos[1]))
+
+    # Operaciones
+    def _salud(self):
+        # Una consulta mínima confirma que la colección responde (también con mongomock)
+        try:
+            self.repositorio.collection.find_one({}, {"_id": 1})
+            conectado = True
+        except PyMongoError:
+            conectado = False
+        estado = HTTPStatus.OK if conectado else HTTPStatus.SERVICE_UNAVAILABLE
+        self._responder(estado, {"conectado": conectado, "pool": diagnostico_conexion()["pool"]})
+
+    def _listar(self, parametros):
+        despues_de = _entero(parametros, "despues_de")
+        limite = _entero(parametros, "limite", TAMANO_PAGINA, minimo=1, maximo=LIMITE_MAXIMO)
+        filtro = {} if despues_de is None else {"empno": {"$gt": despues_de}}
+        empleados = self.repositorio.iter_search(filtro, limit=limite, sort=[("empno", 1)])
+        self._responder_lista(empleados, con_siguiente=limite)
+
+    def _buscar(self, parametros):
+        criterio = (parametros.get("criterio") or [""])[0].lower()
+        valor = (parametros.get("valor") or [""])[0]
+        if criterio not in CRITERIOS or not valor:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"Indica 'criterio' ({', '.join(CRITERIOS)}) y 'valor'")
+        limite = _entero(parametros, "limite", 0, minimo=0, maximo=LIMITE_MAXIMO)
+        try:
+            filtro = self.repositorio.filtro_busqueda(criterio, valor if criterio == "id" else valor.upper())
+        except ValueError as e:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, str(e))
+        orden = orden_por_nombre() if criterio == "nombre" else None
+        self._responder_lista(self.repositorio.iter_search(filtro, limit=limite, sort=orden))
+
+    def _obtener(self, empno):
+        empleado = self.repositorio.get(empno)
+        if empleado is None:
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"No existe el empleado {empno}")
+        self._responder(HTTPStatus.OK, _empleado_json(empleado))
+
+    def _crear(self, registro):
+        if not isinstance(registro, dict):
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Se esperaba un objeto JSON")
+        documento, error = registro_a_documento(registro, catalogo.departamentos(self.repositorio.collection))
+        if error:
+            raise ErrorHTTP(HTTPStatus.UNPROCESSABLE_ENTITY, error)
+        try:
+            documento = self.repositorio.insert(documento)
+        except DuplicateKeyError:
+            raise ErrorHTTP(HTTPStatus.CONFLICT, f"Ya existe el empleado {documento['empno']}")
+        self._responder(HTTPStatus.CREATED, documento)
+
+    def _crear_lote(self, registros):
+        departamentos = catalogo.departamentos(self.repositorio.collection)
+        documentos = []
+        invalidos = []
+        for indice, registro in enumerate(registros):
+            documento, error = registro_a_documento(registro, departamentos) if isinstance(registro, dict) else (None, "Se esperaba un objeto JSON")
+            if error:
+                invalidos.append({"indice": indice, "motivo": error})
+            else:
+                documentos.append(documento)
+
+        resultado = self.repositorio.insert_many(documentos)
+        resultado["invalidos"] = invalidos
+        completo = not (invalidos or resultado["duplicados"] or resultado["errores"])
+        self._responder(HTTPStatus.CREATED if completo else HTTPStatus.MULTI_STATUS, resultado)
+
+    def _actualizar(self, empno, registro):
+        if not isinstance(registro, dict):
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Se esperaba un objeto JSON")
+        cambios, error = registro_a_cambios(registro, catalogo.departamentos(self.repositorio.collection))
+        if error:
+            raise ErrorHTTP(HTTPStatus.UNPROCESSABLE_ENTITY, error)
+        if not self.repositorio.update(empno, cambios):
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"No existe el empleado {empno}")
+        self._obtener(empno)
+
+    def _eliminar(self, empno):
+        if not self.repositorio.delete(empno):
+            raise ErrorHTTP(HTTPStatus.NOT_FOUND, f"No existe el empleado {empno}")
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    # Entrada y salida
+    def _leer_json(self):
+        """Lee y decodifica el cuerpo JSON de la petición"""
+        try:
+            longitud = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            longitud = -1
+        # rfile.read(-1) esperaría hasta que el cliente cierre la conexión: se rechaza
+        # antes de leer, y como el cuerpo queda sin consumir se cierra la conexión
+        if longitud < 0:
+            self.close_connection = True
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, "Content-Length inválido")
+        if longitud > TAMANO_MAXIMO_CUERPO:
+            self.close_connection = True
+            raise ErrorHTTP(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"El cuerpo excede {TAMANO_MAXIMO_CUERPO} bytes")
+        try:
+            return json.loads(self.rfile.read(longitud) or b"null")
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ErrorHTTP(HTTPStatus.BAD_REQUEST, f"JSON inválido: {e}")
+
+    def _responder(self, estado, cuerpo):
+        """Envía una respuesta JSON completa"""
+        datos = _json(cuerpo).encode("utf-8")
+        self.send_response(estado)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def _responder_lista(self, empleados, con_siguiente=None):
+        """
+        Envía {"empleados": [...], "siguiente": empno} en fragmentos (chunked)
+        a medida que el cursor entrega empleados, sin armar la lista en memoria
+
+        Args:
+            empleados: Iterador de objetos Empleado
+            con_siguiente: Tamaño de página; si se llena, 'siguiente' es el último empno enviado
+        """
+        empleados = iter(empleados)
+        # Leer el primer empleado antes de enviar encabezados para poder responder errores
+        primero = next(empleados, None)
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        enviados = 0
+        ultimo_empno = None
+        fragmento = ['{"empleados": [']
+        try:
+            if primero is not None:
+                for empleado in _encadenar(primero, empleados):
+                    fragmento.append(("," if enviados else "") + _json(_empleado_json(empleado)))
+                    enviados += 1
+                    ultimo_empno = empleado.empno
+                    if len(fragmento) >= DOCUMENTOS_POR_FRAGMENTO:
+                        self._escribir_fragmento("".join(fragmento))
+                        fragmento = []
+        except PyMongoError as e:
+            # Los encabezados ya se enviaron: se corta la respuesta para que el cliente detecte el error
+            logger.error(f"Error de MongoDB durante el streaming: {e}")
+            self.close_connection = True
+            return
+
+        siguiente = ultimo_empno if con_siguiente and enviados == con_siguiente else None
+        fragmento.append(f'], "total": {enviados}, "siguiente": {_json(siguiente)}}}')
+        self._escribir_fragmento("".join(fragmento))
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _escribir_fragmento(self, texto):
+        datos = texto.encode("utf-8")
+        self.wfile.write(f"{len(datos):X}\r\n".encode("ascii") + datos + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, formato, *args):
+        logger.info("%s - %s", self.address_string(), formato % args)
+
+def _encadenar(primero, resto):
+    yield primero
+    yield from resto
+
+def crear_servidor(host="127.0.0.1", puerto=8000, collection=None):
+    """
+    Crea el servidor HTTP con un repositorio compartido por todos sus hilos
+
+    Args:
+        host: Interfaz donde escuchar
+        puerto: Puerto TCP
+        collection: Colección a usar (por defecto la configurada en .env)
+
+    Returns:
+        ThreadingHTTPServer: Servidor listo para serve_forever()
+    """
+    manejador = type("Manejador", (ManejadorEmpleados,), {"repositorio": EmployeeRepository(collection)})
+    servidor = ThreadingHTTPServer((host, puerto), manejador)
+    servidor.daemon_threads = True
+    return servidor
+
+def _coleccion_simulada(scott):
+    """Colección de mongomock en proceso (sin servidor de MongoDB)"""
+    import mongomock
+    from db.indexes import asegurar_indices
+    from db.seed import sembrar_scott
+    from services.shared.departments import modo_normalizado, preparar_departamentos
+
+    collection = mongomock.MongoClient()[os.getenv("MONGO_DB", "empresa_db")][os.getenv("MONGO_COLLECTION", "rh")]
+    asegurar_indices(collection)
+    if modo_normalizado():
+        preparar_departamentos(collection)
+    if scott:
+        sembrar_scott(collection=collection)
+    return collection
+
+def main():
+    parser = argparse.ArgumentParser(description="API HTTP de empleados")
+    parser.add_argument("--host", default=os.getenv("API_HOST", "127.0.0.1"), help="Interfaz donde escuchar")
+    parser.add_argument("--puerto", type=int, default=int(os.getenv("API_PORT", "8000")), help="Puerto TCP")
+    parser.add_argument("--backend", choices=("mongodb", "mongomock"), default="mongodb", help="Servidor real o simulado en proceso")
+    parser.add_argument("--scott", action="store_true", help="Con --backend mongomock, cargar los datos SCOTT")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.backend == "mongomock":
+        try:
+            collection = _coleccion_simulada(args.scott)
+        except ImportError:
+            print("❌ El backend 'mongomock' requiere: pip install mongomock")
+            return 1
+    else:
+        collection = get_collection()
+        if collection is None:
+            print("❌ No se pudo conectar a la base de datos")
+            return 1
+        # Con varios procesos, las escrituras de los demás invalidan la caché de este
+        vigilante_cambios.iniciar(collection)
+
+    servidor = crear_servidor(args.host, args.puerto, collection)
+    print(f"🌐 API escuchando en http://{args.host}:{args.puerto} (Ctrl+C para detener)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        vigilante_cambios.detener()
+        close_connection()
+        print("\n👋 Servidor detenido")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
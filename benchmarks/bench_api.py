@@ -0,0 +1,169 @@
+"""
+Prueba de carga local de la API HTTP (api/server.py)
+Lanza peticiones concurrentes con una mezcla de lecturas y escrituras y reporta
+ops/s y latencias p50/p95/p99 por tipo de operación
+
+Uso (desde la raíz del proyecto, con el servidor corriendo):
+    python -m api.server --backend mongomock --scott
+    python -m benchmarks.bench_api --url http://127.0.0.1:8000 --peticiones 5000 --concurrencia 32
+"""
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from benchmarks.suite import percentil
+
+# Proporción de cada operación en la mezcla
+MEZCLA = (
+    ("obtener", 0.50),
+    ("listar", 0.20),
+    ("buscar", 0.15),
+    ("crear", 0.05),
+    ("actualizar", 0.07),
+    ("eliminar", 0.03),
+)
+
+EMPNO_PRUEBA_INICIAL = 900000000
+
+class ClienteAPI:
+    """Cliente HTTP con una conexión persistente por hilo"""
+
+    def __init__(self, url):
+        partes = urlsplit(url)
+        self.host = partes.hostname
+        self.puerto = partes.port or 80
+        self._local = threading.local()
+
+    def _conexion(self):
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None:
+            conexion = http.client.HTTPConnection(self.host, self.puerto, timeout=30)
+            self._local.conexion = conexion
+        return conexion
+
+    def peticion(self, metodo, ruta, cuerpo=None):
+        """
+        Envía una petición y lee la respuesta completa
+
+        Returns:
+            tuple: (código de estado, cuerpo decodificado o None)
+        """
+        datos = None if cuerpo is None else json.dumps(cuerpo).encode("utf-8")
+        encabezados = {"Content-Type": "application/json"} if datos is not None else {}
+        conexion = self._conexion()
+        try:
+            conexion.request(metodo, ruta, body=datos, headers=encabezados)
+            respuesta = conexion.getresponse()
+            contenido = respuesta.read()
+        except (http.client.HTTPException, OSError):
+            # Reintentar una vez con una conexión nueva (el servidor pudo cerrarla)
+            conexion.close()
+            self._local.conexion = None
+            conexion = self._conexion()
+            conexion.request(metodo, ruta, body=datos, headers=encabezados)
+            respuesta = conexion.getresponse()
+            contenido = respuesta.read()
+        return respuesta.status, (json.loads(contenido) if contenido else None)
+
+def preparar(cliente):
+    """Obtiene los empno existentes y los nombres para las búsquedas"""
+    estado, pagina = cliente.peticion("GET", "/empleados?limite=1000")
+    if estado != 200:
+        raise RuntimeError(f"La API respondió {estado} al listar empleados")
+    empleados = pagina["empleados"]
+    if not empleados:
+        raise RuntimeError("No hay empleados; carga datos antes (por ejemplo: --scott o python -m db.seed)")
+    return [e["empno"] for e in empleados], [e["ename"][:3] for e in empleados]
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga de la API HTTP")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="URL base de la API")
+    parser.add_argument("--peticiones", type=int, default=5000, help="Total de peticiones")
+    parser.add_argument("--concurrencia", type=int, default=32, help="Peticiones en vuelo")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla de la mezcla de operaciones")
+    args = parser.parse_args()
+
+    cliente = ClienteAPI(args.url)
+    try:
+        empnos, nombres = preparar(cliente)
+    except (OSError, RuntimeError) as e:
+        print(f"❌ No se pudo preparar la prueba: {e}")
+        return 1
+
+    rng = random.Random(args.semilla)
+    operaciones = rng.choices([op for op, _ in MEZCLA], weights=[peso for _, peso in MEZCLA], k=args.peticiones)
+    creados = []
+    siguiente_empno = iter(range(EMPNO_PRUEBA_INICIAL, EMPNO_PRUEBA_INICIAL + args.peticiones))
+    lock = threading.Lock()
+
+    def ejecutar(operacion):
+        with lock:
+            # Las escrituras se hacen solo sobre empleados creados por la propia prueba
+            if operacion in ("actualizar", "eliminar") and not creados:
+                operacion = "crear"
+            if operacion == "crear":
+                empno = next(siguiente_empno)
+            elif operacion == "actualizar":
+                # Se retira mientras está en vuelo para que nadie lo elimine a la vez
+                empno = creados.pop(rng.randrange(len(creados)))
+            elif operacion == "eliminar":
+                empno = creados.pop()
+
+        if operacion == "obtener":
+            ruta, metodo, cuerpo = f"/empleados/{rng.choice(empnos)}", "GET", None
+        elif operacion == "listar":
+            ruta, metodo, cuerpo = f"/empleados?despues_de={rng.choice(empnos)}&limite=20", "GET", None
+        elif operacion == "buscar":
+            ruta, metodo, cuerpo = f"/empleados/buscar?criterio=nombre&valor={rng.choice(nombres)}&limite=50", "GET", None
+        elif operacion == "crear":
+            ruta, metodo = "/empleados", "POST"
+            cuerpo = {"empno": empno, "ename": "CARGA", "job": "CLERK", "sal": 1000, "deptno": 10}
+        elif operacion == "actualizar":
+            ruta, metodo, cuerpo = f"/empleados/{empno}", "PATCH", {"sal": rng.randint(800, 5000)}
+        else:
+            ruta, metodo, cuerpo = f"/empleados/{empno}", "DELETE", None
+
+        inicio = time.perf_counter()
+        estado, _ = cliente.peticion(metodo, ruta, cuerpo)
+        duracion = (time.perf_counter() - inicio) * 1000
+
+        if (operacion == "crear" and estado == 201) or operacion == "actualizar":
+            with lock:
+                creados.append(empno)
+        return operacion, duracion, estado < 400
+
+    tiempos = defaultdict(list)
+    errores = defaultdict(int)
+    inicio_total = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrencia) as executor:
+        for operacion, duracion, exito in executor.map(ejecutar, operaciones):
+            tiempos[operacion].append(duracion)
+            if not exito:
+                errores[operacion] += 1
+    total = time.perf_counter() - inicio_total
+
+    # Limpiar los empleados creados por la prueba
+    for empno in creados:
+        cliente.peticion("DELETE", f"/empleados/{empno}")
+
+    print(f"\n{'OPERACIÓN':<12} {'PETIC.':>7} {'ERRORES':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    print("-" * 60)
+    for operacion, _ in MEZCLA:
+        muestras = sorted(tiempos.get(operacion, []))
+        if not muestras:
+            continue
+        print(
+            f"{operacion:<12} {len(muestras):>7} {errores[operacion]:>8} "
+            f"{percentil(muestras, 50):>9.2f} {percentil(muestras, 95):>9.2f} {percentil(muestras, 99):>9.2f}"
+        )
+    print("-" * 60)
+    print(f"⚡ {args.peticiones / total:,.0f} peticiones/s con concurrencia {args.concurrencia} ({total:.1f}s)")
+    return 1 if sum(errores.values()) else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
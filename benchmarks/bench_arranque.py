@@ -0,0 +1,79 @@
+"""
+Benchmark de arranque: tiempo desde que se lanza main.py hasta que aparece el menú
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.bench_arranque --repeticiones 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+RAIZ_PROYECTO = Path(__file__).resolve().parent.parent
+MARCA_MENU = "MENÚ CRUD EMPLEADOS"
+
+def medir_arranque(timeout):
+    """
+    Lanza main.py, espera a que se imprima el menú y sale con la opción 0
+
+    Returns:
+        float: Segundos hasta ver el menú o None si no apareció
+    """
+    entorno = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8", TERM=os.getenv("TERM", "dumb"))
+    inicio = time.perf_counter()
+    proceso = subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=RAIZ_PROYECTO,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=entorno,
+        text=True,
+        encoding="utf-8",
+    )
+
+    duracion = None
+    try:
+        for linea in proceso.stdout:
+            if MARCA_MENU in linea:
+                duracion = time.perf_counter() - inicio
+                break
+            if time.perf_counter() - inicio > timeout:
+                break
+            if "Presiona ENTER para salir" in linea:
+                break  # Sin conexión a MongoDB: no hay menú
+    finally:
+        try:
+            proceso.communicate("0\n\n", timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proceso.kill()
+            proceso.communicate()
+
+    return duracion
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de tiempo hasta el menú")
+    parser.add_argument("--repeticiones", type=int, default=10, help="Arranques a medir")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Segundos máximos por arranque")
+    args = parser.parse_args()
+
+    tiempos = []
+    for i in range(args.repeticiones):
+        duracion = medir_arranque(args.timeout)
+        if duracion is None:
+            print("❌ El menú no apareció (¿MongoDB está corriendo?)")
+            return 1
+        tiempos.append(duracion * 1000)
+        print(f"   Arranque {i + 1}: {tiempos[-1]:.0f} ms")
+
+    print(f"\n⏱️ Tiempo hasta el menú ({args.repeticiones} arranques):")
+    print(f"   mínimo: {min(tiempos):.0f} ms")
+    print(f"   p50:    {statistics.median(tiempos):.0f} ms")
+    print(f"   máximo: {max(tiempos):.0f} ms")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""
+Benchmark de rendimiento: servicios síncronos (PyMongo) vs API asíncrona (Motor)
+
+Uso (desde la raíz del proyecto, con MongoDB corriendo):
+    python -m benchmarks.bench_async_vs_sync --n 10000 --operaciones 5000 --concurrencia 64
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+from db.mongo_config import get_database, close_connection
+from db.async_config import async_connection, ejecutar, close_async_connection
+from services.shared.projections import PROYECCION_DETALLE
+
+COLECCION_BENCH = "bench_async_vs_sync"
+
+def preparar_coleccion(db, n):
+    """Crea la colección de prueba con n empleados indexados por empno"""
+    collection = db[COLECCION_BENCH]
+    collection.drop()
+    collection.insert_many([
+        {
+            "empno": empno, "ename": f"EMP{empno}", "job": "CLERK", "sal": 1000,
+            "departamento": {"deptno": 10, "dname": "ACCOUNTING", "loc": "NEW YORK"},
+        }
+        for empno in range(1, n + 1)
+    ])
+    collection.create_index("empno", unique=True)
+    return collection
+
+def medir_sync(collection, empnos):
+    """Búsquedas por empno una tras otra, como lo hacen los servicios de consola"""
+    inicio = time.perf_counter()
+    for empno in empnos:
+        collection.find_one({"empno": empno}, PROYECCION_DETALLE)
+    return time.perf_counter() - inicio
+
+async def medir_async(collection, empnos, concurrencia):
+    """Búsquedas por empno con varias operaciones en vuelo a la vez"""
+    semaforo = asyncio.Semaphore(concurrencia)
+
+    async def buscar(empno):
+        async with semaforo:
+            await collection.find_one({"empno": empno}, PROYECCION_DETALLE)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(buscar(empno) for empno in empnos))
+    return time.perf_counter() - inicio
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async")
+    parser.add_argument("--n", type=int, default=10000, help="Empleados en la colección")
+    parser.add_argument("--operaciones", type=int, default=5000, help="Búsquedas por empno")
+    parser.add_argument("--concurrencia", type=int, default=64, help="Operaciones async en vuelo")
+    args = parser.parse_args()
+
+    db = get_database()
+    if db is None:
+        print("❌ No se pudo conectar a la base de datos")
+        return 1
+
+    collection = preparar_coleccion(db, args.n)
+    empnos = [random.randint(1, args.n) for _ in range(args.operaciones)]
+
+    cliente_async = async_connection.get_client()
+    collection_async = cliente_async[os.getenv("MONGO_DB", "empresa_db")][COLECCION_BENCH]
+
+    try:
+        segundos_sync = medir_sync(collection, empnos)
+        segundos_async = ejecutar(medir_async(collection_async, empnos, args.concurrencia))
+    finally:
+        collection.drop()
+        close_async_connection()
+        close_connection()
+
+    print(f"\n{'MODO':<28} {'SEGUNDOS':>10} {'OPS/S':>12}")
+    print("-" * 52)
+    print(f"{'sync (secuencial)':<28} {segundos_sync:>10.2f} {args.operaciones / segundos_sync:>12,.0f}")
+    print(
+        f"{f'async (concurrencia {args.concurrencia})':<28} {segundos_async:>10.2f} "
+        f"{args.operaciones / segundos_async:>12,.0f}"
+    )
+    print(f"\n⚡ Aceleración: {segundos_sync / segundos_async:.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
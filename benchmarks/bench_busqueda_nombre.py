@@ -0,0 +1,118 @@
+"""
+Benchmark de la búsqueda por nombre: regex sin anclar vs prefijo indexado vs índice de texto
+
+Uso (desde la raíz del proyecto, con MongoDB corriendo):
+    python -m benchmarks.bench_busqueda_nombre --n 200000 --repeticiones 20
+"""
+import argparse
+import random
+import statistics
+import time
+from pymongo import ASCENDING, TEXT
+from db.mongo_config import get_database, close_connection
+from models.employee import normalizar_nombre
+from services.search.queries import filtro_por_nombre, orden_por_nombre
+from services.shared.projections import PROYECCION_LISTA
+
+COLECCION_BENCH = "bench_busqueda_nombre"
+SILABAS = ["AL", "BE", "CA", "DO", "ER", "FI", "GA", "HO", "IN", "JU", "KE", "LO",
+           "MA", "NE", "OR", "PA", "RI", "SA", "TO", "VE"]
+
+def generar_nombre(rng):
+    """Genera un nombre sintético de 2 a 5 sílabas (máx 10 caracteres)"""
+    return "".join(rng.choice(SILABAS) for _ in range(rng.randint(2, 5)))
+
+def preparar_coleccion(db, n, semilla):
+    """Crea la colección de prueba con n empleados y los índices de cada motor"""
+    collection = db[COLECCION_BENCH]
+    collection.drop()
+
+    rng = random.Random(semilla)
+    lote = []
+    for empno in range(1, n + 1):
+        ename = generar_nombre(rng)
+        lote.append({
+            "empno": empno,
+            "ename": ename,
+            "ename_search": normalizar_nombre(ename),
+            "job": "CLERK",
+            "sal": 1000,
+            "departamento": {"deptno": 10, "dname": "ACCOUNTING", "loc": "NEW YORK"},
+        })
+        if len(lote) == 10000:
+            collection.insert_many(lote, ordered=False)
+            lote = []
+    if lote:
+        collection.insert_many(lote, ordered=False)
+
+    collection.create_index([("ename_search", ASCENDING)])
+    collection.create_index([("ename", TEXT)])
+    return collection
+
+def medir(collection, motor, termino, repeticiones):
+    """
+    Mide una búsqueda con el motor indicado
+
+    Returns:
+        dict: Latencias en ms, resultados y documentos examinados
+    """
+    filtro = filtro_por_nombre(termino, motor)
+    orden = orden_por_nombre(motor)
+
+    tiempos = []
+    resultados = 0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultados = len(list(collection.find(filtro, PROYECCION_LISTA).sort(orden)))
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+
+    plan = collection.find(filtro, PROYECCION_LISTA).sort(orden).explain()
+    examinados = plan.get("executionStats", {}).get("totalDocsExamined", "N/A")
+
+    return {
+        "p50_ms": statistics.median(tiempos),
+        "max_ms": max(tiempos),
+        "resultados": resultados,
+        "examinados": examinados,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de búsqueda por nombre")
+    parser.add_argument("--n", type=int, default=200000, help="Número de empleados")
+    parser.add_argument("--repeticiones", type=int, default=20, help="Repeticiones por consulta")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla de datos")
+    args = parser.parse_args()
+
+    db = get_database()
+    if db is None:
+        print("❌ No se pudo conectar a la base de datos")
+        return 1
+
+    print(f"🧪 Preparando {args.n:,} empleados en '{COLECCION_BENCH}'...")
+    collection = preparar_coleccion(db, args.n, args.semilla)
+
+    # Términos: un nombre completo (válido para los tres motores) y un prefijo
+    nombre = collection.find_one({}, {"ename": 1})["ename"]
+    casos = [
+        ("nombre completo", nombre, ("regex", "prefijo", "texto")),
+        ("prefijo", nombre[:3], ("regex", "prefijo")),
+        ("caracteres especiales", "A.*(B+)+$", ("regex", "prefijo")),
+    ]
+
+    print(f"\n{'CASO':<22} {'MOTOR':<8} {'p50 ms':>9} {'máx ms':>9} {'RESULT.':>8} {'EXAMIN.':>9}")
+    print("-" * 70)
+    try:
+        for caso, termino, motores in casos:
+            for motor in motores:
+                r = medir(collection, motor, termino, args.repeticiones)
+                print(
+                    f"{caso:<22} {motor:<8} {r['p50_ms']:>9.2f} {r['max_ms']:>9.2f} "
+                    f"{r['resultados']:>8} {r['examinados']:>9}"
+                )
+    finally:
+        collection.drop()
+        close_connection()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""
+Benchmark del almacenamiento de departamentos: embebido vs normalizado
+Mide el tamaño de los documentos, la amplificación de escritura al renombrar un
+departamento y el costo de resolver el departamento en lecturas y reportes
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.bench_departamentos --n 100000
+    python -m benchmarks.bench_departamentos --backend mongomock --n 2000
+"""
+import argparse
+import random
+import time
+import bson
+from pymongo.errors import OperationFailure
+from benchmarks.suite import medir, _conectar
+from db.indexes import asegurar_indices
+from db.migrate_departments import normalizar
+from db.mongo_config import close_connection
+from db.seed import generar_empleados, EMPNO_INICIAL, TAMANO_LOTE_SEMILLA
+from services.shared.constants import COLECCION_DEPARTAMENTOS
+from services.shared.departments import ETAPAS_LOOKUP, completar_departamento
+from services.shared.projections import PROYECCION_DETALLE
+
+BASE_BENCH = "bench_departamentos"
+DEPARTAMENTO_RENOMBRADO = 20
+
+def llenar(collection, n, semilla):
+    """Inserta n empleados sintéticos con el departamento embebido"""
+    collection.drop()
+    asegurar_indices(collection)
+    for desde in range(0, n, TAMANO_LOTE_SEMILLA):
+        lote = list(generar_empleados(min(TAMANO_LOTE_SEMILLA, n - desde), semilla, desde=desde))
+        collection.insert_many(lote, ordered=False)
+
+def tamano(collection):
+    """
+    Tamaño BSON de los documentos y, con un servidor real, las estadísticas de almacenamiento
+
+    Returns:
+        dict: {"documentos", "bytes", "promedio", "almacenamiento", "indices"}
+    """
+    total = 0
+    documentos = 0
+    for documento in collection.find():
+        total += len(bson.encode(documento))
+        documentos += 1
+    resultado = {"documentos": documentos, "bytes": total, "promedio": total / documentos if documentos else 0}
+    try:
+        estadisticas = collection.database.command({"collStats": collection.name})
+        resultado["almacenamiento"] = estadisticas.get("storageSize")
+        resultado["indices"] = estadisticas.get("totalIndexSize")
+    except (OperationFailure, NotImplementedError, AttributeError):
+        pass  # mongomock no implementa collStats
+    return resultado
+
+def _cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Departamentos embebidos vs normalizados")
+    parser.add_argument("--n", type=int, default=100000, help="Empleados en cada colección")
+    parser.add_argument("--repeticiones", type=int, default=500, help="Lecturas por empno a medir")
+    parser.add_argument("--repeticiones-reportes", type=int, default=5, help="Repeticiones de cada reporte")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla de los datos")
+    parser.add_argument("--backend", choices=("mongodb", "mongomock"), default="mongodb", help="Servidor real o simulado en proceso")
+    args = parser.parse_args()
+
+    db = _conectar(args.backend)
+    if db is None:
+        print("❌ No se pudo conectar a la base de datos")
+        return 1
+    # Base propia: la migración crea su colección de departamentos junto a la de empleados
+    db = db.client[BASE_BENCH]
+
+    try:
+        print(f"\n🧪 Preparando {args.n:,} empleados en cada modo...")
+        embebido, normalizado = db["empleados_embebido"], db["empleados_normalizado"]
+        llenar(embebido, args.n, args.semilla)
+        llenar(normalizado, args.n, args.semilla)
+        db[COLECCION_DEPARTAMENTOS].drop()
+        migracion, ms_migracion = _cronometrar(lambda: normalizar(normalizado))
+
+        tamanos = {"embebido": tamano(embebido), "normalizado": tamano(normalizado)}
+        print(f"\n{'MODO':<12} {'DOCS':>9} {'BYTES/DOC':>10} {'BYTES BSON':>13} {'ALMACEN.':>12} {'ÍNDICES':>12}")
+        for modo, t in tamanos.items():
+            print(
+                f"{modo:<12} {t['documentos']:>9,} {t['promedio']:>10.1f} {t['bytes']:>13,} "
+                f"{t.get('almacenamiento') or '—':>12} {t.get('indices') or '—':>12}"
+            )
+        ahorro = 1 - tamanos["normalizado"]["bytes"] / tamanos["embebido"]["bytes"]
+        print(f"💾 El modo normalizado ocupa {ahorro:.1%} menos en documentos")
+        print(f"🔁 Migración a normalizado: {migracion['empleados']:,} empleados en {ms_migracion:.0f} ms")
+
+        # Amplificación de escritura al renombrar un departamento
+        resultado_e, ms_e = _cronometrar(lambda: embebido.update_many(
+            {"departamento.deptno": DEPARTAMENTO_RENOMBRADO}, {"$set": {"departamento.dname": "INVESTIGACION"}}
+        ))
+        resultado_n, ms_n = _cronometrar(lambda: db[COLECCION_DEPARTAMENTOS].update_one(
+            {"deptno": DEPARTAMENTO_RENOMBRADO}, {"$set": {"dname": "INVESTIGACION"}}
+        ))
+        reescritos_e = resultado_e.modified_count * tamanos["embebido"]["promedio"]
+        print(f"\n✏️ Renombrar el departamento {DEPARTAMENTO_RENOMBRADO}:")
+        print(f"   embebido:    {resultado_e.modified_count:>9,} documentos (~{reescritos_e:,.0f} bytes) en {ms_e:.1f} ms")
+        print(f"   normalizado: {resultado_n.modified_count:>9,} documento en {ms_n:.1f} ms")
+
+        # Lecturas: resolver el departamento con la caché del cliente o con $lookup
+        departamentos = {d["deptno"]: d for d in db[COLECCION_DEPARTAMENTOS].find({}, {"_id": 0})}
+        rng = random.Random(args.semilla)
+        empnos = [EMPNO_INICIAL + rng.randrange(args.n) for _ in range(args.repeticiones)]
+        reportes = args.repeticiones_reportes
+        lecturas = [
+            ("obtener embebido", lambda e: embebido.find_one({"empno": e}, PROYECCION_DETALLE), empnos),
+            ("obtener + caché", lambda e: completar_departamento(
+                normalizado.find_one({"empno": e}, PROYECCION_DETALLE), departamentos), empnos),
+            ("obtener + $lookup", lambda e: list(normalizado.aggregate(
+                [{"$match": {"empno": e}}] + ETAPAS_LOOKUP + [{"$project": PROYECCION_DETALLE}])), empnos),
+            ("reporte embebido", lambda _: list(embebido.aggregate([
+                {"$group": {"_id": "$departamento.dname", "empleados": {"$sum": 1}}}])), range(reportes)),
+            ("reporte $group+$lookup", lambda _: list(normalizado.aggregate([
+                {"$group": {"_id": "$departamento.deptno", "empleados": {"$sum": 1}}},
+                {"$lookup": {"from": COLECCION_DEPARTAMENTOS, "localField": "_id", "foreignField": "deptno", "as": "d"}},
+            ])), range(reportes)),
+        ]
+        print(f"\n{'LECTURA':<24} {'REPET.':>6} {'OPS/S':>11} {'p50 ms':>9} {'p95 ms':>9}")
+        for nombre, operacion, argumentos in lecturas:
+            r = medir(operacion, list(argumentos))
+            print(f"{nombre:<24} {r['repeticiones']:>6} {r['ops_s']:>11,.0f} {r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f}")
+    finally:
+        db.client.drop_database(BASE_BENCH)
+        close_connection()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
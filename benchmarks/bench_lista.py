@@ -0,0 +1,113 @@
+"""
+Benchmark de la decodificación en los listados: diccionarios vs RawBSONDocument
+Simula los lotes que entrega el cursor (bytes BSON con la proyección del listado)
+y los decodifica como lo hace el driver; luego convierte en Empleado e imprime
+las filas con el mismo formato del listado (descartadas). Mide tiempo de CPU y memoria asignada (pico de
+tracemalloc) para distintas fracciones de filas mostradas. No necesita servidor
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.bench_lista --n 200000
+    python -m benchmarks.bench_lista --n 200000 --campos-extra 40   # documentos anchos
+"""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+import bson
+from db.seed import generar_empleados
+from models.employee import Empleado
+from services.read.service import _fila
+from services.shared.constants import TAMANO_LOTE_CURSOR
+from services.shared.raw_documents import OPCIONES_PEREZOSAS
+
+def lotes_bson(n, semilla, campos_extra, tamano_lote):
+    """
+    Codifica n empleados en lotes como los del cursor
+
+    Args:
+        campos_extra: Campos adicionales por documento (simula documentos anchos sin proyección)
+
+    Returns:
+        list: bytes con los documentos concatenados de cada lote
+    """
+    lotes, actual = [], []
+    for i, documento in enumerate(generar_empleados(n, semilla)):
+        documento.pop("ename_search", None)
+        for campo in range(campos_extra):
+            documento[f"extra_{campo}"] = f"valor {i} {campo}"
+        actual.append(bson.encode(documento))
+        if len(actual) == tamano_lote:
+            lotes.append(b"".join(actual))
+            actual = []
+    if actual:
+        lotes.append(b"".join(actual))
+    return lotes
+
+def listar(lotes, opciones, cada):
+    """
+    Decodifica los lotes y muestra una de cada `cada` filas
+
+    Returns:
+        int: Filas mostradas
+    """
+    mostradas = 0
+    convertir = Empleado.from_bson if opciones else Empleado.from_dict
+    # Las filas se descartan: solo se mide decodificar, convertir y dar formato
+    with open(os.devnull, "w", encoding="utf-8") as salida:
+        for lote in lotes:
+            documentos = bson.decode_all(lote, opciones) if opciones else bson.decode_all(lote)
+            for i, documento in enumerate(documentos):
+                if i % cada == 0:
+                    salida.write(_fila(convertir(documento)))
+                    mostradas += 1
+    return mostradas
+
+def medir(lotes, opciones, cada, repeticiones):
+    """
+    Returns:
+        tuple: (segundos de CPU de la ejecución más rápida, pico de memoria en bytes)
+    """
+    cpu = None
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.process_time()
+        listar(lotes, opciones, cada)
+        segundos = time.process_time() - inicio
+        cpu = segundos if cpu is None else min(cpu, segundos)
+
+    gc.collect()
+    tracemalloc.start()
+    listar(lotes, opciones, cada)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, pico
+
+def main():
+    parser = argparse.ArgumentParser(description="Listados: decodificación completa vs diferida")
+    parser.add_argument("--n", type=int, default=200000, help="Empleados a recorrer")
+    parser.add_argument("--campos-extra", type=int, default=0, help="Campos adicionales por documento")
+    parser.add_argument("--mostrar", default="1,5,20", help="Mostrar una de cada N filas (lista separada por comas)")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Ejecuciones por caso (se toma la más rápida)")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla de los datos")
+    args = parser.parse_args()
+
+    print(f"\n🧪 Codificando {args.n:,} empleados ({args.campos_extra} campos extra)...")
+    lotes = lotes_bson(args.n, args.semilla, args.campos_extra, TAMANO_LOTE_CURSOR)
+    tamano = sum(len(lote) for lote in lotes)
+    print(f"   {tamano / 1024 / 1024:,.1f} MB de BSON ({tamano / args.n:.0f} bytes por documento)")
+
+    print(f"\n{'FILAS':<10} {'MODO':<10} {'CPU':>8} {'DOCS/S':>12} {'PICO MEM.':>11}")
+    print("-" * 55)
+    for cada in (int(valor) for valor in args.mostrar.split(",")):
+        for modo, opciones in (("dict", None), ("perezoso", OPCIONES_PEREZOSAS)):
+            cpu, pico = medir(lotes, opciones, cada, args.repeticiones)
+            print(
+                f"{'1/' + str(cada):<10} {modo:<10} {cpu:>7.2f}s {args.n / cpu if cpu else 0:>12,.0f} "
+                f"{pico / 1024:>9,.0f}KB"
+            )
+    print("-" * 55)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""
+Benchmark del modelo de empleados: memoria retenida y tiempo de decodificación
+Compara tener los resultados como diccionarios, convertirlos uno por uno con
+Empleado.from_dict y convertirlos por lote con Empleado.from_documents (objetos con
+__slots__ y departamentos compartidos). No necesita servidor: los documentos se
+codifican a BSON en memoria, igual que los recibe el driver
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.bench_modelo --n 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+import bson
+from bson.raw_bson import RawBSONDocument
+from db.seed import generar_empleados
+from models.employee import Empleado
+
+def codificar(n, semilla):
+    """
+    Codifica n empleados sintéticos como los entrega el servidor
+
+    Returns:
+        list: bytes BSON de cada documento (con su _id)
+    """
+    return [bson.encode({"_id": bson.ObjectId(), **documento}) for documento in generar_empleados(n, semilla)]
+
+def como_diccionarios(datos):
+    """Decodificación normal del driver: un diccionario por documento"""
+    return [bson.decode(documento) for documento in datos]
+
+def uno_por_uno(datos):
+    """Diccionarios y luego from_dict por documento (el camino anterior)"""
+    return [Empleado.from_dict(documento) for documento in como_diccionarios(datos)]
+
+def por_lote(datos):
+    """from_documents sobre los bytes: sin lista intermedia de diccionarios"""
+    return Empleado.from_documents(datos)
+
+def sin_decodificar(datos):
+    """RawBSONDocument: no decodifica nada hasta que se lee un campo"""
+    return [RawBSONDocument(documento) for documento in datos]
+
+ESTRATEGIAS = {
+    "dict": como_diccionarios,
+    "from_dict": uno_por_uno,
+    "from_documents": por_lote,
+    "raw_bson": sin_decodificar,
+}
+
+def cronometrar(funcion, datos, repeticiones):
+    """
+    Mejor tiempo de varias ejecuciones (sin tracemalloc, que distorsiona el tiempo)
+
+    Returns:
+        float: Segundos de la ejecución más rápida
+    """
+    mejor = None
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter()
+        resultado = funcion(datos)
+        segundos = time.perf_counter() - inicio
+        del resultado
+        mejor = segundos if mejor is None else min(mejor, segundos)
+    return mejor
+
+def memoria_retenida(funcion, datos):
+    """
+    Bytes que siguen ocupados por el resultado después de construirlo
+
+    Returns:
+        int: Memoria retenida en bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    resultado = funcion(datos)
+    gc.collect()
+    retenida, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return retenida
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria y decodificación: diccionarios vs modelo con __slots__")
+    parser.add_argument("--n", type=int, default=1000000, help="Empleados a decodificar")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Ejecuciones por estrategia (se toma la más rápida)")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla de los datos")
+    args = parser.parse_args()
+
+    print(f"\n🧪 Codificando {args.n:,} empleados a BSON...")
+    datos = codificar(args.n, args.semilla)
+    tamano = sum(len(documento) for documento in datos)
+    print(f"   {tamano / 1024 / 1024:,.1f} MB de BSON ({tamano / args.n:.0f} bytes por documento)")
+
+    print(f"\n{'ESTRATEGIA':<16} {'TIEMPO':>9} {'DOCS/S':>12} {'MEMORIA':>11} {'BYTES/EMP':>10}")
+    print("-" * 62)
+    for nombre, funcion in ESTRATEGIAS.items():
+        segundos = cronometrar(funcion, datos, args.repeticiones)
+        retenida = memoria_retenida(funcion, datos)
+        print(
+            f"{nombre:<16} {segundos:>8.2f}s {args.n / segundos:>12,.0f} "
+            f"{retenida / 1024 / 1024:>9,.1f}MB {retenida / args.n:>10,.0f}"
+        )
+    print("-" * 62)
+    print("💡 raw_bson no decodifica: cada lectura de un campo vuelve a recorrer los bytes")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
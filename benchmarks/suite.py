@@ -0,0 +1,293 @@
+"""
+Suite de benchmarks de todas las rutas CRUD y de búsqueda
+No requiere terminal: ejecuta las mismas consultas que los servicios interactivos
+y guarda los resultados en JSON para comparar corridas y detectar regresiones
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.suite --tamanos 1000,10000,100000 --salida resultados.json
+    python -m benchmarks.suite --backend mongomock --tamanos 1000
+    python -m benchmarks.suite --salida nueva.json --comparar base.json --tolerancia 0.2
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import platform
+import random
+import time
+import pymongo
+from db.indexes import asegurar_indices
+from db.mongo_config import get_database, close_connection
+from db.seed import sembrar, generar_empleado
+from services.read.pagination import Paginador
+from services.read.service import _imprimir_pagina
+from services.search.queries import (
+    filtro_por_nombre, orden_por_nombre, filtro_por_puesto, filtro_por_departamento
+)
+from services.shared.cache import cache_empleados, obtener_empleado
+from services.shared.constants import TAMANO_PAGINA, PUESTOS_VALIDOS, DEPARTAMENTOS_PREDEFINIDOS
+from services.shared.projections import PROYECCION_LISTA, PROYECCION_DETALLE
+
+COLECCION_BENCH = "bench_suite"
+PERCENTILES = (50, 95, 99)
+
+def percentil(tiempos_ordenados, p):
+    """Percentil por rango más cercano sobre una lista ya ordenada"""
+    if not tiempos_ordenados:
+        return 0.0
+    indice = max(0, min(len(tiempos_ordenados) - 1, round(p / 100 * len(tiempos_ordenados) + 0.5) - 1))
+    return tiempos_ordenados[indice]
+
+def medir(operacion, argumentos):
+    """
+    Ejecuta la operación una vez por cada argumento y mide cada llamada
+
+    Args:
+        operacion: Función que recibe un argumento
+        argumentos: Lista de argumentos (uno por repetición)
+
+    Returns:
+        dict: Repeticiones, ops/s y latencias p50/p95/p99 en ms
+    """
+    tiempos = []
+    inicio_total = time.perf_counter()
+    for argumento in argumentos:
+        inicio = time.perf_counter()
+        operacion(argumento)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    total = time.perf_counter() - inicio_total
+
+    tiempos.sort()
+    resultado = {"repeticiones": len(tiempos), "ops_s": len(tiempos) / total if total else 0.0}
+    for p in PERCENTILES:
+        resultado[f"p{p}_ms"] = percentil(tiempos, p)
+    return resultado
+
+def preparar_coleccion(db, n, semilla, hilos):
+    """Crea la colección de prueba con n empleados sintéticos y los índices requeridos"""
+    collection = db[COLECCION_BENCH]
+    collection.drop()
+    asegurar_indices(collection)
+    sembrar(n, semilla=semilla, hilos=hilos, collection=collection)
+    return collection
+
+def operaciones(collection, n, semilla, lote):
+    """
+    Define las operaciones a medir con las mismas consultas que usan los servicios
+
+    Returns:
+        list: Tuplas (nombre, función, generador de argumentos)
+    """
+    # Los empno nuevos quedan después de los sembrados; eliminar usa los mismos
+    siguiente_empno = [n]
+    creados = []
+    empno_minimo = generar_empleado(0, semilla)["empno"]
+    nombres = [collection.find_one({"empno": empno_minimo + i}, {"ename": 1})["ename"] for i in range(min(n, 50))]
+    puestos = sorted(PUESTOS_VALIDOS)
+    departamentos = [dept["dname"] for dept in DEPARTAMENTOS_PREDEFINIDOS.values()]
+
+    def _nuevo_empleado():
+        empleado = generar_empleado(siguiente_empno[0], semilla + 1)
+        siguiente_empno[0] += 1
+        return empleado
+
+    def crear(_):
+        empleado = _nuevo_empleado()
+        collection.insert_one(empleado)
+        creados.append(empleado["empno"])
+
+    def crear_lote(_):
+        empleados = [_nuevo_empleado() for _ in range(lote)]
+        collection.insert_many(empleados, ordered=False)
+        creados.extend(empleado["empno"] for empleado in empleados)
+
+    def buscar_id(empno):
+        # Equivale a una consulta sin acierto en caché
+        collection.find_one({"empno": empno}, PROYECCION_DETALLE)
+
+    def buscar_id_cache(empno):
+        obtener_empleado(collection, empno)
+
+    def listar(despues_de):
+        paginador = Paginador(TAMANO_PAGINA)
+        paginador.despues_de = despues_de
+        with contextlib.redirect_stdout(io.StringIO()):
+            _imprimir_pagina(collection, paginador)
+
+    def buscar_nombre(nombre):
+        list(collection.find(filtro_por_nombre(nombre), PROYECCION_LISTA).sort(orden_por_nombre()))
+
+    def buscar_puesto(puesto):
+        list(collection.find(filtro_por_puesto(puesto), PROYECCION_LISTA))
+
+    def buscar_departamento(dname):
+        list(collection.find(filtro_por_departamento(dname), PROYECCION_LISTA))
+
+    def actualizar(empno):
+        empleado = generar_empleado(empno - empno_minimo, semilla + 2)
+        collection.update_one({"empno": empno}, {"$set": {
+            "ename": empleado["ename"],
+            "ename_search": empleado["ename_search"],
+            "job": empleado["job"],
+            "sal": empleado["sal"],
+            "departamento": empleado["departamento"],
+        }})
+        cache_empleados.invalidar(empno)
+
+    def eliminar(empno):
+        collection.delete_one({"empno": empno})
+        cache_empleados.invalidar(empno)
+
+    rng = random.Random(semilla)
+    empno_aleatorio = lambda repeticiones: [empno_minimo + rng.randrange(n) for _ in range(repeticiones)]
+    return [
+        ("crear", crear, lambda r: range(r)),
+        ("crear_lote", crear_lote, lambda r: range(max(1, r // lote))),
+        ("buscar_id", buscar_id, empno_aleatorio),
+        ("buscar_id_cache", buscar_id_cache, lambda r: [empno_minimo + rng.randrange(min(n, 100)) for _ in range(r)]),
+        ("listar", listar, lambda r: [None] + [empno_minimo + rng.randrange(n) for _ in range(r - 1)]),
+        ("buscar_nombre", buscar_nombre, lambda r: [rng.choice(nombres)[:3] for _ in range(r)]),
+        ("buscar_puesto", buscar_puesto, lambda r: [rng.choice(puestos) for _ in range(r)]),
+        ("buscar_departamento", buscar_departamento, lambda r: [rng.choice(departamentos) for _ in range(r)]),
+        ("actualizar", actualizar, empno_aleatorio),
+        ("eliminar", eliminar, lambda r: list(creados)),
+    ]
+
+def ejecutar_tamano(db, n, args):
+    """Prepara la colección de tamaño n y mide todas las operaciones"""
+    print(f"\n🧪 Preparando {n:,} empleados en '{COLECCION_BENCH}'...")
+    collection = preparar_coleccion(db, n, args.semilla, args.hilos)
+    cache_empleados.limpiar()
+
+    resultados = []
+    try:
+        for nombre, operacion, argumentos in operaciones(collection, n, args.semilla, args.lote):
+            # Las búsquedas de listas completas son más costosas; se acotan sus repeticiones
+            repeticiones = args.repeticiones_listas if nombre in ("buscar_puesto", "buscar_departamento") else args.repeticiones
+            resultado = medir(operacion, argumentos(repeticiones))
+            resultado.update({"tamano": n, "operacion": nombre})
+            resultados.append(resultado)
+            _imprimir_resultado(resultado)
+    finally:
+        collection.drop()
+    return resultados
+
+def _imprimir_resultado(r):
+    """Imprime una fila de la tabla de resultados"""
+    print(
+        f"{r['tamano']:>10,} {r['operacion']:<20} {r['repeticiones']:>6} {r['ops_s']:>11,.0f} "
+        f"{r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} {r['p99_ms']:>9.3f}"
+    )
+
+def comparar(resultados, base, tolerancia, metrica="p95_ms"):
+    """
+    Compara los resultados contra una corrida previa
+
+    Args:
+        resultados: Lista de resultados de esta corrida
+        base: Lista de resultados de la corrida de referencia
+        tolerancia: Aumento relativo permitido (0.2 = 20%)
+        metrica: Latencia a comparar
+
+    Returns:
+        list: Regresiones como dicts {tamano, operacion, base, actual, cambio}
+    """
+    referencia = {(r["tamano"], r["operacion"]): r for r in base}
+    regresiones = []
+    for r in resultados:
+        anterior = referencia.get((r["tamano"], r["operacion"]))
+        if not anterior or not anterior.get(metrica):
+            continue
+        cambio = r[metrica] / anterior[metrica] - 1
+        if cambio > tolerancia:
+            regresiones.append({
+                "tamano": r["tamano"],
+                "operacion": r["operacion"],
+                "base": anterior[metrica],
+                "actual": r[metrica],
+                "cambio": cambio,
+            })
+    return regresiones
+
+def _conectar(backend):
+    """Obtiene la base de datos del backend elegido (mongod real o mongomock en proceso)"""
+    if backend == "mongomock":
+        try:
+            import mongomock
+        except ImportError:
+            print("❌ El backend 'mongomock' requiere: pip install mongomock")
+            return None
+        return mongomock.MongoClient()["bench_db"]
+    return get_database()
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks CRUD y de búsqueda")
+    parser.add_argument("--tamanos", default="1000,10000,100000", help="Tamaños de la colección separados por comas")
+    parser.add_argument("--repeticiones", type=int, default=500, help="Repeticiones por operación")
+    parser.add_argument("--repeticiones-listas", type=int, default=20, help="Repeticiones de búsquedas por puesto/departamento")
+    parser.add_argument("--lote", type=int, default=100, help="Documentos por operación de creación en lote")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla de los datos")
+    parser.add_argument("--hilos", type=int, default=4, help="Hilos para sembrar los datos")
+    parser.add_argument("--backend", choices=("mongodb", "mongomock"), default="mongodb", help="Servidor real o simulado en proceso")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="Archivo JSON de una corrida previa")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="Aumento de p95 permitido antes de marcar regresión")
+    args = parser.parse_args()
+
+    try:
+        tamanos = [int(t) for t in args.tamanos.split(",") if t.strip()]
+    except ValueError:
+        print(f"❌ Tamaños inválidos: {args.tamanos}")
+        return 1
+
+    db = _conectar(args.backend)
+    if db is None:
+        print("❌ No se pudo conectar a la base de datos")
+        return 1
+    if args.backend == "mongomock":
+        args.hilos = 1
+
+    print(f"\n{'TAMAÑO':>10} {'OPERACIÓN':<20} {'REPET.':>6} {'OPS/S':>11} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    resultados = []
+    try:
+        for n in tamanos:
+            resultados.extend(ejecutar_tamano(db, n, args))
+    finally:
+        close_connection()
+
+    if args.salida:
+        informe = {
+            "fecha": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "backend": args.backend,
+            "python": platform.python_version(),
+            "pymongo": pymongo.version,
+            "parametros": {
+                "repeticiones": args.repeticiones,
+                "repeticiones_listas": args.repeticiones_listas,
+                "lote": args.lote,
+                "semilla": args.semilla,
+            },
+            "resultados": resultados,
+        }
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+        print(f"\n💾 Resultados guardados en {args.salida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)["resultados"]
+        regresiones = comparar(resultados, base, args.tolerancia)
+        if regresiones:
+            print(f"\n🐢 Regresiones (p95 más de {args.tolerancia:.0%} por encima de la base):")
+            for r in regresiones:
+                print(
+                    f"   {r['tamano']:>10,} {r['operacion']:<20} "
+                    f"{r['base']:.3f} ms -> {r['actual']:.3f} ms (+{r['cambio']:.0%})"
+                )
+            return 2
+        print("\n✅ Sin regresiones respecto a la base")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,444 @@
+"""
+Modo no interactivo de la aplicación: subcomandos con entrada y salida JSON
+Una sola conexión por invocación y varios registros por llamada
+
+Uso (desde la raíz del proyecto):
+    python cli.py list --limit 50
+    python cli.py get 7369 7499
+    python cli.py create --empno 8000 --ename LUIS --job CLERK --sal 1200 --deptno 10
+    python cli.py create --stdin < empleados.jsonl
+    python cli.py update 7369 --sal 900
+    python cli.py delete 7369 7499
+    python cli.py search nombre SMI
+    python cli.py seed --n 100000
+    python cli.py raise --pct 5 --job CLERK --deptno 20 --dry-run
+    python cli.py reassign 20 40 --dname OPERATIONS --loc BOSTON
+    python cli.py bulk-update cambios.jsonl --dry-run
+    python cli.py bulk-delete --job CLERK --sal-max 1000 --dry-run
+    python cli.py bulk-delete --archivo empnos.txt
+    python cli.py --latencias seed --n 100000
+
+Los documentos se escriben en stdout como JSON Lines (uno por línea) y los
+resúmenes como un objeto JSON. Los mensajes de registro van a stderr, igual que
+la tabla de latencias por comando de --latencias.
+
+Códigos de salida:
+    0  Éxito
+    1  Alguno de los registros falló (inválido, duplicado, etc.)
+    2  Uso incorrecto o entrada inválida
+    3  Algún empleado no existe
+    4  No hay conexión con MongoDB
+"""
+import argparse
+import json
+import logging
+import sys
+from db.command_monitor import imprimir_latencias
+from db.mongo_config import get_collection, close_connection, latencias_operaciones
+from services.repository import EmployeeRepository
+from services.search.queries import CRITERIOS, orden_por_nombre
+from services.shared.catalog import catalogo
+from services.shared.constants import TAMANO_PAGINA
+from services.shared.validation import registro_a_documento, registro_a_cambios
+
+logger = logging.getLogger("cli")
+
+EXITO = 0
+ERROR_REGISTROS = 1
+ERROR_USO = 2
+NO_ENCONTRADO = 3
+SIN_CONEXION = 4
+
+# Campos que se pueden modificar con update
+CAMPOS_ACTUALIZABLES = ("ename", "job", "sal", "deptno", "dname", "loc")
+
+class ErrorEntrada(Exception):
+    """La entrada (argumentos o stdin) no tiene el formato esperado"""
+
+def escribir_documento(documento):
+    """Escribe un documento como una línea JSON en stdout"""
+    sys.stdout.write(json.dumps(documento, ensure_ascii=False, default=str) + "\n")
+
+def escribir_empleado(empleado):
+    """Escribe un Empleado como una línea JSON en stdout (sin el campo interno ename_search)"""
+    escribir_documento(empleado.to_dict(incluir_busqueda=False))
+
+def escribir_resumen(resumen):
+    """Escribe el resumen de una operación como un objeto JSON en stdout"""
+    sys.stdout.write(json.dumps(resumen, ensure_ascii=False, default=str) + "\n")
+
+def leer_stdin():
+    """
+    Lee registros JSON desde stdin: un arreglo, un objeto o JSON Lines
+
+    Returns:
+        list: Registros leídos
+
+    Raises:
+        ErrorEntrada: Si el contenido no es JSON válido
+    """
+    contenido = sys.stdin.read().strip()
+    if not contenido:
+        return []
+    try:
+        datos = json.loads(contenido)
+        return datos if isinstance(datos, list) else [datos]
+    except json.JSONDecodeError:
+        pass
+
+    registros = []
+    for numero, linea in enumerate(contenido.splitlines(), start=1):
+        if not linea.strip():
+            continue
+        try:
+            registros.append(json.loads(linea))
+        except json.JSONDecodeError as e:
+            raise ErrorEntrada(f"JSON inválido en la línea {numero}: {e.msg}")
+    return registros
+
+def _empnos(valores):
+    """Convierte una lista de valores (o registros con empno) a enteros"""
+    empnos = []
+    for valor in valores:
+        if isinstance(valor, dict):
+            valor = valor.get("empno")
+        try:
+            empnos.append(int(valor))
+        except (TypeError, ValueError):
+            raise ErrorEntrada(f"empno inválido: {valor!r}")
+    return empnos
+
+def _empnos_de_entrada(args):
+    """Obtiene los empno de los argumentos o, si se indica --stdin, de la entrada estándar"""
+    empnos = _empnos(args.empnos) + (_empnos(leer_stdin()) if args.stdin else [])
+    if not empnos:
+        raise ErrorEntrada("Indica al menos un empno (argumentos o --stdin)")
+    return empnos
+
+def comando_list(args, repositorio):
+    """Lista empleados ordenados por empno (paginación por rango)"""
+    filtro = {} if args.after is None else {"empno": {"$gt": args.after}}
+    limite = 0 if args.all else args.limit
+    for empleado in repositorio.iter_search(filtro, limit=limite, sort=[("empno", 1)]):
+        escribir_empleado(empleado)
+    return EXITO
+
+def comando_get(args, repositorio):
+    """Obtiene uno o varios empleados por empno con una sola consulta $in"""
+    empnos = _empnos_de_entrada(args)
+    encontrados = set()
+    for empleado in repositorio.get_many(empnos):
+        encontrados.add(empleado.empno)
+        escribir_empleado(empleado)
+
+    faltantes = [empno for empno in empnos if empno not in encontrados]
+    if faltantes:
+        logger.warning(f"No se encontraron los empleados: {', '.join(map(str, faltantes))}")
+        return NO_ENCONTRADO
+    return EXITO
+
+def comando_create(args, repositorio):
+    """Crea uno o varios empleados con un solo insert_many(ordered=False)"""
+    if args.stdin:
+        registros = leer_stdin()
+    else:
+        faltantes = [campo for campo in ("empno", "ename", "job", "sal", "deptno") if getattr(args, campo) is None]
+        if faltantes:
+            raise ErrorEntrada(f"Faltan campos: {', '.join(faltantes)} (o usa --stdin)")
+        registros = [{campo: getattr(args, campo) for campo in ("empno", "ename", "job", "sal", "deptno", "dname", "loc")}]
+
+    departamentos = catalogo.departamentos(repositorio.collection)
+    documentos = []
+    invalidos = []
+    for registro in registros:
+        documento, error = registro_a_documento(registro, departamentos) if isinstance(registro, dict) else (None, "Se esperaba un objeto JSON")
+        if error:
+            invalidos.append({"registro": registro, "motivo": error})
+        else:
+            documentos.append(documento)
+
+    resultado = repositorio.insert_many(documentos)
+    invalidos.extend({"motivo": error} for error in resultado["errores"])
+
+    escribir_resumen({"insertados": resultado["insertados"], "duplicados": resultado["duplicados"], "invalidos": invalidos})
+    return ERROR_REGISTROS if resultado["duplicados"] or invalidos else EXITO
+
+def comando_update(args, repositorio):
+    """Actualiza uno o varios empleados con un solo bulk_write"""
+    departamentos = catalogo.departamentos(repositorio.collection)
+    if args.stdin:
+        registros = leer_stdin()
+    else:
+        registros = [dict({campo: getattr(args, campo) for campo in CAMPOS_ACTUALIZABLES}, empno=empno) for empno in args.empnos]
+    if not registros:
+        raise ErrorEntrada("Indica al menos un empno (argumentos o --stdin)")
+
+    cambios_por_empno = {}
+    for registro in registros:
+        if not isinstance(registro, dict):
+            raise ErrorEntrada("Se esperaba un objeto JSON por registro")
+        empno = _empnos([registro.get("empno")])[0]
+        cambios, error = registro_a_cambios(registro, departamentos)
+        if error:
+            raise ErrorEntrada(f"empno {empno}: {error}")
+        cambios_por_empno[empno] = cambios
+
+    resultado = repositorio.update_many(cambios_por_empno)
+    existentes = repositorio.existing(cambios_por_empno)
+    no_encontrados = [empno for empno in cambios_por_empno if empno not in existentes]
+    escribir_resumen(dict(resultado, no_encontrados=no_encontrados))
+    return NO_ENCONTRADO if no_encontrados else EXITO
+
+def comando_delete(args, repositorio):
+    """Elimina uno o varios empleados con un solo delete_many"""
+    empnos = _empnos_de_entrada(args)
+    existentes = repositorio.existing(empnos)
+    eliminados = repositorio.delete_many(existentes)
+
+    no_encontrados = [empno for empno in empnos if empno not in existentes]
+    escribir_resumen({"eliminados": eliminados, "no_encontrados": no_encontrados})
+    return NO_ENCONTRADO if no_encontrados else EXITO
+
+def comando_search(args, repositorio):
+    """Busca empleados con los mismos criterios que la búsqueda interactiva"""
+    valor = args.valor if args.criterio == "id" else args.valor.upper()
+    try:
+        filtro = repositorio.filtro_busqueda(args.criterio, valor)
+    except ValueError as e:
+        raise ErrorEntrada(str(e))
+
+    orden = orden_por_nombre() if args.criterio == "nombre" else [("empno", 1)]
+    encontrados = 0
+    for empleado in repositorio.iter_search(filtro, limit=args.limit, sort=orden):
+        escribir_empleado(empleado)
+        encontrados += 1
+    return EXITO if encontrados else NO_ENCONTRADO
+
+def comando_seed(args, repositorio):
+    """Inserta datos de prueba: el esquema SCOTT o N empleados sintéticos"""
+    from db.seed import sembrar, sembrar_scott
+
+    if args.scott:
+        resultado = sembrar_scott(args.reemplazar, collection=repositorio.collection)
+    else:
+        resultado = sembrar(
+            args.n, semilla=args.semilla, tamano_lote=args.lote, hilos=args.hilos,
+            reemplazar=args.reemplazar, collection=repositorio.collection
+        )
+    escribir_resumen(resultado)
+    return EXITO
+
+def comando_report(args, repositorio):
+    """Muestra un reporte del resumen de salarios (JSON Lines), actualizándolo antes si se pide"""
+    from services.reports.service import refrescar_resumen, obtener_reporte
+
+    if args.refrescar or args.completo:
+        resultado = refrescar_resumen(repositorio.collection, completo=args.completo)
+        logger.info(f"Resumen actualizado: {resultado}")
+    for fila in obtener_reporte(args.nivel, repositorio.collection):
+        escribir_documento(fila)
+    return EXITO
+
+def _actualizacion_masiva(operacion, *args, **kwargs):
+    """Ejecuta una operación masiva (services.bulk_update o bulk_delete) y escribe su resumen"""
+    try:
+        resumen = operacion(*args, **kwargs)
+    except ValueError as e:
+        raise ErrorEntrada(str(e))
+    escribir_resumen(resumen)
+    return resumen
+
+def comando_raise(args, repositorio):
+    """Aumenta el salario de los empleados que cumplen el filtro con un solo update_many"""
+    from services.bulk_update.service import aumentar_salarios
+
+    _actualizacion_masiva(
+        aumentar_salarios, args.pct, args.monto, args.job, args.deptno, args.sal_min, args.sal_max,
+        simular=args.dry_run, collection=repositorio.collection
+    )
+    return EXITO
+
+def comando_reassign(args, repositorio):
+    """Mueve los empleados de un departamento a otro con un solo update_many"""
+    from services.bulk_update.service import reasignar_departamento
+
+    _actualizacion_masiva(
+        reasignar_departamento, args.origen, args.destino, args.job, args.dname, args.loc,
+        simular=args.dry_run, collection=repositorio.collection
+    )
+    return EXITO
+
+def comando_bulk_update(args, repositorio):
+    """Aplica cambios por empleado desde un archivo CSV/JSONL en lotes de bulk_write"""
+    from services.bulk_update.service import actualizar_desde_archivo
+
+    try:
+        resumen = _actualizacion_masiva(
+            actualizar_desde_archivo, args.archivo, args.lote, simular=args.dry_run, collection=repositorio.collection
+        )
+    except OSError as e:
+        raise ErrorEntrada(f"No se pudo leer el archivo: {e}")
+    if resumen["invalidos"]:
+        return ERROR_REGISTROS
+    return NO_ENCONTRADO if resumen["no_encontrados"] else EXITO
+
+def comando_bulk_delete(args, repositorio):
+    """Elimina por filtro (lotes por rango de _id) o por una lista de empno en archivo"""
+    from services.bulk_delete.service import eliminar_por_filtro, eliminar_desde_archivo
+
+    if args.archivo:
+        if any(valor is not None for valor in (args.job, args.deptno, args.sal_min, args.sal_max)):
+            raise ErrorEntrada("Usa --archivo o los filtros, no ambos")
+        try:
+            resumen = _actualizacion_masiva(
+                eliminar_desde_archivo, args.archivo, simular=args.dry_run,
+                tamano_lote=args.lote, pausa_ms=args.pausa_ms, collection=repositorio.collection
+            )
+        except OSError as e:
+            raise ErrorEntrada(f"No se pudo leer el archivo: {e}")
+        if resumen["invalidos"]:
+            return ERROR_REGISTROS
+        return NO_ENCONTRADO if resumen["no_encontrados"] else EXITO
+
+    _actualizacion_masiva(
+        eliminar_por_filtro, args.job, args.deptno, args.sal_min, args.sal_max, simular=args.dry_run,
+        tamano_lote=args.lote, pausa_ms=args.pausa_ms, collection=repositorio.collection
+    )
+    return EXITO
+
+def construir_parser():
+    """Define los subcomandos y sus argumentos"""
+    parser = argparse.ArgumentParser(prog="cli.py", description="CRUD de empleados sin interacción (JSON por stdin/stdout)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Mostrar mensajes informativos en stderr")
+    parser.add_argument("--latencias", action="store_true", help="Al terminar, mostrar en stderr la latencia por comando")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    p = subparsers.add_parser("list", help="Listar empleados ordenados por empno")
+    p.add_argument("--after", type=int, help="Empezar después de este empno")
+    p.add_argument("--limit", type=int, default=TAMANO_PAGINA, help="Máximo de empleados")
+    p.add_argument("--all", action="store_true", help="Listar todos (ignora --limit)")
+    p.set_defaults(funcion=comando_list)
+
+    p = subparsers.add_parser("get", help="Obtener empleados por empno")
+    p.add_argument("empnos", nargs="*", help="Números de empleado")
+    p.add_argument("--stdin", action="store_true", help="Leer empno (o registros con empno) desde stdin")
+    p.set_defaults(funcion=comando_get)
+
+    p = subparsers.add_parser("create", help="Crear empleados")
+    p.add_argument("--empno", type=int)
+    p.add_argument("--ename")
+    p.add_argument("--job")
+    p.add_argument("--sal", type=float)
+    p.add_argument("--deptno", type=int)
+    p.add_argument("--dname", help="Opcional si el departamento ya existe")
+    p.add_argument("--loc", help="Opcional si el departamento ya existe")
+    p.add_argument("--stdin", action="store_true", help="Leer registros JSON desde stdin")
+    p.set_defaults(funcion=comando_create)
+
+    p = subparsers.add_parser("update", help="Actualizar empleados")
+    p.add_argument("empnos", nargs="*", type=int, help="Números de empleado")
+    p.add_argument("--ename")
+    p.add_argument("--job")
+    p.add_argument("--sal", type=float)
+    p.add_argument("--deptno", type=int)
+    p.add_argument("--dname")
+    p.add_argument("--loc")
+    p.add_argument("--stdin", action="store_true", help="Leer registros JSON (empno y campos) desde stdin")
+    p.set_defaults(funcion=comando_update)
+
+    p = subparsers.add_parser("delete", help="Eliminar empleados")
+    p.add_argument("empnos", nargs="*", help="Números de empleado")
+    p.add_argument("--stdin", action="store_true", help="Leer empno (o registros con empno) desde stdin")
+    p.set_defaults(funcion=comando_delete)
+
+    p = subparsers.add_parser("search", help="Buscar empleados")
+    p.add_argument("criterio", choices=list(CRITERIOS), help="Campo de búsqueda")
+    p.add_argument("valor", help="Valor a buscar")
+    p.add_argument("--limit", type=int, default=0, help="Máximo de resultados (0 sin límite)")
+    p.set_defaults(funcion=comando_search)
+
+    p = subparsers.add_parser("seed", help="Insertar datos de prueba")
+    p.add_argument("--n", type=int, default=10000, help="Empleados sintéticos")
+    p.add_argument("--semilla", type=int, default=42, help="Semilla de los datos")
+    p.add_argument("--lote", type=int, default=5000, help="Documentos por insert_many")
+    p.add_argument("--hilos", type=int, default=4, help="Lotes escritos en paralelo")
+    p.add_argument("--scott", action="store_true", help="Solo los 14 empleados del esquema SCOTT")
+    p.add_argument("--reemplazar", action="store_true", help="Sobrescribir empleados existentes")
+    p.set_defaults(funcion=comando_seed)
+
+    p = subparsers.add_parser("report", help="Reporte de salarios y plantilla")
+    p.add_argument("nivel", nargs="?", default="departamento",
+                   choices=("departamento", "departamento_puesto", "puesto"), help="Agrupación del reporte")
+    p.add_argument("--refrescar", action="store_true", help="Recalcular antes los departamentos con cambios")
+    p.add_argument("--completo", action="store_true", help="Recalcular antes todo el resumen")
+    p.set_defaults(funcion=comando_report)
+
+    p = subparsers.add_parser("raise", help="Aumentar salarios por filtro")
+    aumento = p.add_mutually_exclusive_group(required=True)
+    aumento.add_argument("--pct", type=float, help="Aumento porcentual (negativo para reducir)")
+    aumento.add_argument("--monto", type=float, help="Aumento absoluto (negativo para reducir)")
+    p.add_argument("--job", help="Solo este puesto")
+    p.add_argument("--deptno", type=int, help="Solo este departamento")
+    p.add_argument("--sal-min", type=float, help="Solo salarios desde este valor")
+    p.add_argument("--sal-max", type=float, help="Solo salarios hasta este valor")
+    p.add_argument("--dry-run", action="store_true", help="Solo mostrar coincidencias y totales")
+    p.set_defaults(funcion=comando_raise)
+
+    p = subparsers.add_parser("reassign", help="Mover empleados de un departamento a otro")
+    p.add_argument("origen", type=int, help="Departamento actual")
+    p.add_argument("destino", type=int, help="Departamento nuevo")
+    p.add_argument("--job", help="Solo este puesto")
+    p.add_argument("--dname", help="Nombre del destino si no existe")
+    p.add_argument("--loc", help="Ubicación del destino si no existe")
+    p.add_argument("--dry-run", action="store_true", help="Solo mostrar coincidencias y totales")
+    p.set_defaults(funcion=comando_reassign)
+
+    p = subparsers.add_parser("bulk-update", help="Cambios por empleado desde un archivo CSV/JSONL")
+    p.add_argument("archivo", help="Archivo con empno y los campos a modificar")
+    p.add_argument("--lote", type=int, default=1000, help="Empleados por bulk_write")
+    p.add_argument("--dry-run", action="store_true", help="Solo mostrar coincidencias y totales")
+    p.set_defaults(funcion=comando_bulk_update)
+
+    p = subparsers.add_parser("bulk-delete", help="Eliminar empleados por filtro o desde una lista de empno")
+    p.add_argument("--job", help="Solo este puesto")
+    p.add_argument("--deptno", type=int, help="Solo este departamento")
+    p.add_argument("--sal-min", type=float, help="Solo salarios desde este valor")
+    p.add_argument("--sal-max", type=float, help="Solo salarios hasta este valor")
+    p.add_argument("--archivo", help="Archivo TXT/CSV/JSONL con los empno a eliminar")
+    p.add_argument("--lote", type=int, default=1000, help="Empleados por delete_many")
+    p.add_argument("--pausa-ms", type=int, default=0, help="Espera entre lotes")
+    p.add_argument("--dry-run", action="store_true", help="Solo contar los empleados que se eliminarían")
+    p.set_defaults(funcion=comando_bulk_delete)
+
+    return parser
+
+def main(argv=None):
+    args = construir_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        stream=sys.stderr,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+
+    # Una sola conexión para toda la invocación
+    collection = get_collection()
+    if collection is None:
+        logger.error("No se pudo conectar a MongoDB")
+        return SIN_CONEXION
+
+    try:
+        return args.funcion(args, EmployeeRepository(collection))
+    except ErrorEntrada as e:
+        logger.error(str(e))
+        return ERROR_USO
+    except BrokenPipeError:
+        # La salida se cerró antes de tiempo (por ejemplo: | head)
+        return EXITO
+    finally:
+        if args.latencias:
+            print("\n⏱️ Latencia por operación:", file=sys.stderr)
+            imprimir_latencias(latencias_operaciones(), archivo=sys.stderr)
+        close_connection()
+
+if __name__ == "__main__":
+    raise SystemExit(main())
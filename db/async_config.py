@@ -0,0 +1,120 @@
+"""
+Conexión asíncrona a MongoDB con Motor
+Un único event loop en un hilo de fondo y un único cliente compartido,
+para que herramientas por lotes y servidores tengan muchas operaciones en vuelo
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from motor.motor_asyncio import AsyncIOMotorClient
+
+# Importar la configuración síncrona garantiza que .env ya esté cargado
+from db.mongo_config import opciones_cliente
+
+logger = logging.getLogger(__name__)
+
+class AsyncMongoDBConnection:
+    """
+    Clase Singleton que mantiene el event loop compartido y el cliente Motor
+    """
+    _instance = None
+
+    def __new__(cls):
+        """Implementación del patrón Singleton"""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._loop = None
+            cls._instance._hilo = None
+            cls._instance._client = None
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def get_loop(self):
+        """
+        Obtiene el event loop compartido (lo inicia en un hilo de fondo si no existe)
+
+        Returns:
+            AbstractEventLoop: Loop donde se ejecutan todas las operaciones asíncronas
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._hilo = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="mongo-async-loop",
+                    daemon=True
+                )
+                self._hilo.start()
+        return self._loop
+
+    def get_client(self):
+        """
+        Obtiene el cliente Motor compartido (lo crea si no existe)
+
+        Returns:
+            AsyncIOMotorClient: Cliente asíncrono ligado al loop compartido
+        """
+        if self._client is None:
+            loop = self.get_loop()
+            mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+
+            async def _crear():
+                return AsyncIOMotorClient(mongo_uri, **opciones_cliente())
+
+            # El cliente se crea dentro del loop para quedar ligado a él
+            client = asyncio.run_coroutine_threadsafe(_crear(), loop).result()
+            with self._lock:
+                if self._client is None:
+                    self._client = client
+                else:
+                    client.close()
+        return self._client
+
+    def close(self):
+        """Cierra el cliente y detiene el loop compartido"""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._hilo.join(timeout=5)
+                self._loop.close()
+                self._loop = None
+                self._hilo = None
+                logger.info("🔌 Conexión asíncrona a MongoDB cerrada")
+
+# Instancia global de la conexión asíncrona
+async_connection = AsyncMongoDBConnection()
+
+def get_async_collection():
+    """
+    Obtiene la colección configurada con el cliente asíncrono
+
+    Returns:
+        AsyncIOMotorCollection: Colección de Motor
+    """
+    client = async_connection.get_client()
+    db_name = os.getenv("MONGO_DB", "empresa_db")
+    collection_name = os.getenv("MONGO_COLLECTION", "rh")
+    return client[db_name][collection_name]
+
+def ejecutar(coroutine, timeout=None):
+    """
+    Ejecuta una corrutina en el loop compartido desde código síncrono
+
+    Args:
+        coroutine: Corrutina a ejecutar
+        timeout: Segundos máximos de espera (None para esperar indefinidamente)
+
+    Returns:
+        Resultado de la corrutina
+    """
+    loop = async_connection.get_loop()
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result(timeout)
+
+def close_async_connection():
+    """Función pública para cerrar la conexión asíncrona"""
+    async_connection.close()
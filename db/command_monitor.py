@@ -0,0 +1,263 @@
+"""
+Latencia de cada comando enviado a MongoDB
+Se registra mediante un CommandListener al crear el cliente: por cada comando guarda
+la duración, el comando, el namespace, los documentos devueltos y la función del
+proyecto que lo originó, en histogramas en memoria al estilo HDR (cubetas
+logarítmicas con error acotado). Los comandos que superan MONGO_SLOW_MS se registran
+en el log como operaciones lentas. El tamaño en bytes de cada respuesta solo se
+mide con MONGO_COMMAND_REPLY_BYTES=1 (hay que volver a codificarla) y en los lentos
+"""
+
+import logging
+import os
+import sys
+import threading
+import bson
+from pymongo import monitoring
+
+logger = logging.getLogger(__name__)
+
+# Registrar los comandos (0 desactiva el listener) y umbral de operación lenta
+MONITOREAR_COMANDOS = os.getenv("MONGO_COMMAND_MONITOR", "1") != "0"
+UMBRAL_LENTO_MS = float(os.getenv("MONGO_SLOW_MS", "100"))
+# Medir el tamaño de todas las respuestas: PyMongo ya las decodificó, así que
+# conocerlo exige codificarlas otra vez en el hilo de la operación
+MEDIR_RESPUESTAS = os.getenv("MONGO_COMMAND_REPLY_BYTES", "0") == "1"
+
+PERCENTILES = (50, 90, 95, 99, 99.9)
+
+# Módulos que se saltan al buscar la función que originó el comando: el driver y
+# las capas de acceso a datos, para llegar al servicio que hizo la operación
+MODULOS_INTERNOS = (
+    "pymongo", "bson", "motor", "threading", "concurrent", "contextlib", __name__,
+    "services.repository", "services.shared.cache",
+)
+
+class Histograma:
+    """
+    Histograma de latencias en microsegundos con cubetas logarítmicas (como HdrHistogram)
+    Cada potencia de 2 se divide en 2**bits_precision cubetas: el error relativo de
+    los percentiles queda por debajo de 1/2**bits_precision con memoria constante
+    """
+
+    def __init__(self, bits_precision=5):
+        self.bits = bits_precision
+        self.cubetas = {}
+        self.cuenta = 0
+        self.total = 0
+        self.minimo = None
+        self.maximo = 0
+
+    def _indice(self, valor):
+        """Cubeta de un valor: exponente y, dentro de él, los bits más significativos"""
+        if valor < (1 << self.bits):
+            return valor
+        desplazamiento = valor.bit_length() - self.bits - 1
+        return ((desplazamiento + 1) << self.bits) + (valor >> desplazamiento) - (1 << self.bits)
+
+    def _limite(self, indice):
+        """Valor más alto que cae en una cubeta"""
+        if indice < (1 << self.bits):
+            return indice
+        desplazamiento = (indice >> self.bits) - 1
+        base = (indice & ((1 << self.bits) - 1)) + (1 << self.bits)
+        return ((base + 1) << desplazamiento) - 1
+
+    def registrar(self, valor):
+        """
+        Agrega una medición
+
+        Args:
+            valor: Duración en microsegundos
+        """
+        valor = max(0, int(valor))
+        indice = self._indice(valor)
+        self.cubetas[indice] = self.cubetas.get(indice, 0) + 1
+        self.cuenta += 1
+        self.total += valor
+        self.minimo = valor if self.minimo is None else min(self.minimo, valor)
+        self.maximo = max(self.maximo, valor)
+
+    def percentil(self, p):
+        """
+        Valor por debajo del cual está el p% de las mediciones
+
+        Args:
+            p: Percentil entre 0 y 100
+
+        Returns:
+            int: Microsegundos (0 si no hay mediciones)
+        """
+        if not self.cuenta:
+            return 0
+        objetivo = max(1, -(-self.cuenta * p // 100))
+        acumulado = 0
+        for indice in sorted(self.cubetas):
+            acumulado += self.cubetas[indice]
+            if acumulado >= objetivo:
+                return min(self._limite(indice), self.maximo)
+        return self.maximo
+
+    def resumen(self):
+        """
+        Returns:
+            dict: {"cuenta", "promedio_ms", "min_ms", "max_ms", "p50_ms", ...}
+        """
+        resultado = {
+            "cuenta": self.cuenta,
+            "promedio_ms": self.total / self.cuenta / 1000 if self.cuenta else 0.0,
+            "min_ms": (self.minimo or 0) / 1000,
+            "max_ms": self.maximo / 1000,
+        }
+        for p in PERCENTILES:
+            resultado[f"p{p:g}_ms"] = self.percentil(p) / 1000
+        return resultado
+
+def _documentos_respuesta(respuesta):
+    """
+    Documentos que trae la respuesta de un comando con cursor (find, aggregate, getMore)
+
+    Returns:
+        int: Largo de firstBatch/nextBatch (0 si la respuesta no tiene cursor)
+    """
+    cursor = respuesta.get("cursor") if respuesta is not None else None
+    if not isinstance(cursor, dict):
+        return 0
+    return len(cursor.get("firstBatch") or cursor.get("nextBatch") or ())
+
+def funcion_origen():
+    """
+    Primera función fuera de PyMongo en la pila del hilo actual
+    Los eventos de inicio se emiten en el mismo hilo que ejecuta la operación
+
+    Returns:
+        str: 'modulo.funcion' o '?' si no se encontró
+    """
+    marco = sys._getframe(2)
+    while marco is not None:
+        modulo = marco.f_globals.get("__name__", "")
+        if not modulo.startswith(MODULOS_INTERNOS):
+            return f"{modulo}.{marco.f_code.co_name}"
+        marco = marco.f_back
+    return "?"
+
+class LatenciasComandos(monitoring.CommandListener):
+    """
+    Histogramas de latencia por comando y por función de origen,
+    actualizados por los eventos de comandos de PyMongo
+    """
+
+    def __init__(self, umbral_lento_ms=UMBRAL_LENTO_MS, medir_respuestas=MEDIR_RESPUESTAS):
+        self.umbral_lento_ms = umbral_lento_ms
+        self.medir_respuestas = medir_respuestas
+        self._lock = threading.Lock()
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Descarta todas las mediciones"""
+        with self._lock:
+            self._en_curso = {}
+            self._por_comando = {}
+            self._por_funcion = {}
+            self._documentos = {}
+            self._bytes = {}
+            self._errores = {}
+            self.lentos = 0
+
+    def started(self, event):
+        coleccion = event.command.get(event.command_name)
+        namespace = f"{event.database_name}.{coleccion}" if isinstance(coleccion, str) else event.database_name
+        with self._lock:
+            self._en_curso[(event.connection_id, event.request_id)] = (namespace, funcion_origen())
+
+    def succeeded(self, event):
+        self._registrar(event, event.reply, error=None)
+
+    def failed(self, event):
+        self._registrar(event, None, error=event.failure)
+
+    def _registrar(self, event, respuesta, error):
+        """Agrega la duración de un comando terminado y avisa si fue lento"""
+        documentos = _documentos_respuesta(respuesta)
+        lento = event.duration_micros / 1000 >= self.umbral_lento_ms
+        # Re-codificar la respuesta es la única forma de conocer su tamaño en BSON:
+        # solo se hace si se pidió o para el log de un comando lento
+        tamano = len(bson.encode(respuesta)) if respuesta is not None and (self.medir_respuestas or lento) else 0
+        with self._lock:
+            namespace, funcion = self._en_curso.pop((event.connection_id, event.request_id), (event.database_name, "?"))
+            comando = event.command_name
+            self._por_comando.setdefault(comando, Histograma()).registrar(event.duration_micros)
+            self._por_funcion.setdefault(funcion, Histograma()).registrar(event.duration_micros)
+            self._documentos[comando] = self._documentos.get(comando, 0) + documentos
+            if self.medir_respuestas:
+                self._bytes[comando] = self._bytes.get(comando, 0) + tamano
+            if error is not None:
+                self._errores[comando] = self._errores.get(comando, 0) + 1
+            if lento:
+                self.lentos += 1
+
+        if lento:
+            estado = f" ❌ {error.get('errmsg', error)}" if isinstance(error, dict) else ""
+            logger.warning(
+                f"🐢 Operación lenta: {comando} {namespace} {event.duration_micros / 1000:.1f} ms, "
+                f"{documentos:,} documentos, {tamano:,} bytes, desde {funcion}{estado}"
+            )
+
+    def estadisticas(self):
+        """
+        Percentiles de latencia actuales
+
+        Returns:
+            dict: {"umbral_lento_ms", "lentos",
+                   "comandos": {comando: resumen + "documentos", "bytes_respuesta"
+                                (None si no se miden), "errores"},
+                   "funciones": {funcion: resumen}}
+        """
+        with self._lock:
+            comandos = {}
+            for comando, histograma in sorted(self._por_comando.items()):
+                comandos[comando] = histograma.resumen()
+                comandos[comando]["documentos"] = self._documentos.get(comando, 0)
+                comandos[comando]["bytes_respuesta"] = self._bytes.get(comando, 0) if self.medir_respuestas else None
+                comandos[comando]["errores"] = self._errores.get(comando, 0)
+            funciones = {funcion: histograma.resumen() for funcion, histograma in self._por_funcion.items()}
+            return {"umbral_lento_ms": self.umbral_lento_ms, "lentos": self.lentos, "comandos": comandos, "funciones": funciones}
+
+def imprimir_latencias(estadisticas, archivo=None, max_funciones=10):
+    """
+    Imprime las latencias como tablas: por comando y las funciones con más tiempo acumulado
+
+    Args:
+        estadisticas: Resultado de LatenciasComandos.estadisticas()
+        archivo: Destino (por defecto stdout)
+        max_funciones: Funciones a mostrar
+    """
+    archivo = archivo or sys.stdout
+    if not estadisticas["comandos"]:
+        print("   Sin comandos registrados", file=archivo)
+        return
+
+    encabezado = f"   {'COMANDO':<18} {'CUENTA':>8}" + "".join(f" {'P' + format(p, 'g'):>8}" for p in PERCENTILES)
+    encabezado += f" {'MÁX.':>8} {'DOCS':>10} {'KB RESP.':>10} {'ERRORES':>7}"
+    print(encabezado, file=archivo)
+    for comando, fila in estadisticas["comandos"].items():
+        linea = f"   {comando:<18} {fila['cuenta']:>8,}" + "".join(f" {fila[f'p{p:g}_ms']:>8.2f}" for p in PERCENTILES)
+        kilobytes = "-" if fila["bytes_respuesta"] is None else f"{fila['bytes_respuesta'] / 1024:,.1f}"
+        linea += f" {fila['max_ms']:>8.2f} {fila['documentos']:>10,} {kilobytes:>10} {fila['errores']:>7}"
+        print(linea, file=archivo)
+    print("   (milisegundos)", file=archivo)
+
+    funciones = sorted(
+        estadisticas["funciones"].items(), key=lambda item: item[1]["promedio_ms"] * item[1]["cuenta"], reverse=True
+    )
+    print(f"\n   {'FUNCIÓN':<52} {'CUENTA':>8} {'P50':>8} {'P99':>8} {'TOTAL S':>8}", file=archivo)
+    for funcion, fila in funciones[:max_funciones]:
+        print(
+            f"   {funcion[-52:]:<52} {fila['cuenta']:>8,} {fila['p50_ms']:>8.2f} {fila['p99_ms']:>8.2f} "
+            f"{fila['promedio_ms'] * fila['cuenta'] / 1000:>8.2f}",
+            file=archivo,
+        )
+    print(f"\n   🐢 Operaciones lentas (≥ {estadisticas['umbral_lento_ms']:g} ms): {estadisticas['lentos']}", file=archivo)
+
+# Instancia global registrada en el cliente síncrono
+latencias_comandos = LatenciasComandos()
@@ -0,0 +1,50 @@
+"""
+Estado de los datos de la colección de empleados
+Separado de mongo_utils para que el arranque de la aplicación consulte si hay
+empleados sin importar el sembrado, los reportes, la caché ni el monitor de comandos
+"""
+
+from db.mongo_config import get_collection
+from services.shared.projections import PROYECCION_EXISTENCIA
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Resultado en caché de datos_ya_existen (None = aún no se consulta)
+_existen_datos = None
+
+def datos_ya_existen(refrescar=False):
+    """
+    Verifica si existen empleados en la colección
+    - Devuelve True si hay datos
+    - Devuelve False si está vacío
+    - Devuelve None si hay error de conexión
+    
+    El resultado se guarda en caché; las operaciones de mongo_utils que
+    insertan o eliminan datos la invalidan
+    
+    Args:
+        refrescar: Ignorar el valor en caché y consultar de nuevo
+    """
+    global _existen_datos
+    if _existen_datos is not None and not refrescar:
+        return _existen_datos
+    
+    try:
+        collection = get_collection()
+        if collection is None:
+            logger.error("No se pudo conectar a la colección")
+            return None
+        
+        # Basta con encontrar un documento; no es necesario contar toda la colección
+        _existen_datos = collection.find_one({"empno": {"$exists": True}}, PROYECCION_EXISTENCIA) is not None
+        return _existen_datos
+
+    except Exception as e:
+        logger.error(f"Error al verificar datos existentes: {e}")
+        return None
+
+def invalidar_existencia():
+    """Descarta el resultado en caché de datos_ya_existen"""
+    global _existen_datos
+    _existen_datos = None
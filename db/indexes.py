@@ -0,0 +1,215 @@
+"""
+Gestión de índices de la colección de empleados
+Declara los índices requeridos y los reconcilia de forma idempotente, y rellena
+ename_search (la clave del índice de búsqueda por nombre) en los empleados que no lo tienen
+"""
+
+import logging
+import os
+from pymongo import ASCENDING, TEXT, UpdateOne
+from pymongo.errors import OperationFailure
+from models.employee import normalizar_nombre
+
+logger = logging.getLogger(__name__)
+
+# Motor de búsqueda por nombre: 'prefijo' (índice sobre ename_search),
+# 'texto' (índice de texto de MongoDB) o 'regex' (búsqueda parcial sin índice)
+# Se define aquí porque decide los índices requeridos; services.shared.constants lo reexporta
+MOTORES_BUSQUEDA = ("prefijo", "texto", "regex")
+MOTOR_BUSQUEDA = os.getenv("MONGO_SEARCH_ENGINE", "prefijo").lower()
+
+# Índices requeridos por las consultas de los servicios
+# Cada entrada: (nombre, claves, opciones)
+INDICES_REQUERIDOS = [
+    ("empno_unico", [("empno", ASCENDING)], {"unique": True}),
+    ("job", [("job", ASCENDING)], {}),
+    ("departamento_deptno", [("departamento.deptno", ASCENDING)], {}),
+    ("departamento_dname", [("departamento.dname", ASCENDING)], {}),
+    ("sal", [("sal", ASCENDING)], {}),
+    ("ename_search", [("ename_search", ASCENDING)], {}),
+]
+
+# El índice de texto solo se mantiene si se usa ese motor de búsqueda,
+# ya que encarece cada escritura
+if MOTOR_BUSQUEDA == "texto":
+    INDICES_REQUERIDOS.append(("ename_texto", [("ename", TEXT)], {}))
+
+# Opciones que deben coincidir para que un índice existente cumpla con el requerido
+OPCIONES_COMPARADAS = ("unique", "sparse", "partialFilterExpression", "collation", "expireAfterSeconds")
+
+def _claves_indice(claves, pesos=None):
+    """
+    Normaliza la especificación de claves de un índice para compararla
+
+    Args:
+        claves: Lista o SON de pares (campo, dirección)
+        pesos: Pesos de un índice de texto existente (index_information)
+
+    Returns:
+        tuple: Tupla de pares (campo, dirección)
+    """
+    # MongoDB reporta los índices de texto como _fts/_ftsx; los campos están en los pesos
+    if pesos:
+        return tuple((campo, TEXT) for campo in sorted(pesos))
+    if hasattr(claves, "items"):
+        claves = claves.items()
+    return tuple((campo, direccion) for campo, direccion in claves)
+
+def _opciones_indice(opciones):
+    """
+    Normaliza las opciones de un índice que cambian su comportamiento para compararlas
+    (un índice con las mismas claves pero no único, disperso o parcial no cumple el requerido)
+
+    Args:
+        opciones: Opciones requeridas o información de un índice existente (index_information)
+
+    Returns:
+        dict: Solo las opciones de OPCIONES_COMPARADAS con un valor distinto del predeterminado
+    """
+    return {
+        opcion: opciones[opcion]
+        for opcion in OPCIONES_COMPARADAS
+        if opciones.get(opcion) not in (None, False)
+    }
+
+def revisar_indices(collection):
+    """
+    Compara los índices existentes con los requeridos (claves y opciones)
+
+    Args:
+        collection: Colección de MongoDB
+
+    Returns:
+        dict: {"faltantes": [nombres], "distintos": [{"nombre", "existente", "opciones"}],
+               "sobrantes": [nombres]}; "distintos" son los requeridos cuyas claves existen
+               con otras opciones ("existente" es el nombre del índice actual)
+    """
+    existentes = {
+        _claves_indice(info["key"], info.get("weights")): (nombre, _opciones_indice(info))
+        for nombre, info in collection.index_information().items()
+        if nombre != "_id_"
+    }
+    requeridos = {
+        _claves_indice(claves): (nombre, _opciones_indice(opciones))
+        for nombre, claves, opciones in INDICES_REQUERIDOS
+    }
+
+    distintos = []
+    for claves, (nombre, opciones) in requeridos.items():
+        if claves in existentes and existentes[claves][1] != opciones:
+            existente, actuales = existentes[claves]
+            distintos.append({"nombre": nombre, "existente": existente, "opciones": actuales})
+
+    return {
+        "faltantes": [nombre for claves, (nombre, _) in requeridos.items() if claves not in existentes],
+        "distintos": distintos,
+        "sobrantes": [nombre for claves, (nombre, _) in existentes.items() if claves not in requeridos],
+    }
+
+def _reconstruir_indice(collection, nombre, claves, opciones, distinto):
+    """
+    Reemplaza un índice existente con las mismas claves pero otras opciones
+    MongoDB no admite dos índices con las mismas claves, así que se elimina antes de crearlo;
+    si la creación falla (por ejemplo, empno duplicados para un índice único) se restaura el anterior
+
+    Returns:
+        bool: True si el índice quedó como el requerido
+    """
+    collection.drop_index(distinto["existente"])
+    try:
+        collection.create_index(claves, name=nombre, **opciones)
+        return True
+    except OperationFailure as e:
+        logger.error(
+            f"❌ No se pudo reconstruir el índice '{nombre}' en '{collection.name}': {e}; "
+            f"se restaura '{distinto['existente']}' {distinto['opciones']}"
+        )
+        collection.create_index(claves, name=distinto["existente"], **distinto["opciones"])
+        return False
+
+def asegurar_indices(collection):
+    """
+    Crea los índices requeridos que falten, reconstruye los que tienen otras opciones
+    (por ejemplo, empno sin unique) y reporta los sobrantes
+    Es idempotente: si los índices ya existen como se requieren no se modifica nada
+
+    Args:
+        collection: Colección de MongoDB
+
+    Returns:
+        dict: {"creados": [nombres], "reconstruidos": [nombres], "distintos": [nombres que
+               no se pudieron reconstruir], "sobrantes": [nombres]}
+    """
+    estado = revisar_indices(collection)
+    faltantes = set(estado["faltantes"])
+    distintos = {distinto["nombre"]: distinto for distinto in estado["distintos"]}
+
+    creados = []
+    reconstruidos = []
+    sin_reconstruir = []
+    for nombre, claves, opciones in INDICES_REQUERIDOS:
+        if nombre in faltantes:
+            collection.create_index(claves, name=nombre, **opciones)
+            creados.append(nombre)
+        elif nombre in distintos:
+            if _reconstruir_indice(collection, nombre, claves, opciones, distintos[nombre]):
+                reconstruidos.append(nombre)
+            else:
+                sin_reconstruir.append(nombre)
+
+    if creados:
+        logger.info(f"📊 Índices creados en '{collection.name}': {', '.join(creados)}")
+    if reconstruidos:
+        logger.info(f"📊 Índices reconstruidos con las opciones requeridas en '{collection.name}': {', '.join(reconstruidos)}")
+    if estado["sobrantes"]:
+        logger.warning(
+            f"⚠️ Índices no declarados en '{collection.name}': {', '.join(estado['sobrantes'])}"
+        )
+
+    return {"creados": creados, "reconstruidos": reconstruidos, "distintos": sin_reconstruir, "sobrantes": estado["sobrantes"]}
+
+def rellenar_ename_search(collection=None, tamano_lote=1000, completo=False, simular=False):
+    """
+    Calcula el campo ename_search en los empleados que no lo tienen
+    Necesario para datos insertados antes de la búsqueda por prefijo
+    
+    Args:
+        collection: Colección de MongoDB (por defecto la configurada)
+        tamano_lote: Número de actualizaciones por bulk_write
+        completo: Revisar todos los empleados y corregir los que tengan un valor distinto
+                  al de normalizar_nombre (por ejemplo, acentos de datos cargados con $toLower)
+        simular: Solo contar los empleados que cambiarían
+        
+    Returns:
+        int: Número de documentos actualizados (o que se actualizarían al simular)
+    """
+    if collection is None:
+        from db.mongo_config import get_collection
+        collection = get_collection()
+    if collection is None:
+        return 0
+    
+    actualizados = 0
+    lote = []
+    # {"ename_search": None} también encuentra los documentos sin el campo y usa su índice
+    filtro = {} if completo else {"ename_search": None}
+    cursor = collection.find(filtro, {"_id": 1, "ename": 1, "ename_search": 1}).batch_size(tamano_lote)
+    
+    for doc in cursor:
+        normalizado = normalizar_nombre(doc.get("ename"))
+        if doc.get("ename_search") == normalizado and "ename_search" in doc:
+            continue
+        if simular:
+            actualizados += 1
+            continue
+        lote.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"ename_search": normalizado}}))
+        if len(lote) >= tamano_lote:
+            actualizados += collection.bulk_write(lote, ordered=False).modified_count
+            lote = []
+    
+    if lote:
+        actualizados += collection.bulk_write(lote, ordered=False).modified_count
+    
+    if actualizados and not simular:
+        logger.info(f"🔤 Campo ename_search calculado en {actualizados} empleados")
+    return actualizados
@@ -0,0 +1,155 @@
+"""
+Migración entre el almacenamiento de departamentos embebido y el normalizado
+Ambas direcciones se resuelven con pocas escrituras del lado del servidor:
+una actualización múltiple por departamento, sin traer los empleados al cliente
+
+Uso (desde la raíz del proyecto):
+    python -m db.migrate_departments normalizar
+    python -m db.migrate_departments embeber
+    python -m db.migrate_departments normalizar --simular
+"""
+import argparse
+import logging
+import time
+from db.mongo_config import get_collection, close_connection
+from services.shared.cache import cache_empleados
+from services.shared.catalog import catalogo, PIPELINE_DEPARTAMENTOS
+from services.shared.departments import coleccion_departamentos, operaciones_alta, preparar_departamentos
+
+logger = logging.getLogger(__name__)
+
+# Empleados que todavía guardan una copia del departamento
+FILTRO_EMBEBIDOS = {"$or": [
+    {"departamento.dname": {"$exists": True}},
+    {"departamento.loc": {"$exists": True}},
+]}
+
+def departamentos_embebidos(collection):
+    """
+    Obtiene los departamentos distintos copiados en los empleados
+    Si un deptno tiene copias distintas se conserva la primera y se reporta el conflicto
+
+    Returns:
+        tuple: (lista de departamentos, lista de deptno con copias distintas)
+    """
+    conflictos = [
+        doc["_id"]
+        for doc in collection.aggregate([
+            {"$match": {"departamento.deptno": {"$exists": True}}},
+            {"$group": {
+                "_id": "$departamento.deptno",
+                "variantes": {"$addToSet": {"dname": "$departamento.dname", "loc": "$departamento.loc"}},
+            }},
+            {"$match": {"variantes.1": {"$exists": True}}},
+        ])
+    ]
+    departamentos = [
+        {"deptno": doc["_id"], "dname": doc.get("dname"), "loc": doc.get("loc")}
+        for doc in collection.aggregate(PIPELINE_DEPARTAMENTOS)
+        if doc.get("dname")
+    ]
+    return departamentos, conflictos
+
+def normalizar(collection, simular=False):
+    """
+    Pasa al modo normalizado: crea los departamentos en su colección y deja en cada
+    empleado solo departamento.deptno
+
+    Args:
+        collection: Colección de empleados
+        simular: Solo reportar lo que se haría
+
+    Returns:
+        dict: {"departamentos", "conflictos", "empleados", "segundos"}
+    """
+    inicio = time.perf_counter()
+    departamentos, conflictos = departamentos_embebidos(collection)
+    resumen = {
+        "departamentos": len(departamentos),
+        "conflictos": conflictos,
+        "empleados": collection.count_documents(FILTRO_EMBEBIDOS),
+    }
+    if simular:
+        resumen["segundos"] = time.perf_counter() - inicio
+        return resumen
+
+    # Los departamentos se crean antes de quitar las copias para no perder datos;
+    # las copias tienen prioridad sobre los predefinidos
+    if departamentos:
+        coleccion_departamentos(collection).bulk_write(operaciones_alta(departamentos), ordered=False)
+    preparar_departamentos(collection)
+    resultado = collection.update_many(FILTRO_EMBEBIDOS, {"$unset": {"departamento.dname": "", "departamento.loc": ""}})
+    resumen["empleados"] = resultado.modified_count
+
+    cache_empleados.limpiar()
+    catalogo.refrescar()
+    resumen["segundos"] = time.perf_counter() - inicio
+    return resumen
+
+def embeber(collection, simular=False):
+    """
+    Pasa al modo embebido: copia nombre y ubicación de cada departamento en sus empleados
+    La colección de departamentos se conserva
+
+    Args:
+        collection: Colección de empleados
+        simular: Solo reportar lo que se haría
+
+    Returns:
+        dict: {"departamentos", "empleados", "segundos"}
+    """
+    inicio = time.perf_counter()
+    departamentos = list(coleccion_departamentos(collection).find({}, {"_id": 0}))
+    resumen = {"departamentos": len(departamentos), "empleados": 0}
+
+    for dept in departamentos:
+        filtro = {"departamento.deptno": dept["deptno"]}
+        if simular:
+            resumen["empleados"] += collection.count_documents(filtro)
+            continue
+        # Una actualización por departamento, resuelta con el índice de departamento.deptno
+        resultado = collection.update_many(filtro, {"$set": {
+            "departamento.dname": dept.get("dname"),
+            "departamento.loc": dept.get("loc"),
+        }})
+        resumen["empleados"] += resultado.modified_count
+
+    if not simular:
+        cache_empleados.limpiar()
+        catalogo.refrescar()
+    resumen["segundos"] = time.perf_counter() - inicio
+    return resumen
+
+def main():
+    parser = argparse.ArgumentParser(description="Migra el almacenamiento de departamentos")
+    parser.add_argument("direccion", choices=("normalizar", "embeber"), help="Modo de destino")
+    parser.add_argument("--simular", action="store_true", help="Solo mostrar cuántos documentos cambiarían")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    collection = get_collection()
+    if collection is None:
+        print("❌ No se pudo conectar a la base de datos")
+        return 1
+
+    try:
+        if args.direccion == "normalizar":
+            resumen = normalizar(collection, args.simular)
+            modo = "normalizado"
+        else:
+            resumen = embeber(collection, args.simular)
+            modo = "embebido"
+    finally:
+        close_connection()
+
+    verbo = "se modificarían" if args.simular else "modificados"
+    print(f"🏢 Departamentos: {resumen['departamentos']}")
+    print(f"👥 Empleados {verbo}: {resumen['empleados']:,} ({resumen['segundos']:.2f}s)")
+    if resumen.get("conflictos"):
+        print(f"⚠️ Departamentos con copias distintas (se conservó una): {', '.join(map(str, resumen['conflictos']))}")
+    if not args.simular:
+        print(f"💡 Usa MONGO_DEPT_MODE={modo} en .env para trabajar con este modo")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
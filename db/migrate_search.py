@@ -0,0 +1,41 @@
+"""
+Migración del campo ename_search de la búsqueda por nombre
+Recalcula ename_search con normalizar_nombre en todos los empleados que no lo
+tienen o que lo tienen distinto (por ejemplo, datos cargados con $toLower, que
+conserva los acentos). No depende de la creación del índice, así que también
+sirve con MONGO_AUTO_INDEXES=0
+
+Uso (desde la raíz del proyecto):
+    python -m db.migrate_search
+    python -m db.migrate_search --simular
+"""
+import argparse
+import logging
+import time
+from db.mongo_config import get_collection, close_connection
+from db.indexes import rellenar_ename_search
+
+def main():
+    parser = argparse.ArgumentParser(description="Recalcula ename_search en los empleados")
+    parser.add_argument("--simular", action="store_true", help="Solo mostrar cuántos empleados cambiarían")
+    parser.add_argument("--lote", type=int, default=1000, help="Actualizaciones por bulk_write")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    collection = get_collection()
+    if collection is None:
+        print("❌ No se pudo conectar a la base de datos")
+        return 1
+
+    inicio = time.perf_counter()
+    try:
+        cambios = rellenar_ename_search(collection, args.lote, completo=True, simular=args.simular)
+    finally:
+        close_connection()
+
+    verbo = "se modificarían" if args.simular else "modificados"
+    print(f"🔤 Empleados {verbo}: {cambios:,} ({time.perf_counter() - inicio:.2f}s)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
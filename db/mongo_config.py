@@ -4,31 +4,29 @@ Maneja conexiones persistentes con timeouts configurados
 """
 
 import os
+import importlib.util
 from pymongo import MongoClient
 from pathlib import Path
-from dotenv import load_dotenv, find_dotenv
+from dotenv import load_dotenv
 import logging
 import sys
+import threading
 
-
-
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
+# El logging lo configura el punto de entrada (main.py, cli, etc.)
 logger = logging.getLogger(__name__)
 
-# Cargar variables de entorno
+# Cargar variables de entorno (una sola vez) desde la raíz del proyecto
 dotenv_path = Path(__file__).resolve().parent.parent / ".env"
-load_dotenv(dotenv_path, encoding='utf-8')
 
 # Intentar cargar .env con diferentes codificaciones
 try:
     # Primero intentar con UTF-8
-    load_dotenv(find_dotenv(), encoding='utf-8')
+    load_dotenv(dotenv_path, encoding='utf-8')
 except UnicodeDecodeError:
     try:
         # Si falla, intentar con Latin-1 (compatible con español)
         logger.warning("⚠️ Error con UTF-8, intentando Latin-1")
-        load_dotenv(find_dotenv(), encoding='latin-1')
+        load_dotenv(dotenv_path, encoding='latin-1')
     except Exception as e:
         logger.error(f"❌ Error fatal al cargar .env: {e}")
         sys.exit(1)
@@ -36,6 +34,66 @@ except Exception as e:
     logger.error(f"❌ Error al cargar .env: {e}")
     sys.exit(1)
 
+# Opciones del pool configurables desde .env: variable -> (opción de PyMongo, tipo)
+OPCIONES_POOL = {
+    "MONGO_MAX_POOL_SIZE": ("maxPoolSize", int),
+    "MONGO_MIN_POOL_SIZE": ("minPoolSize", int),
+    "MONGO_MAX_IDLE_TIME_MS": ("maxIdleTimeMS", int),
+    "MONGO_WAIT_QUEUE_TIMEOUT_MS": ("waitQueueTimeoutMS", int),
+    "MONGO_READ_PREFERENCE": ("readPreference", str),
+}
+
+# Módulo y paquete pip que requiere cada compresor (zlib viene con Python)
+COMPRESORES = {"zstd": ("zstandard", "zstandard"), "snappy": ("snappy", "python-snappy"), "zlib": None}
+
+def _compresores_disponibles(valor):
+    """
+    Filtra la lista de compresores dejando solo los que se pueden usar
+    
+    Args:
+        valor: Lista separada por comas, por ejemplo 'zstd,snappy,zlib'
+        
+    Returns:
+        list: Compresores en el orden de preferencia indicado
+    """
+    compresores = []
+    for nombre in (c.strip().lower() for c in valor.split(",") if c.strip()):
+        if nombre not in COMPRESORES:
+            logger.warning(f"⚠️ Compresor desconocido ignorado: {nombre}")
+        elif COMPRESORES[nombre] and importlib.util.find_spec(COMPRESORES[nombre][0]) is None:
+            logger.warning(f"⚠️ Compresor '{nombre}' ignorado: instala el paquete '{COMPRESORES[nombre][1]}'")
+        else:
+            compresores.append(nombre)
+    return compresores
+
+def opciones_cliente():
+    """
+    Construye las opciones de MongoClient a partir de las variables de entorno
+    Las opciones no definidas usan los valores por defecto de PyMongo
+    
+    Returns:
+        dict: Argumentos de palabra clave para MongoClient / AsyncIOMotorClient
+    """
+    opciones = {
+        "serverSelectionTimeoutMS": 5000,  # Timeout para selección de servidor
+        "connectTimeoutMS": 10000,         # Timeout para conexión inicial
+        "socketTimeoutMS": 20000,          # Timeout para operaciones
+    }
+    
+    for variable, (opcion, tipo) in OPCIONES_POOL.items():
+        valor = os.getenv(variable)
+        if valor:
+            try:
+                opciones[opcion] = tipo(valor)
+            except ValueError:
+                logger.warning(f"⚠️ Valor inválido para {variable}: {valor}")
+    
+    compresores = _compresores_disponibles(os.getenv("MONGO_COMPRESSORS", ""))
+    if compresores:
+        opciones["compressors"] = compresores
+    
+    return opciones
+
 class MongoDBConnection:
     """
     Clase Singleton para gestionar la conexión a MongoDB
@@ -43,6 +101,8 @@ class MongoDBConnection:
     """
     _instance = None
     _client = None
+    _opciones = {}
+    _lock = threading.Lock()
     
     def __new__(cls):
         """Implementación del patrón Singleton"""
@@ -57,22 +117,39 @@ class MongoDBConnection:
         Returns:
             MongoClient: Instancia del cliente de MongoDB
         """
-        if self._client is None:
+        if self._client is not None:
+            return self._client
+        
+        # Solo un hilo crea la conexión (puede iniciarse en segundo plano)
+        with self._lock:
+            if self._client is not None:
+                return self._client
+            
+            client = None
             try:
                 # Obtener URI de conexión desde variables de entorno
                 mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
                 
-                # Crear conexión con timeouts configurados
-                self._client = MongoClient(
+                # Crear conexión con timeouts, pool y compresión configurados
+                from db.pool_monitor import estadisticas_pool
+                from db.command_monitor import latencias_comandos, MONITOREAR_COMANDOS
+                self._opciones = opciones_cliente()
+                listeners = [estadisticas_pool]
+                if MONITOREAR_COMANDOS:
+                    listeners.append(latencias_comandos)
+                client = MongoClient(
                     mongo_uri,
-                    serverSelectionTimeoutMS=5000,  # Timeout para selección de servidor
-                    connectTimeoutMS=10000,         # Timeout para conexión inicial
-                    socketTimeoutMS=20000           # Timeout para operaciones
+                    event_listeners=listeners,
+                    **self._opciones
                 )
                 
                 # Verificar conexión con un comando simple
-                self._client.admin.command('ping')
-                logger.info("✅ Conexión a MongoDB exitosa: {mongo_uri}")
+                client.admin.command('ping')
+                logger.info(f"✅ Conexión a MongoDB exitosa: {mongo_uri}")
+                
+                # Reconciliar índices de la colección en la primera conexión
+                self._inicializar_indices(client)
+                self._client = client
                 
             except Exception as e:
                 logger.error(f"❌ Error al conectar a MongoDB: {e}")
@@ -80,10 +157,65 @@ class MongoDBConnection:
                 logger.info("1. Verifica que MongoDB esté corriendo")
                 logger.info("2. Ejecuta 'docker-compose up -d' si usas Docker")
                 logger.info("3. Revisa tu configuración en .env")
+                if client is not None:
+                    client.close()
                 self._client = None
                 
         return self._client
     
+    def _inicializar_indices(self, client):
+        """
+        Asegura los índices requeridos en la colección configurada
+        Se puede desactivar con MONGO_AUTO_INDEXES=0
+        
+        Args:
+            client: Cliente recién conectado
+        """
+        if os.getenv("MONGO_AUTO_INDEXES", "1") == "0":
+            return
+        try:
+            from db.indexes import asegurar_indices, rellenar_ename_search
+            
+            db_name = os.getenv("MONGO_DB", "empresa_db")
+            collection_name = os.getenv("MONGO_COLLECTION", "rh")
+            collection = client[db_name][collection_name]
+            asegurar_indices(collection)
+            
+            # Empleados sin ename_search (datos previos a la búsqueda por prefijo o
+            # insertados por otros medios); la consulta usa el índice, así que es barata
+            rellenar_ename_search(collection)
+            
+            from services.shared.departments import modo_normalizado, preparar_departamentos
+            if modo_normalizado():
+                preparar_departamentos(collection)
+        except Exception as e:
+            # Un fallo al crear índices no debe impedir usar la aplicación
+            logger.error(f"❌ Error al verificar índices: {e}")
+    
+    def diagnostico(self):
+        """
+        Devuelve la configuración activa del pool y sus estadísticas en vivo
+        
+        Returns:
+            dict: {"conectado", "configuracion", "pool"} 
+        """
+        from db.pool_monitor import estadisticas_pool
+        
+        if self._client is None:
+            return {"conectado": False, "configuracion": opciones_cliente(), "pool": estadisticas_pool.estadisticas()}
+        
+        pool = self._client.options.pool_options
+        configuracion = dict(self._opciones)
+        configuracion.update({
+            "maxPoolSize": pool.max_pool_size,
+            "minPoolSize": pool.min_pool_size,
+            "maxIdleTimeMS": None if pool.max_idle_time_seconds is None else int(pool.max_idle_time_seconds * 1000),
+            "waitQueueTimeoutMS": None if pool.wait_queue_timeout is None else int(pool.wait_queue_timeout * 1000),
+            "readPreference": self._client.read_preference.name,
+            "compressors": configuracion.get("compressors", []),
+        })
+        return {"conectado": True, "configuracion": configuracion, "pool": estadisticas_pool.estadisticas()}
+    
     def close_connection(self):
         """Cierra la conexión activa a MongoDB"""
         if self._client:
@@ -103,6 +235,18 @@ def get_connection():
     """
     return db_connection.get_connection()
 
+def iniciar_conexion_en_segundo_plano():
+    """
+    Inicia la conexión (ping e índices) en un hilo de fondo
+    Permite mostrar la interfaz mientras se establece la conexión
+    
+    Returns:
+        Thread: Hilo de conexión; usar join() antes de necesitar el resultado
+    """
+    hilo = threading.Thread(target=get_connection, name="mongo-connect", daemon=True)
+    hilo.start()
+    return hilo
+
 def get_database():
     """
     Obtiene la base de datos configurada
@@ -139,6 +283,25 @@ def get_collection():
         logger.error(f"❌ Error al obtener la colección: {e}")
         return None
 
+def diagnostico_conexion():
+    """
+    Configuración activa del pool de conexiones y estadísticas en vivo
+    
+    Returns:
+        dict: {"conectado", "configuracion", "pool"}
+    """
+    return db_connection.diagnostico()
+
+def latencias_operaciones():
+    """
+    Percentiles de latencia por comando y por función desde que inició el proceso
+    
+    Returns:
+        dict: Ver LatenciasComandos.estadisticas()
+    """
+    from db.command_monitor import latencias_comandos
+    return latencias_comandos.estadisticas()
+
 def close_connection():
     """Función pública para cerrar la conexión a MongoDB"""
     db_connection.close_connection()
\ No newline at end of file
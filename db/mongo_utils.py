@@ -3,30 +3,24 @@ Utilidades para operaciones específicas con MongoDB
 Incluye funciones para datos de prueba y mantenimiento
 """
 
-from db.mongo_config import get_collection
+from db.command_monitor import imprimir_latencias
+# datos_ya_existen se reexporta para quienes la importaban desde este módulo
+from db.data_status import datos_ya_existen, invalidar_existencia
+from db.mongo_config import get_collection, get_connection, diagnostico_conexion, latencias_operaciones
+# rellenar_ename_search se reexporta para quienes la importaban desde este módulo
+from db.indexes import asegurar_indices, rellenar_ename_search
+from db.seed import cargar_datos_scott
+from models.employee import normalizar_nombre
+from services.shared.projections import PROYECCION_EXISTENCIA
+from services.reports.pending import marcar_departamentos, deptnos_de, deptnos_actuales, TODOS
+from services.shared.cache import cache_empleados
+from services.shared.change_stream import vigilante_cambios
+from services.shared.catalog import catalogo
+from services.shared.departments import para_guardar
 import logging
 
 logger = logging.getLogger(__name__)
 
-def datos_ya_existen():
-    """
-    Verifica si existen empleados en la colección
-    - Devuelve True si hay datos
-    - Devuelve False si está vacío
-    - Devuelve None si hay error de conexión
-    """
-    try:
-        collection = get_collection()
-        if collection is None:
-            logger.error("No se pudo conectar a la colección")
-            return None
-        
-        return collection.count_documents({"empno": {"$exists": True}}) > 0
-
-    except Exception as e:
-        logger.error(f"Error al verificar datos existentes: {e}")
-        return None
-
 def insertar_datos_prueba():
     """
     Inserta datos de prueba del esquema SCOTT adaptado a MongoDB
@@ -42,15 +36,16 @@ def insertar_datos_prueba():
             print("❌ No se pudo conectar a la colección")
             return False
         
-        # IDs de empleados de prueba
-        empno_prueba = [7369, 7499, 7521, 7566, 7654, 7698, 
-                        7782, 7788, 7839, 7844, 7876, 7900, 7902, 7934]
+        empleados = _generar_datos_prueba()
         
-        # Verificar cuáles ya existen
-        empno_existentes = set()
-        for empno in empno_prueba:
-            if collection.find_one({"empno": empno}):
-                empno_existentes.add(empno)
+        # Verificar cuáles ya existen con una sola consulta
+        empno_existentes = sorted(
+            doc["empno"]
+            for doc in collection.find(
+                {"empno": {"$in": [empleado["empno"] for empleado in empleados]}},
+                PROYECCION_EXISTENCIA
+            )
+        )
         
         # Manejar empleados existentes
         if empno_existentes:
@@ -61,11 +56,18 @@ def insertar_datos_prueba():
                 return False
             
             # Eliminar solo los existentes
-            collection.delete_many({"empno": {"$in": list(empno_existentes)}})
+            marcar_departamentos(collection, deptnos_actuales(collection, empno_existentes))
+            collection.delete_many({"empno": {"$in": empno_existentes}})
+            cache_empleados.limpiar()
 
         # Insertar datos de prueba
-        empleados = _generar_datos_prueba()
-        result = collection.insert_many(empleados)
+        for empleado in empleados:
+            empleado["ename_search"] = normalizar_nombre(empleado["ename"])
+        result = collection.insert_many([para_guardar(empleado) for empleado in empleados])
+        invalidar_existencia()
+        for empleado in empleados:
+            catalogo.registrar_empleado(empleado)
+        marcar_departamentos(collection, deptnos_de(empleados))
         print(f"✅ Se insertaron {len(result.inserted_ids)} empleados correctamente")
         return True
 
@@ -76,85 +78,90 @@ def insertar_datos_prueba():
 
 def _generar_datos_prueba():
     """
-    Genera la lista de empleados de prueba
+    Genera la lista de empleados de prueba (esquema SCOTT compartido con init-mongo.js)
     
     Returns:
         list: Lista de diccionarios con datos de empleados
     """
-    return [
-        {
-            "empno": 7369, "ename": "SMITH", "job": "CLERK", "sal": 800,
-            "departamento": {"deptno": 20, "dname": "RESEARCH", "loc": "DALLAS"}
-        },
-        {
-            "empno": 7499, "ename": "ALLEN", "job": "SALESMAN", "sal": 1600,
-            "departamento": {"deptno": 30, "dname": "SALES", "loc": "CHICAGO"}
-        },
-        {
-            "empno": 7521, "ename": "WARD", "job": "SALESMAN", "sal": 1250,
-            "departamento": {"deptno": 30, "dname": "SALES", "loc": "CHICAGO"}
-        },
-        {
-            "empno": 7566, "ename": "JONES", "job": "MANAGER", "sal": 2975,
-            "departamento": {"deptno": 20, "dname": "RESEARCH", "loc": "DALLAS"}
-        },
-        {
-            "empno": 7654, "ename": "MARTIN", "job": "SALESMAN", "sal": 1250,
-            "departamento": {"deptno": 30, "dname": "SALES", "loc": "CHICAGO"}
-        },
-        {
-            "empno": 7698, "ename": "BLAKE", "job": "MANAGER", "sal": 2850,
-            "departamento": {"deptno": 30, "dname": "SALES", "loc": "CHICAGO"}
-        },
-        {
-            "empno": 7782, "ename": "CLARK", "job": "MANAGER", "sal": 2450,
-            "departamento": {"deptno": 10, "dname": "ACCOUNTING", "loc": "NEW YORK"}
-        },
-        {
-            "empno": 7788, "ename": "SCOTT", "job": "ANALYST", "sal": 3000,
-            "departamento": {"deptno": 20, "dname": "RESEARCH", "loc": "DALLAS"}
-        },
-        {
-            "empno": 7839, "ename": "KING", "job": "PRESIDENT", "sal": 5000,
-            "departamento": {"deptno": 10, "dname": "ACCOUNTING", "loc": "NEW YORK"}
-        },
-        {
-            "empno": 7844, "ename": "TURNER", "job": "SALESMAN", "sal": 1500,
-            "departamento": {"deptno": 30, "dname": "SALES", "loc": "CHICAGO"}
-        },
-        {
-            "empno": 7876, "ename": "ADAMS", "job": "CLERK", "sal": 1100,
-            "departamento": {"deptno": 20, "dname": "RESEARCH", "loc": "DALLAS"}
-        },
-        {
-            "empno": 7900, "ename": "JAMES", "job": "CLERK", "sal": 950,
-            "departamento": {"deptno": 30, "dname": "SALES", "loc": "CHICAGO"}
-        },
-        {
-            "empno": 7902, "ename": "FORD", "job": "ANALYST", "sal": 3000,
-            "departamento": {"deptno": 20, "dname": "RESEARCH", "loc": "DALLAS"}
-        },
-        {
-            "empno": 7934, "ename": "MILLER", "job": "CLERK", "sal": 1300,
-            "departamento": {"deptno": 10, "dname": "ACCOUNTING", "loc": "NEW YORK"}
-        }
-    ]
+    return cargar_datos_scott()
 
-def limpiar_coleccion():
+def limpiar_coleccion(rapido=False):
     """
     Elimina todos los documentos de la colección
     
+    Args:
+        rapido: Borrar la colección completa (drop) y recrearla con sus opciones e índices,
+                en lugar de eliminar documento por documento con delete_many
+    
     Returns:
         bool: True si se eliminaron documentos, False en caso de error
     """
     try:
         collection = get_collection()
         if collection is not None:
-            result = collection.delete_many({})
-            print(f"✅ Se eliminaron {result.deleted_count} documentos")
+            if rapido:
+                eliminados = _recrear_coleccion(collection)
+            else:
+                eliminados = collection.delete_many({}).deleted_count
+            invalidar_existencia()
+            cache_empleados.limpiar()
+            catalogo.refrescar()
+            marcar_departamentos(collection, [TODOS])
+            print(f"✅ Se eliminaron {eliminados} documentos")
             return True
         return False
     except Exception as e:
         logger.error(f"Error al limpiar la colección: {e}")
         print("❌ Error al limpiar la colección:", e)
-        return False
\ No newline at end of file
+        return False
+
+def _recrear_coleccion(collection):
+    """
+    Borra la colección y la vuelve a crear con las mismas opciones y los índices requeridos
+    Un drop libera el espacio de inmediato y escribe una sola entrada en el oplog
+    
+    Args:
+        collection: Colección de empleados
+        
+    Returns:
+        int: Documentos que tenía la colección (estimado por sus metadatos)
+    """
+    # Opciones como validadores o changeStreamPreAndPostImages se conservan
+    opciones = collection.options()
+    eliminados = collection.estimated_document_count()
+    collection.drop()
+    collection.database.create_collection(collection.name, **opciones)
+    asegurar_indices(collection)
+    return eliminados
+
+
+def mostrar_diagnostico():
+    """
+    Muestra la configuración del pool de conexiones y sus estadísticas en vivo
+    """
+    get_connection()
+    diagnostico = diagnostico_conexion()
+    
+    print("\n🩺 Diagnóstico de conexión")
+    print("-" * 60)
+    print(f"Conectado: {'✅ Sí' if diagnostico['conectado'] else '❌ No'}")
+    
+    print("\n⚙️ Configuración del pool:")
+    for opcion, valor in diagnostico["configuracion"].items():
+        print(f"   {opcion}: {valor}")
+    
+    print("\n📈 Estadísticas del pool:")
+    for nombre, valor in diagnostico["pool"].items():
+        print(f"   {nombre}: {valor}")
+    
+    print("\n🗃️ Caché de empleados:")
+    for nombre, valor in cache_empleados.estadisticas().items():
+        print(f"   {nombre}: {valor}")
+    
+    estado = "✅ Activa" if vigilante_cambios.activo else "❌ Inactiva (requiere replica set)"
+    print(f"\n🔄 Vigilancia de cambios: {estado}")
+    print(f"   cambios procesados: {vigilante_cambios.procesados}")
+    
+    print("\n⏱️ Latencia por operación:")
+    imprimir_latencias(latencias_operaciones())
+    print("-" * 60)
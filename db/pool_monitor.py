@@ -0,0 +1,96 @@
+"""
+Estadísticas en vivo del pool de conexiones de PyMongo
+Se registran mediante un ConnectionPoolListener al crear el cliente
+"""
+
+import threading
+from pymongo import monitoring
+
+class EstadisticasPool(monitoring.ConnectionPoolListener):
+    """
+    Contadores del pool de conexiones, actualizados por los eventos de PyMongo
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Pone todos los contadores en cero"""
+        with self._lock:
+            self.conexiones_abiertas = 0
+            self.conexiones_creadas = 0
+            self.conexiones_cerradas = 0
+            self.en_uso = 0
+            self.max_en_uso = 0
+            self.checkouts = 0
+            self.checkouts_fallidos = 0
+            self.pools_vaciados = 0
+
+    def estadisticas(self):
+        """
+        Devuelve una copia de los contadores
+
+        Returns:
+            dict: Conexiones abiertas, en uso, máximo en uso y fallos de checkout
+        """
+        with self._lock:
+            return {
+                "conexiones_abiertas": self.conexiones_abiertas,
+                "conexiones_creadas": self.conexiones_creadas,
+                "conexiones_cerradas": self.conexiones_cerradas,
+                "en_uso": self.en_uso,
+                "max_en_uso": self.max_en_uso,
+                "checkouts": self.checkouts,
+                "checkouts_fallidos": self.checkouts_fallidos,
+                "pools_vaciados": self.pools_vaciados,
+            }
+
+    # Eventos del pool
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pools_vaciados += 1
+
+    def pool_closed(self, event):
+        pass
+
+    # Eventos de conexiones
+    def connection_created(self, event):
+        with self._lock:
+            self.conexiones_creadas += 1
+            self.conexiones_abiertas += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.conexiones_cerradas += 1
+            self.conexiones_abiertas = max(0, self.conexiones_abiertas - 1)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        # Incluye los timeouts de waitQueueTimeoutMS (pool agotado)
+        with self._lock:
+            self.checkouts_fallidos += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checkouts += 1
+            self.en_uso += 1
+            self.max_en_uso = max(self.max_en_uso, self.en_uso)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.en_uso = max(0, self.en_uso - 1)
+
+# Instancia global registrada en el cliente síncrono
+estadisticas_pool = EstadisticasPool()
@@ -0,0 +1,214 @@
+"""
+Auditoría de los planes de consulta de los servicios
+Ejecuta explain("executionStats") de cada forma de consulta registrada contra los
+datos actuales y reporta la etapa de acceso (IXSCAN, COLLSCAN, ...), documentos
+examinados contra devueltos y tiempo. Termina con código 1 si una consulta crítica
+recorre la colección completa, para detectar índices faltantes antes de que se
+note en la latencia
+
+Uso (desde la raíz del proyecto):
+    python -m db.query_audit
+    python -m db.query_audit --json
+
+Códigos de salida:
+    0  Todas las consultas críticas usan un índice
+    1  Alguna consulta crítica hace COLLSCAN
+    4  No hay conexión con MongoDB
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from db.indexes import revisar_indices
+from db.mongo_config import get_collection, close_connection
+from services.search.queries import (
+    filtro_por_id, filtro_por_nombre, orden_por_nombre, filtro_por_puesto, filtro_por_departamento
+)
+from services.shared.catalog import catalogo
+from services.shared.constants import MOTOR_BUSQUEDA, TAMANO_PAGINA
+from services.shared.projections import PROYECCION_LISTA, PROYECCION_DETALLE, PROYECCION_EXISTENCIA
+
+logger = logging.getLogger(__name__)
+
+EXITO = 0
+HAY_COLLSCAN = 1
+SIN_CONEXION = 4
+
+# Documentos examinados por cada devuelto a partir de los cuales se advierte
+PROPORCION_ADVERTENCIA = 10
+
+def _muestra(collection):
+    """
+    Valores reales para armar las consultas (el primer empleado por empno)
+
+    Returns:
+        dict: {"empno", "nombre", "job", "dname"} (valores de ejemplo si la colección está vacía)
+    """
+    documento = collection.find_one({}, {"_id": 0, "empno": 1, "ename": 1, "job": 1, "departamento": 1}, sort=[("empno", 1)]) or {}
+    dept = documento.get("departamento") or {}
+    dname = dept.get("dname") or (catalogo.departamento(dept.get("deptno"), collection) or {}).get("dname")
+    return {
+        "empno": documento.get("empno", 7369),
+        "nombre": (documento.get("ename") or "SMITH")[:3],
+        "job": documento.get("job") or "CLERK",
+        "dname": (dname or "RESEARCH")[:3],
+    }
+
+def formas_consulta(collection):
+    """
+    Formas de consulta que ejecutan los servicios, armadas con los mismos constructores
+    de filtros que usan (si un constructor cambia, la auditoría revisa el cambio)
+
+    Args:
+        collection: Colección de empleados
+
+    Returns:
+        list: {"nombre", "critica", "comando"} donde comando es el comando a explicar
+    """
+    muestra = _muestra(collection)
+    nombre = collection.name
+
+    def find(filtro, proyeccion, sort=None, limit=None):
+        comando = {"find": nombre, "filter": filtro, "projection": proyeccion}
+        if sort:
+            comando["sort"] = dict(sort)
+        if limit:
+            comando["limit"] = limit
+        return comando
+
+    formas = [
+        ("empno", True, find(filtro_por_id(muestra["empno"]), PROYECCION_DETALLE, limit=1)),
+        ("existencia", True, find({"empno": {"$in": [muestra["empno"]]}}, PROYECCION_EXISTENCIA)),
+        ("pagina", True, find({"empno": {"$gt": muestra["empno"]}}, PROYECCION_LISTA, [("empno", 1)], TAMANO_PAGINA + 1)),
+        # Con el motor 'regex' la búsqueda parcial no puede usar un índice: se reporta sin fallar
+        ("nombre", MOTOR_BUSQUEDA != "regex",
+         find(filtro_por_nombre(muestra["nombre"]), PROYECCION_LISTA, orden_por_nombre())),
+        ("puesto", True, find(filtro_por_puesto(muestra["job"]), PROYECCION_LISTA)),
+        ("departamento", True, find(filtro_por_departamento(muestra["dname"]), PROYECCION_LISTA)),
+        ("distinct_deptno", True,
+         {"distinct": nombre, "key": "departamento.deptno", "query": {"empno": {"$in": [muestra["empno"]]}}}),
+    ]
+    return [{"nombre": n, "critica": critica, "comando": comando} for n, critica, comando in formas]
+
+def _etapas(plan, etapas=None, indices=None):
+    """Recorre un plan (o cualquier parte del explain) y junta etapas e índices usados"""
+    etapas = [] if etapas is None else etapas
+    indices = [] if indices is None else indices
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            etapas.append(plan["stage"])
+            if plan.get("indexName"):
+                indices.append(plan["indexName"])
+        for valor in plan.values():
+            _etapas(valor, etapas, indices)
+    elif isinstance(plan, list):
+        for valor in plan:
+            _etapas(valor, etapas, indices)
+    return etapas, indices
+
+def analizar_explain(explain):
+    """
+    Resume la salida de explain con verbosidad executionStats
+
+    Args:
+        explain: Respuesta del comando explain
+
+    Returns:
+        dict: {"acceso", "etapas", "indices", "examinados", "llaves", "devueltos", "ms"}
+    """
+    planificador = explain.get("queryPlanner", {})
+    etapas, indices = _etapas(planificador.get("winningPlan", {}))
+    estadisticas = explain.get("executionStats", {})
+    if "COLLSCAN" in etapas:
+        acceso = "COLLSCAN"
+    elif indices:
+        acceso = "IXSCAN"
+    else:
+        acceso = etapas[-1] if etapas else "?"
+    return {
+        "acceso": acceso,
+        "etapas": etapas,
+        "indices": list(dict.fromkeys(indices)),
+        "examinados": estadisticas.get("totalDocsExamined", 0),
+        "llaves": estadisticas.get("totalKeysExamined", 0),
+        "devueltos": estadisticas.get("nReturned", 0),
+        "ms": estadisticas.get("executionTimeMillis", 0),
+    }
+
+def auditar(collection):
+    """
+    Explica cada forma de consulta registrada
+
+    Args:
+        collection: Colección de empleados
+
+    Returns:
+        list: Una fila por forma: {"nombre", "critica", "falla", "advertencia", ...analizar_explain}
+    """
+    filas = []
+    for forma in formas_consulta(collection):
+        explain = collection.database.command({"explain": forma["comando"], "verbosity": "executionStats"})
+        fila = {"nombre": forma["nombre"], "critica": forma["critica"], **analizar_explain(explain)}
+        fila["falla"] = fila["critica"] and fila["acceso"] == "COLLSCAN"
+        fila["advertencia"] = fila["examinados"] > max(fila["devueltos"], 1) * PROPORCION_ADVERTENCIA
+        filas.append(fila)
+    return filas
+
+def imprimir_auditoria(filas, total_documentos):
+    """Imprime las filas de la auditoría como tabla"""
+    print(f"\n🔎 Planes de consulta ({total_documentos:,} empleados)")
+    encabezado = f"{'CONSULTA':<16} {'CRÍTICA':<8} {'ACCESO':<10} {'ÍNDICE':<20} {'EXAMINADOS':>10} {'LLAVES':>8} {'DEVUELTOS':>9} {'MS':>6}"
+    print("-" * len(encabezado))
+    print(encabezado)
+    print("-" * len(encabezado))
+    for fila in filas:
+        estado = "❌" if fila["falla"] else ("⚠️" if fila["advertencia"] or fila["acceso"] == "COLLSCAN" else "✅")
+        print(
+            f"{fila['nombre']:<16} {'sí' if fila['critica'] else 'no':<8} {fila['acceso']:<10} "
+            f"{(', '.join(fila['indices']) or '-')[:20]:<20} {fila['examinados']:>10,} {fila['llaves']:>8,} "
+            f"{fila['devueltos']:>9,} {fila['ms']:>6} {estado}"
+        )
+    print("-" * len(encabezado))
+
+def main():
+    parser = argparse.ArgumentParser(description="Revisa que las consultas de los servicios usen índices")
+    parser.add_argument("--json", action="store_true", help="Escribir el resultado como JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    # Se auditan los índices tal como están: la conexión no debe crear los que falten
+    os.environ["MONGO_AUTO_INDEXES"] = "0"
+    collection = get_collection()
+    if collection is None:
+        print("❌ No se pudo conectar a la base de datos", file=sys.stderr)
+        return SIN_CONEXION
+
+    try:
+        filas = auditar(collection)
+        indices = revisar_indices(collection)
+        faltantes = indices["faltantes"]
+        distintos = [distinto["nombre"] for distinto in indices["distintos"]]
+        total = collection.estimated_document_count()
+    finally:
+        close_connection()
+
+    fallas = [fila["nombre"] for fila in filas if fila["falla"]]
+    if args.json:
+        print(json.dumps({"empleados": total, "indices_faltantes": faltantes, "indices_distintos": distintos,
+                          "consultas": filas, "fallas": fallas}, ensure_ascii=False, default=str))
+    else:
+        imprimir_auditoria(filas, total)
+        if faltantes:
+            print(f"⚠️ Índices faltantes: {', '.join(faltantes)} (se crean al conectar con MONGO_AUTO_INDEXES=1)")
+        if distintos:
+            print(f"⚠️ Índices con otras opciones (por ejemplo, sin unique): {', '.join(distintos)} "
+                  f"(se reconstruyen al conectar con MONGO_AUTO_INDEXES=1)")
+        if fallas:
+            print(f"❌ Consultas críticas con COLLSCAN: {', '.join(fallas)}")
+        else:
+            print("✅ Todas las consultas críticas usan un índice")
+    return HAY_COLLSCAN if fallas else EXITO
+
+if __name__ == "__main__":
+    raise SystemExit(main())
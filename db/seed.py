@@ -0,0 +1,285 @@
+"""
+Generador de datos sintéticos para pruebas de escala
+Produce N empleados con distribuciones realistas de puestos, salarios y departamentos;
+el resultado es determinista para una misma semilla sin importar el tamaño de lote o los hilos
+
+Uso (desde la raíz del proyecto):
+    python -m db.seed --n 100000 --semilla 42 --lote 5000 --hilos 4
+    python -m db.seed --scott
+"""
+import argparse
+import json
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from pymongo.errors import BulkWriteError
+from db.mongo_config import get_collection
+from models.employee import normalizar_nombre
+from services.reports.pending import marcar_departamentos, deptnos_de, deptnos_actuales
+from services.shared.cache import cache_empleados
+from services.shared.catalog import catalogo
+from services.shared.constants import DEPARTAMENTOS_PREDEFINIDOS
+from services.shared.departments import para_guardar
+from services.shared.projections import PROYECCION_EXISTENCIA
+
+logger = logging.getLogger(__name__)
+
+# Datos del esquema SCOTT, compartidos con init-mongo.js
+RUTA_DATOS_SCOTT = Path(__file__).resolve().parent / "seed_data" / "scott.json"
+
+# Los empno sintéticos empiezan después de los del esquema SCOTT (7369-7934)
+EMPNO_INICIAL = 10000
+TAMANO_LOTE_SEMILLA = 5000
+
+# Proporción de cada puesto en la plantilla
+PESOS_PUESTOS = (
+    ("CLERK", 0.40),
+    ("SALESMAN", 0.28),
+    ("MANAGER", 0.16),
+    ("ANALYST", 0.159),
+    ("PRESIDENT", 0.001),
+)
+
+# Salario mediano por puesto (tomado del esquema SCOTT); la dispersión es log-normal
+SALARIO_MEDIANO = {
+    "CLERK": 1050,
+    "SALESMAN": 1400,
+    "MANAGER": 2750,
+    "ANALYST": 3000,
+    "PRESIDENT": 5000,
+}
+DISPERSION_SALARIO = 0.18
+SALARIO_MINIMO = 500
+
+# Distribución de departamentos para los puestos que no son de ventas
+PESOS_DEPARTAMENTOS = ((10, 0.25), (20, 0.45), (30, 0.30))
+DEPARTAMENTO_VENTAS = 30
+
+APELLIDOS = (
+    "SMITH", "JOHNSON", "WILLIAMS", "BROWN", "JONES", "GARCIA", "MILLER", "DAVIS",
+    "RODRIGUEZ", "MARTINEZ", "HERNANDEZ", "LOPEZ", "GONZALEZ", "WILSON", "ANDERSON",
+    "THOMAS", "TAYLOR", "MOORE", "JACKSON", "MARTIN", "LEE", "PEREZ", "THOMPSON",
+    "WHITE", "HARRIS", "SANCHEZ", "CLARK", "RAMIREZ", "LEWIS", "ROBINSON", "WALKER",
+    "YOUNG", "ALLEN", "KING", "WRIGHT", "SCOTT", "TORRES", "NGUYEN", "HILL", "FLORES",
+    "GREEN", "ADAMS", "NELSON", "BAKER", "HALL", "RIVERA", "CAMPBELL", "MITCHELL",
+    "CARTER", "ROBERTS", "GÓMEZ", "MUÑOZ", "PÉREZ", "JIMÉNEZ", "DÍAZ", "CASTAÑEDA",
+    "FORD", "BLAKE", "TURNER", "WARD", "JAMES",
+)
+
+def _acumulados(pesos):
+    """Convierte pares (valor, peso) en valores y pesos acumulados para random.choices"""
+    valores = [valor for valor, _ in pesos]
+    acumulados = []
+    total = 0.0
+    for _, peso in pesos:
+        total += peso
+        acumulados.append(total)
+    return valores, acumulados
+
+_PUESTOS, _PUESTOS_ACUMULADOS = _acumulados(PESOS_PUESTOS)
+_DEPTNOS, _DEPTNOS_ACUMULADOS = _acumulados(PESOS_DEPARTAMENTOS)
+
+def cargar_datos_scott():
+    """
+    Carga los empleados del esquema SCOTT desde seed_data/scott.json
+
+    Returns:
+        list: Lista de diccionarios con datos de empleados
+    """
+    with open(RUTA_DATOS_SCOTT, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+def generar_empleado(indice, semilla=42, empno_inicial=EMPNO_INICIAL):
+    """
+    Genera el empleado número `indice` de la secuencia sintética
+    Cada empleado usa su propio generador, así el resultado no depende del orden de los lotes
+
+    Args:
+        indice: Posición del empleado en la secuencia (desde 0)
+        semilla: Semilla de la secuencia
+        empno_inicial: empno del primer empleado
+
+    Returns:
+        dict: Documento del empleado listo para insertar
+    """
+    rng = random.Random((semilla << 40) | indice)
+
+    job = rng.choices(_PUESTOS, cum_weights=_PUESTOS_ACUMULADOS)[0]
+    if job == "SALESMAN":
+        deptno = DEPARTAMENTO_VENTAS
+    else:
+        deptno = rng.choices(_DEPTNOS, cum_weights=_DEPTNOS_ACUMULADOS)[0]
+
+    sal = rng.lognormvariate(0, DISPERSION_SALARIO) * SALARIO_MEDIANO[job]
+    ename = rng.choice(APELLIDOS)
+
+    return {
+        "empno": empno_inicial + indice,
+        "ename": ename,
+        "ename_search": normalizar_nombre(ename),
+        "job": job,
+        "sal": max(SALARIO_MINIMO, int(round(sal / 25.0)) * 25),
+        "departamento": dict(DEPARTAMENTOS_PREDEFINIDOS[deptno]),
+    }
+
+def generar_empleados(n, semilla=42, empno_inicial=EMPNO_INICIAL, desde=0):
+    """
+    Genera empleados sintéticos de forma perezosa
+
+    Args:
+        n: Número de empleados a generar
+        semilla: Semilla de la secuencia
+        empno_inicial: empno del primer empleado de la secuencia
+        desde: Índice del primer empleado a generar
+
+    Yields:
+        dict: Documento de cada empleado
+    """
+    for indice in range(desde, desde + n):
+        yield generar_empleado(indice, semilla, empno_inicial)
+
+def insertar_lote(collection, empleados, reemplazar=False):
+    """
+    Inserta un lote verificando los empno existentes con una sola consulta $in
+
+    Args:
+        collection: Colección de MongoDB
+        empleados: Lista de documentos a insertar
+        reemplazar: Eliminar los existentes e insertar todos (si es False se omiten)
+
+    Returns:
+        dict: {"insertados": int, "existentes": [empno]}
+    """
+    empnos = [empleado["empno"] for empleado in empleados]
+    existentes = [
+        doc["empno"]
+        for doc in collection.find({"empno": {"$in": empnos}}, PROYECCION_EXISTENCIA)
+    ]
+
+    if existentes and reemplazar:
+        marcar_departamentos(collection, deptnos_actuales(collection, existentes))
+        collection.delete_many({"empno": {"$in": existentes}})
+    elif existentes:
+        omitidos = set(existentes)
+        empleados = [empleado for empleado in empleados if empleado["empno"] not in omitidos]
+
+    if not empleados:
+        return {"insertados": 0, "existentes": existentes}
+
+    try:
+        # Los departamentos generados son los predefinidos (ver preparar_departamentos)
+        insertados = len(collection.insert_many([para_guardar(e) for e in empleados], ordered=False).inserted_ids)
+    except BulkWriteError as e:
+        # Otro proceso pudo insertar los mismos empno entre la consulta y la inserción
+        insertados = e.details.get("nInserted", 0)
+    marcar_departamentos(collection, deptnos_de(empleados))
+    return {"insertados": insertados, "existentes": existentes}
+
+def sembrar(n, semilla=42, tamano_lote=TAMANO_LOTE_SEMILLA, hilos=4,
+            empno_inicial=EMPNO_INICIAL, reemplazar=False, collection=None):
+    """
+    Inserta n empleados sintéticos en lotes paralelos
+
+    Args:
+        n: Número de empleados
+        semilla: Semilla de la secuencia (misma semilla, mismos datos)
+        tamano_lote: Documentos por insert_many
+        hilos: Lotes que se escriben en paralelo
+        empno_inicial: empno del primer empleado
+        reemplazar: Sobrescribir los empleados que ya existan
+        collection: Colección de MongoDB (por defecto la configurada)
+
+    Returns:
+        dict: {"insertados", "existentes", "segundos"} o None si no hay conexión
+    """
+    if collection is None:
+        collection = get_collection()
+    if collection is None:
+        logger.error("No se pudo conectar a la colección")
+        return None
+
+    def _procesar(desde):
+        empleados = list(generar_empleados(min(tamano_lote, n - desde), semilla, empno_inicial, desde))
+        return insertar_lote(collection, empleados, reemplazar)
+
+    inicio = time.perf_counter()
+    insertados = 0
+    existentes = 0
+    with ThreadPoolExecutor(max_workers=max(1, hilos)) as executor:
+        for resultado in executor.map(_procesar, range(0, n, tamano_lote)):
+            insertados += resultado["insertados"]
+            existentes += len(resultado["existentes"])
+    segundos = time.perf_counter() - inicio
+
+    if reemplazar and existentes:
+        cache_empleados.limpiar()
+    catalogo.refrescar()
+    logger.info(f"🌱 {insertados} empleados sintéticos insertados en {segundos:.1f}s")
+    return {"insertados": insertados, "existentes": existentes, "segundos": segundos}
+
+def sembrar_scott(reemplazar=False, collection=None):
+    """
+    Inserta los 14 empleados del esquema SCOTT
+
+    Args:
+        reemplazar: Sobrescribir los empleados que ya existan
+        collection: Colección de MongoDB (por defecto la configurada)
+
+    Returns:
+        dict: {"insertados": int, "existentes": [empno]} o None si no hay conexión
+    """
+    if collection is None:
+        collection = get_collection()
+    if collection is None:
+        logger.error("No se pudo conectar a la colección")
+        return None
+
+    empleados = cargar_datos_scott()
+    for empleado in empleados:
+        empleado["ename_search"] = normalizar_nombre(empleado["ename"])
+
+    resultado = insertar_lote(collection, empleados, reemplazar)
+    if reemplazar and resultado["existentes"]:
+        cache_empleados.limpiar()
+    for empleado in empleados:
+        catalogo.registrar_empleado(empleado)
+    return resultado
+
+def main():
+    parser = argparse.ArgumentParser(description="Generador de empleados sintéticos")
+    parser.add_argument("--n", type=int, default=10000, help="Empleados a generar")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla (misma semilla, mismos datos)")
+    parser.add_argument("--lote", type=int, default=TAMANO_LOTE_SEMILLA, help="Documentos por insert_many")
+    parser.add_argument("--hilos", type=int, default=4, help="Lotes escritos en paralelo")
+    parser.add_argument("--empno-inicial", type=int, default=EMPNO_INICIAL, help="empno del primer empleado")
+    parser.add_argument("--reemplazar", action="store_true", help="Sobrescribir empleados existentes")
+    parser.add_argument("--scott", action="store_true", help="Insertar solo los 14 empleados del esquema SCOTT")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.scott:
+        resultado = sembrar_scott(args.reemplazar)
+    else:
+        resultado = sembrar(
+            args.n, args.semilla, args.lote, args.hilos, args.empno_inicial, args.reemplazar
+        )
+    if resultado is None:
+        print("❌ No se pudo conectar a la base de datos")
+        return 1
+
+    existentes = resultado["existentes"]
+    if not isinstance(existentes, int):
+        existentes = len(existentes)
+    print(f"✅ Insertados: {resultado['insertados']}")
+    if existentes:
+        accion = "reemplazados" if args.reemplazar else "omitidos"
+        print(f"⚠️ Ya existían {existentes} empleados ({accion})")
+    if "segundos" in resultado:
+        print(f"⏱️ {resultado['segundos']:.1f}s ({resultado['insertados'] / max(resultado['segundos'], 1e-9):,.0f} docs/s)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,169 +10,27 @@ db.createCollection('rh');
 // Insertar datos de empleados con departamentos embebidos
 print('🍃 Insertando datos iniciales en la colección rh...');
 
-db.rh.insertMany([
-  {
-    "empno": 7369,
-    "ename": "SMITH",
-    "job": "CLERK",
-    "sal": 800,
-    "departamento": {
-      "deptno": 20,
-      "dname": "RESEARCH",
-      "loc": "DALLAS"
-    }
-  },
-  {
-    "empno": 7499,
-    "ename": "ALLEN",
-    "job": "SALESMAN",
-    "sal": 1600,
-    "departamento": {
-      "deptno": 30,
-      "dname": "SALES",
-      "loc": "CHICAGO"
-    }
-  },
-  {
-    "empno": 7521,
-    "ename": "WARD",
-    "job": "SALESMAN",
-    "sal": 1250,
-    "departamento": {
-      "deptno": 30,
-      "dname": "SALES",
-      "loc": "CHICAGO"
-    }
-  },
-  {
-    "empno": 7566,
-    "ename": "JONES",
-    "job": "MANAGER",
-    "sal": 2975,
-    "departamento": {
-      "deptno": 20,
-      "dname": "RESEARCH",
-      "loc": "DALLAS"
-    }
-  },
-  {
-    "empno": 7654,
-    "ename": "MARTIN",
-    "job": "SALESMAN",
-    "sal": 1250,
-    "departamento": {
-      "deptno": 30,
-      "dname": "SALES",
-      "loc": "CHICAGO"
-    }
-  },
-  {
-    "empno": 7698,
-    "ename": "BLAKE",
-    "job": "MANAGER",
-    "sal": 2850,
-    "departamento": {
-      "deptno": 30,
-      "dname": "SALES",
-      "loc": "CHICAGO"
-    }
-  },
-  {
-    "empno": 7782,
-    "ename": "CLARK",
-    "job": "MANAGER",
-    "sal": 2450,
-    "departamento": {
-      "deptno": 10,
-      "dname": "ACCOUNTING",
-      "loc": "NEW YORK"
-    }
-  },
-  {
-    "empno": 7788,
-    "ename": "SCOTT",
-    "job": "ANALYST",
-    "sal": 3000,
-    "departamento": {
-      "deptno": 20,
-      "dname": "RESEARCH",
-      "loc": "DALLAS"
-    }
-  },
-  {
-    "empno": 7839,
-    "ename": "KING",
-    "job": "PRESIDENT",
-    "sal": 5000,
-    "departamento": {
-      "deptno": 10,
-      "dname": "ACCOUNTING",
-      "loc": "NEW YORK"
-    }
-  },
-  {
-    "empno": 7844,
-    "ename": "TURNER",
-    "job": "SALESMAN",
-    "sal": 1500,
-    "departamento": {
-      "deptno": 30,
-      "dname": "SALES",
-      "loc": "CHICAGO"
-    }
-  },
-  {
-    "empno": 7876,
-    "ename": "ADAMS",
-    "job": "CLERK",
-    "sal": 1100,
-    "departamento": {
-      "deptno": 20,
-      "dname": "RESEARCH",
-      "loc": "DALLAS"
-    }
-  },
-  {
-    "empno": 7900,
-    "ename": "JAMES",
-    "job": "CLERK",
-    "sal": 950,
-    "departamento": {
-      "deptno": 30,
-      "dname": "SALES",
-      "loc": "CHICAGO"
-    }
-  },
-  {
-    "empno": 7902,
-    "ename": "FORD",
-    "job": "ANALYST",
-    "sal": 3000,
-    "departamento": {
-      "deptno": 20,
-      "dname": "RESEARCH",
-      "loc": "DALLAS"
-    }
-  },
-  {
-    "empno": 7934,
-    "ename": "MILLER",
-    "job": "CLERK",
-    "sal": 1300,
-    "departamento": {
-      "deptno": 10,
-      "dname": "ACCOUNTING",
-      "loc": "NEW YORK"
-    }
-  }
-]);
+// Los datos del esquema SCOTT se comparten con db/seed_data/scott.json
+// (montado en /seed_data por docker-compose.yml)
+const fs = require('fs');
+const empleados = JSON.parse(fs.readFileSync('/seed_data/scott.json', 'utf8'));
+
+// Campo normalizado para la búsqueda por nombre: minúsculas y sin acentos,
+// igual que normalizar_nombre en models/employee.py (GÓMEZ -> gomez)
+const normalizarNombre = (nombre) =>
+    (nombre || '').normalize('NFKD').replace(/[\u0300-\u036f]/g, '').trim().toLowerCase();
+empleados.forEach((emp) => { emp.ename_search = normalizarNombre(emp.ename); });
+db.rh.insertMany(empleados);
 
 // Crear índices para optimizar consultas
+// Mantener sincronizado con INDICES_REQUERIDOS en db/indexes.py
 print('📊 Creando índices...');
-db.rh.createIndex({ "empno": 1 }, { unique: true });
-db.rh.createIndex({ "departamento.deptno": 1 });
-db.rh.createIndex({ "ename": 1 });
-db.rh.createIndex({ "job": 1 });
+db.rh.createIndex({ "empno": 1 }, { unique: true, name: "empno_unico" });
+db.rh.createIndex({ "job": 1 }, { name: "job" });
+db.rh.createIndex({ "departamento.deptno": 1 }, { name: "departamento_deptno" });
+db.rh.createIndex({ "departamento.dname": 1 }, { name: "departamento_dname" });
+db.rh.createIndex({ "sal": 1 }, { name: "sal" });
+db.rh.createIndex({ "ename_search": 1 }, { name: "ename_search" });
 
 // Verificar inserción
 const count = db.rh.countDocuments();
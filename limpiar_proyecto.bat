@@ -14,6 +14,7 @@ del /s /q *.pyc 2>nul
 echo 📁 Eliminando archivos temporales...
 if exist .env del /f /q .env 2>nul
 if exist last_session.json del /f /q last_session.json 2>nul
+if exist .resume_token.json del /f /q .resume_token.json 2>nul
 
 echo.
 echo ✅ Proyecto limpio en Windows.
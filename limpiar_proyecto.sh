@@ -17,6 +17,7 @@ find . -name "*.pyc" -exec rm -f {} +
 echo "📁 Eliminando archivos temporales..."
 [ -f ".env" ] && rm .env
 [ -f "last_session.json" ] && rm last_session.json
+[ -f ".resume_token.json" ] && rm .resume_token.json
 
 echo "✅ Proyecto limpio"
 echo
@@ -1,15 +1,12 @@
+import logging
 from session import leer_sesion, guardar_sesion, mostrar_info_sistema
-from db.mongo_utils import datos_ya_existen, insertar_datos_prueba, limpiar_coleccion
+from db.mongo_config import iniciar_conexion_en_segundo_plano, get_collection
+from db.data_status import datos_ya_existen
 from ui.menus import mostrar_menu, limpiar_pantalla, mostrar_banner
 
-
-from services import (
-    leer_empleados,
-    crear_empleado,
-    actualizar_empleado,
-    eliminar_empleado,
-    buscar_empleado,
-)
+# Los servicios (y las utilidades de db.mongo_utils, que importan el sembrado,
+# los reportes y la caché) se cargan bajo demanda al elegir cada opción
+import services
 
 def menu():
     """
@@ -22,32 +19,33 @@ def menu():
         match opcion:
             case "1":
                 limpiar_pantalla()
-                leer_empleados()
+                services.leer_empleados()
                 input("\nPresiona ENTER para continuar...")
                 
             case "2":
                 limpiar_pantalla()
-                crear_empleado()
+                services.crear_empleado()
                 input("\nPresiona ENTER para continuar...")
                 
             case "3":
                 limpiar_pantalla()
-                actualizar_empleado()
+                services.actualizar_empleado()
                 input("\nPresiona ENTER para continuar...")
                 
             case "4":
                 limpiar_pantalla()
-                eliminar_empleado()
+                services.eliminar_empleado()
                 input("\nPresiona ENTER para continuar...")
                 
             case "5":
                 limpiar_pantalla()
-                buscar_empleado()
+                services.buscar_empleado()
                 input("\nPresiona ENTER para continuar...")
                 
             case "6":
                 limpiar_pantalla()
-                if datos_ya_existen():
+                from db.mongo_utils import insertar_datos_prueba, limpiar_coleccion
+                if datos_ya_existen(refrescar=True):
                     print("⚠️ La base de datos ya contiene empleados.")
                     print("\nOpciones disponibles:")
                     print("1. Resetear datos (eliminar todo e insertar datos de prueba)")
@@ -59,7 +57,7 @@ def menu():
                         print("\n⚠️ Esto eliminará todos los empleados existentes")
                         confirmar = input("¿Estás seguro? (S/N): ").strip().upper()
                         if confirmar == "S":
-                            limpiar_coleccion()
+                            limpiar_coleccion(rapido=True)
                             insertar_datos_prueba()
                         else:
                             print("Operación cancelada.")
@@ -73,14 +71,46 @@ def menu():
                 
             case "7":
                 limpiar_pantalla()
+                from db.mongo_utils import insertar_datos_prueba, limpiar_coleccion
                 confirmar = input("⚠️ ¿Estás seguro que deseas ELIMINAR TODOS los empleados? (S/N): ").strip().upper()
                 if confirmar == "S":
-                    limpiar_coleccion()
+                    limpiar_coleccion(rapido=True)
                     insertar = input("¿Deseas insertar datos de prueba? (S/N): ").strip().upper()
                     if insertar == "S":
                         insertar_datos_prueba()
                 input("\nPresiona ENTER para continuar...")
                 
+            case "8":
+                limpiar_pantalla()
+                services.importar_empleados()
+                input("\nPresiona ENTER para continuar...")
+                
+            case "9":
+                limpiar_pantalla()
+                services.exportar_empleados()
+                input("\nPresiona ENTER para continuar...")
+                
+            case "10":
+                limpiar_pantalla()
+                from db.mongo_utils import mostrar_diagnostico
+                mostrar_diagnostico()
+                input("\nPresiona ENTER para continuar...")
+                
+            case "11":
+                limpiar_pantalla()
+                services.mostrar_reportes()
+                input("\nPresiona ENTER para continuar...")
+                
+            case "12":
+                limpiar_pantalla()
+                services.actualizar_masivo()
+                input("\nPresiona ENTER para continuar...")
+                
+            case "13":
+                limpiar_pantalla()
+                services.eliminar_masivo()
+                input("\nPresiona ENTER para continuar...")
+                
             case "0":
                 print("\n👋 Guardando sesión y cerrando aplicación...")
                 guardar_sesion()
@@ -93,6 +123,11 @@ def menu():
         limpiar_pantalla()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
+    # Conectar a MongoDB en segundo plano mientras se muestra el banner
+    conexion = iniciar_conexion_en_segundo_plano()
+    
     # Limpiar consola al iniciar
     limpiar_pantalla()
     
@@ -105,14 +140,15 @@ if __name__ == "__main__":
     # Leer última sesión
     ultima = leer_sesion()
 
-    # Verificar estado de la base de datos
+    # Verificar estado de la base de datos (una sola consulta, en caché)
+    conexion.join()
     estado_db = datos_ya_existen()
 
     if ultima:
         print(f"\n👋 Bienvenido de nuevo.")
         print(f"📅 Tu última sesión fue el {ultima['fecha']}")
         print(f"💻 Desde {ultima['sistema']}")
-        if datos_ya_existen():
+        if estado_db:
             print("ℹ️ La base de datos contiene empleados.")
         else:
             print("ℹ️ La base de datos está vacía. Usa la opción 6 para insertar datos de prueba.")
@@ -130,7 +166,13 @@ if __name__ == "__main__":
         input("\nPresiona ENTER para salir...")
         exit(1)
 
+    # Cambios de otros usuarios en segundo plano (requiere replica set)
+    from services.shared.change_stream import vigilante_cambios
+    if vigilante_cambios.iniciar(get_collection()):
+        print("🔄 Los cambios de otros usuarios se reflejan en vivo.")
+
     # Iniciar menú principal
     menu()
+    vigilante_cambios.detener()
     
     print("¡Hasta luego! 🍃")
\ No newline at end of file
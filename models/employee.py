@@ -1,15 +1,34 @@
 """
 Definición de modelos de datos usando dataclasses
 Representa la estructura de empleados y departamentos
+Las clases usan __slots__ (sin __dict__ por instancia) para que las lecturas masivas
+ocupen poca memoria; los departamentos son inmutables y se comparten entre empleados
 """
 
+import unicodedata
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List, Optional
+import bson
+from bson.raw_bson import RawBSONDocument
 
-@dataclass
+def normalizar_nombre(nombre: str) -> str:
+    """
+    Normaliza un nombre para búsquedas: minúsculas y sin acentos
+    
+    Args:
+        nombre: Nombre original
+        
+    Returns:
+        str: Nombre normalizado (se guarda en el campo ename_search)
+    """
+    descompuesto = unicodedata.normalize("NFKD", nombre or "")
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).strip().lower()
+
+@dataclass(frozen=True, slots=True)
 class Departamento:
     """
     Modelo de datos para un departamento
+    Es inmutable: una misma instancia se comparte entre todos sus empleados
     
     Attributes:
         deptno: Número de departamento
@@ -17,8 +36,8 @@ class Departamento:
         loc: Ubicación del departamento
     """
     deptno: int
-    dname: str
-    loc: str
+    dname: Optional[str] = None
+    loc: Optional[str] = None
     
     def to_dict(self) -> Dict:
         """
@@ -33,7 +52,7 @@ class Departamento:
             "loc": self.loc
         }
 
-@dataclass
+@dataclass(slots=True)
 class Empleado:
     """
     Modelo de datos para un empleado
@@ -51,43 +70,112 @@ class Empleado:
     sal: float
     departamento: Departamento
     
-    def to_dict(self) -> Dict:
+    def to_dict(self, incluir_busqueda: bool = True) -> Dict:
         """
         Convierte el objeto a diccionario
         
+        Args:
+            incluir_busqueda: Agregar ename_search (el documento que se guarda); las
+                              salidas JSON y CSV lo omiten
+        
         Returns:
             dict: Representación en diccionario del empleado
         """
-        return {
+        datos = {
             "empno": self.empno,
             "ename": self.ename,
             "job": self.job,
             "sal": self.sal,
             "departamento": self.departamento.to_dict()
         }
+        if incluir_busqueda:
+            datos["ename_search"] = normalizar_nombre(self.ename)
+        return datos
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Empleado':
+    def from_dict(cls, data: Dict, departamentos: Optional[Dict] = None) -> 'Empleado':
         """
         Crea un Empleado desde un diccionario
         
         Args:
             data: Diccionario con datos del empleado
+            departamentos: deptno -> departamento, para completar dname/loc faltantes
+            
+        Returns:
+            Empleado: Instancia de Empleado
+        """
+        return cls.from_documents((data,), departamentos)[0]
+    
+    @classmethod
+    def from_bson(cls, datos, departamentos: Optional[Dict] = None) -> 'Empleado':
+        """
+        Crea un Empleado desde BSON (se decodifica con bson.decode, ver iter_documents)
+        
+        Args:
+            datos: bytes de un documento BSON o RawBSONDocument
+            departamentos: deptno -> departamento, para completar dname/loc faltantes
             
         Returns:
             Empleado: Instancia de Empleado
         """
-        dept_data = data.get('departamento', {})
-        departamento = Departamento(
-            deptno=dept_data.get('deptno'),
-            dname=dept_data.get('dname'),
-            loc=dept_data.get('loc')
-        )
+        return cls.from_documents((datos,), departamentos)[0]
+    
+    @classmethod
+    def from_documents(cls, documentos: Iterable, departamentos: Optional[Dict] = None) -> List['Empleado']:
+        """
+        Convierte muchos documentos en Empleado en una sola pasada (ver iter_documents)
         
-        return cls(
-            empno=data.get('empno'),
-            ename=data.get('ename'),
-            job=data.get('job'),
-            sal=data.get('sal'),
-            departamento=departamento
-        )
\ No newline at end of file
+        Args:
+            documentos: Iterable de diccionarios, RawBSONDocument o bytes
+            departamentos: deptno -> departamento, para completar dname/loc faltantes
+            
+        Returns:
+            list: Empleados en el mismo orden
+        """
+        return list(cls.iter_documents(documentos, departamentos))
+    
+    @classmethod
+    def iter_documents(cls, documentos: Iterable, departamentos: Optional[Dict] = None) -> Iterator['Empleado']:
+        """
+        Convierte documentos en Empleado a medida que se leen
+        Acepta un cursor (cada empleado se entrega en cuanto llega, sin una lista intermedia),
+        documentos RawBSONDocument o bytes BSON; estos se decodifican completos a un diccionario
+        temporal con bson.decode (en C), más rápido que leer RawBSONDocument campo por campo
+        Los empleados de un mismo departamento comparten un solo objeto Departamento
+        (y los de un mismo puesto, la misma cadena del puesto)
+        
+        Args:
+            documentos: Iterable de diccionarios, RawBSONDocument o bytes
+            departamentos: deptno -> departamento, para completar dname/loc faltantes
+                           (documentos del modo normalizado que solo guardan deptno)
+            
+        Yields:
+            Empleado: Cada empleado en el mismo orden
+        """
+        compartidos = {}
+        puestos = {}
+        for documento in documentos:
+            if isinstance(documento, RawBSONDocument):
+                documento = bson.decode(documento.raw)
+            elif isinstance(documento, (bytes, bytearray, memoryview)):
+                documento = bson.decode(documento)
+            
+            dept = documento.get("departamento") or {}
+            clave = (dept.get("deptno"), dept.get("dname"), dept.get("loc"))
+            departamento = compartidos.get(clave)
+            if departamento is None:
+                conocido = (departamentos or {}).get(clave[0]) if clave[1] is None else None
+                if conocido is not None:
+                    departamento = Departamento(clave[0], conocido.get("dname"), conocido.get("loc"))
+                else:
+                    departamento = Departamento(*clave)
+                compartidos[clave] = departamento
+            
+            job = documento.get("job")
+            yield cls(
+                documento.get("empno"),
+                documento.get("ename"),
+                puestos.setdefault(job, job),
+                documento.get("sal"),
+                departamento
+            )
@@ -1,17 +1,31 @@
 """
 Paquete que contiene todos los servicios CRUD
+Los servicios se importan bajo demanda para acelerar el arranque
 """
-from .create.service import crear_empleado
-from .read.service import leer_empleados
-from .update.service import actualizar_empleado
-from .delete.service import eliminar_empleado
-from .search.service import buscar_empleado
+import importlib
+
+# Servicio -> módulo que lo define
+_SERVICIOS = {
+    'crear_empleado': '.create.service',
+    'leer_empleados': '.read.service',
+    'actualizar_empleado': '.update.service',
+    'eliminar_empleado': '.delete.service',
+    'buscar_empleado': '.search.service',
+    'importar_empleados': '.bulk_import.service',
+    'exportar_empleados': '.export.service',
+    'mostrar_reportes': '.reports.service',
+    'actualizar_masivo': '.bulk_update.service',
+    'eliminar_masivo': '.bulk_delete.service',
+}
+
+def __getattr__(nombre):
+    """Importa el módulo del servicio solo cuando se usa por primera vez"""
+    if nombre in _SERVICIOS:
+        modulo = importlib.import_module(_SERVICIOS[nombre], __name__)
+        servicio = getattr(modulo, nombre)
+        globals()[nombre] = servicio
+        return servicio
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
 
 # Exportar servicios para fácil acceso
-__all__ = [
-    'crear_empleado',
-    'leer_empleados',
-    'actualizar_empleado',
-    'eliminar_empleado',
-    'buscar_empleado',
-]
\ No newline at end of file
+__all__ = list(_SERVICIOS)
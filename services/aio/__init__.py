@@ -0,0 +1,24 @@
+"""
+API asíncrona de empleados (Motor) que replica los servicios CRUD
+"""
+from .repository import (
+    crear_empleado_async,
+    crear_empleados_async,
+    leer_empleados_async,
+    obtener_empleado_async,
+    obtener_empleados_async,
+    actualizar_empleado_async,
+    eliminar_empleado_async,
+    buscar_empleados_async,
+)
+
+__all__ = [
+    'crear_empleado_async',
+    'crear_empleados_async',
+    'leer_empleados_async',
+    'obtener_empleado_async',
+    'obtener_empleados_async',
+    'actualizar_empleado_async',
+    'eliminar_empleado_async',
+    'buscar_empleados_async',
+]
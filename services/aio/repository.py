@@ -0,0 +1,289 @@
+"""
+Operaciones CRUD asíncronas sobre la colección de empleados
+Replican los servicios síncronos sin interacción por consola
+Todas las corrutinas deben ejecutarse en el loop compartido (db.async_config.ejecutar)
+"""
+import logging
+from pymongo.errors import BulkWriteError
+from db.async_config import get_async_collection
+from models.employee import Empleado, normalizar_nombre
+from services.reports.pending import coleccion_pendientes, operaciones_marca, deptnos_de
+from services.search.queries import construir_filtro, filtro_por_departamento, orden_por_nombre
+from services.shared.cache import cache_empleados
+from services.shared.catalog import catalogo, PIPELINE_DEPARTAMENTOS
+from services.shared.constants import TAMANO_PAGINA
+from services.shared.departments import (
+    modo_normalizado, coleccion_departamentos, para_guardar, operaciones_alta
+)
+from services.shared.projections import PROYECCION_LISTA, PROYECCION_DETALLE
+from services.shared.validation import registro_a_documento, registro_a_cambios
+
+logger = logging.getLogger(__name__)
+
+async def _departamentos_async(collection, deptnos=None):
+    """Departamentos de la colección normalizada (todos o los indicados)"""
+    filtro = {} if deptnos is None else {"deptno": {"$in": list(deptnos)}}
+    documentos = await coleccion_departamentos(collection).find(filtro, {"_id": 0}).to_list(length=None)
+    return {dept["deptno"]: dept for dept in documentos}
+
+async def _a_modelos_async(collection, documentos):
+    """
+    Convierte documentos en Empleado; en modo normalizado completa los departamentos
+    con una sola consulta $in
+
+    Args:
+        collection: Colección de Motor
+        documentos: Documentos de empleado
+
+    Returns:
+        list: Empleados en el mismo orden
+    """
+    departamentos = None
+    if modo_normalizado():
+        deptnos = {(doc.get("departamento") or {}).get("deptno") for doc in documentos} - {None}
+        if deptnos:
+            departamentos = await _departamentos_async(collection, deptnos)
+    return Empleado.from_documents(documentos, departamentos)
+
+async def _guardar_async(collection, documentos):
+    """
+    Prepara los documentos para escribirlos según el modo; en modo normalizado
+    crea antes los departamentos que falten
+
+    Returns:
+        list: Documentos a escribir
+    """
+    if not modo_normalizado():
+        return documentos
+    departamentos = {
+        doc["departamento"]["deptno"]: doc["departamento"]
+        for doc in documentos
+        if isinstance(doc.get("departamento"), dict) and doc["departamento"].get("dname")
+    }
+    if departamentos:
+        await coleccion_departamentos(collection).bulk_write(operaciones_alta(departamentos.values()), ordered=False)
+    return [para_guardar(doc) for doc in documentos]
+
+async def _departamentos_conocidos_async(collection):
+    """Departamentos para completar dname/loc al validar (en modo normalizado, los de la colección)"""
+    # Sin colección el catálogo solo tiene los predefinidos (se carga con la colección síncrona)
+    departamentos = catalogo.departamentos()
+    if modo_normalizado():
+        departamentos.update(await _departamentos_async(collection))
+    elif not catalogo.cargado():
+        async for doc in collection.aggregate(PIPELINE_DEPARTAMENTOS):
+            departamentos[doc["_id"]] = {"deptno": doc["_id"], "dname": doc.get("dname"), "loc": doc.get("loc")}
+    return departamentos
+
+async def _marcar_async(collection, deptnos):
+    """Marca departamentos como pendientes de recalcular en el resumen de salarios"""
+    deptnos = set(deptnos)
+    if not deptnos:
+        return
+    try:
+        await coleccion_pendientes(collection).bulk_write(operaciones_marca(deptnos), ordered=False)
+    except Exception as e:
+        logger.error(f"Error al marcar departamentos pendientes del resumen: {e}")
+
+async def _deptnos_actuales_async(collection, empnos):
+    """Departamentos actuales de los empleados indicados"""
+    return set(await collection.distinct("departamento.deptno", {"empno": {"$in": list(empnos)}}))
+
+async def crear_empleado_async(empleado, collection=None):
+    """
+    Crea un empleado
+
+    Args:
+        empleado: Diccionario con los datos del empleado
+        collection: Colección de Motor (por defecto la configurada)
+
+    Returns:
+        dict: Documento insertado (sin _id)
+
+    Raises:
+        ValueError: Si los datos no son válidos (mismas reglas que la creación síncrona)
+        DuplicateKeyError: Si el empno ya existe
+    """
+    collection = collection if collection is not None else get_async_collection()
+    documento, motivo = registro_a_documento(empleado, await _departamentos_conocidos_async(collection))
+    if motivo:
+        raise ValueError(motivo)
+    guardado = (await _guardar_async(collection, [documento]))[0]
+
+    await collection.insert_one(dict(guardado))
+    cache_empleados.guardar(documento["empno"], Empleado.from_dict(documento))
+    catalogo.registrar_empleado(documento)
+    await _marcar_async(collection, deptnos_de([documento]))
+    return documento
+
+async def crear_empleados_async(empleados, collection=None):
+    """
+    Crea varios empleados con un solo insert_many(ordered=False)
+
+    Args:
+        empleados: Lista de diccionarios con los datos de los empleados
+        collection: Colección de Motor (por defecto la configurada)
+
+    Returns:
+        dict: {"insertados": int, "errores": [mensajes], "invalidos": [{"registro", "motivo"}]}
+    """
+    collection = collection if collection is not None else get_async_collection()
+    departamentos = await _departamentos_conocidos_async(collection)
+    documentos = []
+    invalidos = []
+    for empleado in empleados:
+        documento, motivo = registro_a_documento(empleado, departamentos)
+        if motivo:
+            invalidos.append({"registro": empleado, "motivo": motivo})
+        else:
+            documentos.append(documento)
+    if not documentos:
+        return {"insertados": 0, "errores": [], "invalidos": invalidos}
+
+    fallidos = set()
+    try:
+        result = await collection.insert_many(await _guardar_async(collection, documentos), ordered=False)
+        resultado = {"insertados": len(result.inserted_ids), "errores": [], "invalidos": invalidos}
+    except BulkWriteError as e:
+        errores = e.details.get("writeErrors", [])
+        fallidos = {error["index"] for error in errores}
+        resultado = {
+            "insertados": e.details.get("nInserted", 0),
+            "errores": [error.get("errmsg") for error in errores],
+            "invalidos": invalidos,
+        }
+
+    # Solo los insertados: los que fallaron no deben aparecer en el catálogo ni marcar el resumen
+    insertados = [documento for i, documento in enumerate(documentos) if i not in fallidos]
+    for documento in insertados:
+        catalogo.registrar_empleado(documento)
+    await _marcar_async(collection, deptnos_de(insertados))
+    return resultado
+
+async def leer_empleados_async(despues_de=None, limite=TAMANO_PAGINA, collection=None):
+    """
+    Obtiene una página de empleados ordenada por empno (paginación por rango)
+
+    Args:
+        despues_de: Último empno de la página anterior (None para la primera)
+        limite: Empleados por página
+        collection: Colección de Motor (por defecto la configurada)
+
+    Returns:
+        list: Empleados (objetos Empleado) de la página
+    """
+    collection = collection if collection is not None else get_async_collection()
+    filtro = {} if despues_de is None else {"empno": {"$gt": despues_de}}
+    cursor = collection.find(filtro, PROYECCION_LISTA).sort("empno", 1).limit(limite)
+    return await _a_modelos_async(collection, await cursor.to_list(length=limite))
+
+async def obtener_empleado_async(empno, collection=None):
+    """
+    Obtiene un empleado por empno pasando primero por la caché
+
+    Args:
+        empno: Número de empleado
+        collection: Colección de Motor (por defecto la configurada)
+
+    Returns:
+        Empleado: El empleado o None si no existe
+    """
+    collection = collection if collection is not None else get_async_collection()
+    empleado = cache_empleados.obtener(empno)
+    if empleado is None:
+        documento = await collection.find_one({"empno": empno}, PROYECCION_DETALLE)
+        if documento is None:
+            return None
+        empleado = (await _a_modelos_async(collection, [documento]))[0]
+        cache_empleados.guardar(empno, empleado)
+    return empleado
+
+async def obtener_empleados_async(empnos, collection=None):
+    """
+    Obtiene varios empleados en una sola consulta $in
+
+    Args:
+        empnos: Lista de números de empleado
+        collection: Colección de Motor (por defecto la configurada)
+
+    Returns:
+        list: Empleados (objetos Empleado) encontrados ordenados por empno
+    """
+    collection = collection if collection is not None else get_async_collection()
+    cursor = collection.find({"empno": {"$in": list(empnos)}}, PROYECCION_DETALLE).sort("empno", 1)
+    return await _a_modelos_async(collection, await cursor.to_list(length=None))
+
+async def actualizar_empleado_async(empno, cambios, collection=None):
+    """
+    Actualiza los campos indicados de un empleado
+
+    Args:
+        empno: Número de empleado
+        cambios: Diccionario con los campos a modificar (ename, job, sal, departamento)
+        collection: Colección de Motor (por defecto la configurada)
+
+    Returns:
+        bool: True si el empleado existe
+
+    Raises:
+        ValueError: Si los cambios no son válidos (mismas reglas que la actualización síncrona)
+    """
+    collection = collection if collection is not None else get_async_collection()
+    cambios, motivo = registro_a_cambios(cambios, await _departamentos_conocidos_async(collection))
+    if motivo:
+        raise ValueError(motivo)
+    if "ename" in cambios:
+        cambios["ename_search"] = normalizar_nombre(cambios["ename"])
+
+    guardado = (await _guardar_async(collection, [cambios]))[0]
+    anteriores = await _deptnos_actuales_async(collection, [empno])
+    result = await collection.update_one({"empno": empno}, {"$set": guardado})
+    cache_empleados.invalidar(empno)
+    if result.matched_count:
+        catalogo.registrar_empleado(cambios)
+    if result.modified_count:
+        await _marcar_async(collection, anteriores | deptnos_de([cambios]))
+    return result.matched_count > 0
+
+async def eliminar_empleado_async(empno, collection=None):
+    """
+    Elimina un empleado
+
+    Args:
+        empno: Número de empleado
+        collection: Colección de Motor (por defecto la configurada)
+
+    Returns:
+        bool: True si se eliminó
+    """
+    collection = collection if collection is not None else get_async_collection()
+    anteriores = await _deptnos_actuales_async(collection, [empno])
+    result = await collection.delete_one({"empno": empno})
+    cache_empleados.invalidar(empno)
+    if result.deleted_count:
+        await _marcar_async(collection, anteriores)
+    return result.deleted_count > 0
+
+async def buscar_empleados_async(criterio, valor, limite=0, collection=None):
+    """
+    Busca empleados con los mismos criterios que la búsqueda interactiva
+
+    Args:
+        criterio: 'id', 'nombre', 'puesto' o 'departamento'
+        valor: Valor a buscar
+        limite: Máximo de resultados (0 sin límite)
+        collection: Colección de Motor (por defecto la configurada)
+
+    Returns:
+        list: Empleados (objetos Empleado) encontrados
+    """
+    collection = collection if collection is not None else get_async_collection()
+    if criterio == "departamento" and modo_normalizado():
+        filtro = filtro_por_departamento(valor, departamentos=await _departamentos_async(collection))
+    else:
+        filtro = construir_filtro(criterio, valor)
+    cursor = collection.find(filtro, PROYECCION_LISTA)
+    cursor = cursor.sort(orden_por_nombre() if criterio == "nombre" else [("empno", 1)])
+    if limite:
+        cursor = cursor.limit(limite)
+    return await _a_modelos_async(collection, await cursor.to_list(length=limite or None))
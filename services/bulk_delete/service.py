@@ -0,0 +1,275 @@
+"""
+Servicios de eliminación masiva de empleados
+Por filtro (puesto, departamento, rango de salario) en lotes acotados de _id,
+o a partir de un archivo con la lista de empno. Los lotes pequeños evitan que una
+eliminación enorme retenga recursos o sature el oplog de un solo golpe.
+Todas permiten simular: solo cuentan los empleados que se eliminarían
+"""
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from db.mongo_config import get_collection
+from services.bulk_import.readers import leer_registros
+from services.bulk_update.operations import filtro_masivo
+from services.reports.pending import marcar_departamentos
+from services.repository import EmployeeRepository
+from services.shared.cache import cache_empleados
+from services.shared.catalog import catalogo
+from services.shared.input_utils import obtener_dato_opcional
+
+logger = logging.getLogger(__name__)
+
+TAMANO_LOTE_ELIMINACION = int(os.getenv("MONGO_DELETE_BATCH_SIZE", "1000"))
+# Pausa entre lotes para dar respiro a la replicación (0 sin pausa)
+PAUSA_ELIMINACION_MS = int(os.getenv("MONGO_DELETE_PAUSE_MS", "0"))
+
+def _conectar(collection):
+    """Colección indicada o la configurada; lanza ConnectionError si no hay conexión"""
+    if collection is None:
+        collection = get_collection()
+    if collection is None:
+        raise ConnectionError("No se pudo conectar a la base de datos")
+    return collection
+
+def _resumen(simular, coincidencias=0):
+    return {"simulado": simular, "coincidencias": coincidencias, "eliminados": 0, "lotes": 0, "segundos": 0.0, "docs_s": 0.0}
+
+def _registrar_lote(resumen, eliminados, inicio):
+    """Suma un lote al resumen y reporta el progreso"""
+    resumen["eliminados"] += eliminados
+    resumen["lotes"] += 1
+    resumen["segundos"] = time.perf_counter() - inicio
+    resumen["docs_s"] = resumen["eliminados"] / resumen["segundos"] if resumen["segundos"] > 0 else 0.0
+    avance = resumen["eliminados"] / resumen["coincidencias"] if resumen["coincidencias"] else 1.0
+    logger.info(
+        f"🗑️ Lote {resumen['lotes']}: {eliminados} eliminados "
+        f"({resumen['eliminados']:,}/{resumen['coincidencias']:,}, {avance:.0%}) {resumen['docs_s']:,.0f} docs/s"
+    )
+
+def _eliminar_lote(collection, filtro, lote, resumen, inicio, pausa_ms):
+    """Elimina un lote de documentos leídos del cursor y reporta el progreso"""
+    # El filtro se repite para no borrar documentos que dejaron de coincidir
+    resultado = collection.delete_many({"$and": [filtro, {"_id": {"$in": [documento["_id"] for documento in lote]}}]})
+    for documento in lote:
+        cache_empleados.invalidar(documento.get("empno"))
+    marcar_departamentos(collection, {
+        documento["departamento"]["deptno"] for documento in lote if documento.get("departamento")
+    })
+    _registrar_lote(resumen, resultado.deleted_count, inicio)
+    if pausa_ms:
+        time.sleep(pausa_ms / 1000)
+
+def eliminar_por_filtro(job=None, deptno=None, sal_min=None, sal_max=None, simular=False,
+                        tamano_lote=TAMANO_LOTE_ELIMINACION, pausa_ms=PAUSA_ELIMINACION_MS, collection=None):
+    """
+    Elimina los empleados que cumplen un filtro, en lotes tomados de un cursor ordenado por _id
+
+    Args:
+        job: Solo este puesto
+        deptno: Solo este departamento
+        sal_min: Solo salarios desde este valor
+        sal_max: Solo salarios hasta este valor
+        simular: Solo contar
+        tamano_lote: Empleados por delete_many
+        pausa_ms: Milisegundos de espera entre lotes
+        collection: Colección de empleados (por defecto la configurada)
+
+    Returns:
+        dict: {"simulado", "coincidencias", "eliminados", "lotes", "segundos", "docs_s"}
+
+    Raises:
+        ValueError: Si no se indica ningún filtro (para vaciar la colección usa limpiar_coleccion)
+        ConnectionError: Si no hay conexión
+    """
+    filtro = filtro_masivo(job, deptno, sal_min, sal_max)
+    if not filtro:
+        raise ValueError("Indica al menos un filtro (para eliminar todo usa la limpieza de la colección)")
+    collection = _conectar(collection)
+
+    resumen = _resumen(simular, collection.count_documents(filtro))
+    if simular or not resumen["coincidencias"]:
+        return resumen
+
+    inicio = time.perf_counter()
+    # Un solo cursor ordenado por _id entrega los lotes; el servidor resuelve el filtro
+    # y el orden una vez en lugar de repetirlos en cada lote
+    cursor = (
+        collection.find(filtro, {"_id": 1, "empno": 1, "departamento.deptno": 1})
+        .sort("_id", 1)
+        .batch_size(tamano_lote)
+    )
+    try:
+        lote = []
+        for documento in cursor:
+            lote.append(documento)
+            if len(lote) == tamano_lote:
+                _eliminar_lote(collection, filtro, lote, resumen, inicio, pausa_ms)
+                lote = []
+        if lote:
+            _eliminar_lote(collection, filtro, lote, resumen, inicio, 0)
+    finally:
+        cursor.close()
+
+    # Puestos y departamentos pudieron quedarse sin empleados (como en limpiar_coleccion)
+    if resumen["eliminados"]:
+        catalogo.refrescar()
+    logger.info(f"🗑️ Eliminación masiva terminada: {resumen}")
+    return resumen
+
+def leer_empnos(ruta):
+    """
+    Lee una lista de empno de un archivo: CSV o JSONL con la columna/campo empno,
+    o texto con un empno por línea
+
+    Args:
+        ruta: Ruta del archivo
+
+    Yields:
+        tuple: (número de línea, empno o None, error o None)
+    """
+    if Path(ruta).suffix.lower() in (".csv", ".jsonl", ".json"):
+        for linea, registro, error in leer_registros(ruta):
+            valor = registro.get("empno") if isinstance(registro, dict) else registro
+            if error is None:
+                try:
+                    yield linea, int(valor), None
+                    continue
+                except (TypeError, ValueError):
+                    error = f"empno inválido: {json.dumps(valor, default=str)}"
+            yield linea, None, error
+        return
+
+    with open(ruta, "r", encoding="utf-8") as f:
+        for linea, texto in enumerate(f, 1):
+            texto = texto.strip()
+            if not texto or texto.startswith("#"):
+                continue
+            try:
+                yield linea, int(texto.split()[0].rstrip(",")), None
+            except ValueError:
+                yield linea, None, f"empno inválido: {texto!r}"
+
+def eliminar_desde_archivo(ruta, simular=False, tamano_lote=TAMANO_LOTE_ELIMINACION,
+                           pausa_ms=PAUSA_ELIMINACION_MS, collection=None):
+    """
+    Elimina los empleados listados en un archivo, en lotes de delete_many $in
+
+    Args:
+        ruta: Archivo con la lista de empno (ver leer_empnos)
+        simular: Solo contar los que existen
+        tamano_lote: Empleados por delete_many
+        pausa_ms: Milisegundos de espera entre lotes
+        collection: Colección de empleados (por defecto la configurada)
+
+    Returns:
+        dict: Resumen como en eliminar_por_filtro más "leidos", "no_encontrados" (empno)
+              e "invalidos" ({"linea", "motivo"})
+
+    Raises:
+        ConnectionError: Si no hay conexión
+    """
+    repositorio = EmployeeRepository(_conectar(collection))
+    resumen = _resumen(simular)
+    resumen.update(leidos=0, no_encontrados=[], invalidos=[])
+
+    # Se lee la lista completa para conocer el total antes de borrar (solo enteros)
+    empnos = []
+    for linea, empno, error in leer_empnos(ruta):
+        resumen["leidos"] += 1
+        if error is not None:
+            resumen["invalidos"].append({"linea": linea, "motivo": error})
+        else:
+            empnos.append(empno)
+    empnos = list(dict.fromkeys(empnos))
+
+    lotes = []
+    for desde in range(0, len(empnos), tamano_lote):
+        lote = empnos[desde:desde + tamano_lote]
+        existentes = repositorio.existing(lote)
+        resumen["no_encontrados"].extend(empno for empno in lote if empno not in existentes)
+        resumen["coincidencias"] += len(existentes)
+        lotes.append(existentes)
+    if simular:
+        return resumen
+
+    inicio = time.perf_counter()
+    for existentes in lotes:
+        if not existentes:
+            continue
+        _registrar_lote(resumen, repositorio.delete_many(existentes), inicio)
+        if pausa_ms:
+            time.sleep(pausa_ms / 1000)
+
+    if resumen["eliminados"]:
+        catalogo.refrescar()
+    return resumen
+
+def eliminar_masivo():
+    """
+    Eliminación masiva interactiva: muestra cuántos empleados se eliminarían y pide confirmación
+
+    Returns:
+        None: Interacción por consola
+    """
+    print("\n🧹 Eliminación masiva")
+    print("1. Por filtro (puesto, departamento, rango de salario)")
+    print("2. Lista de empno desde archivo (TXT/CSV/JSONL)")
+    opcion = input("\nSelecciona una opción (1-2): ").strip()
+
+    try:
+        if opcion == "1":
+            print("💡 Deja un filtro vacío para no filtrar por ese campo")
+            collection = _conectar(None)
+            job = obtener_dato_opcional(f"Puesto ({', '.join(catalogo.puestos(collection))}): ")
+            deptno = obtener_dato_opcional(f"Departamento ({catalogo.descripcion_departamentos(collection)}): ", int)
+            sal_min = obtener_dato_opcional("Salario mínimo: ", float)
+            sal_max = obtener_dato_opcional("Salario máximo: ", float)
+            operacion = lambda simular: eliminar_por_filtro(job, deptno, sal_min, sal_max, simular=simular,
+                                                            collection=collection)
+        elif opcion == "2":
+            ruta = input("Ruta del archivo: ").strip()
+            if not ruta or ruta.lower() == "cancelar":
+                print("❌ Operación cancelada por el usuario.")
+                return
+            if not os.path.isfile(ruta):
+                print(f"❌ No se encontró el archivo: {ruta}")
+                return
+            operacion = lambda simular: eliminar_desde_archivo(ruta, simular=simular)
+        else:
+            print("❌ Opción inválida")
+            return
+
+        vista_previa = operacion(simular=True)
+        _mostrar_resumen(vista_previa)
+        if not vista_previa["coincidencias"]:
+            print("⚠️ Ningún empleado coincide; no hay nada que eliminar.")
+            return
+
+        print("\n⚠️ Esta acción NO se puede deshacer.")
+        confirmar = input(f"¿Eliminar {vista_previa['coincidencias']:,} empleados? (S/N): ").strip().upper()
+        if confirmar != "S":
+            print("Operación cancelada.")
+            return
+        _mostrar_resumen(operacion(simular=False))
+
+    except (ValueError, ConnectionError) as e:
+        print(f"❌ {e}")
+    except Exception as e:
+        logger.error(f"Error en la eliminación masiva: {e}")
+        print("❌ Error en la eliminación masiva:", e)
+
+def _mostrar_resumen(resumen):
+    """Muestra la vista previa o el resultado de una eliminación masiva"""
+    print("\n📊 Vista previa (sin cambios):" if resumen["simulado"] else "\n📊 Resultado:")
+    print(f"   Empleados que coinciden: {resumen['coincidencias']:,}")
+    if resumen.get("no_encontrados"):
+        print(f"   ⚠️ No existen: {', '.join(map(str, resumen['no_encontrados']))}")
+    for invalido in resumen.get("invalidos", []):
+        print(f"   ⚠️ Línea {invalido['linea']}: {invalido['motivo']}")
+    if not resumen["simulado"]:
+        print(
+            f"   Eliminados: {resumen['eliminados']:,} en {resumen['lotes']} lote(s), "
+            f"{resumen['segundos']:.2f}s ({resumen['docs_s']:,.0f} docs/s)"
+        )
@@ -0,0 +1,57 @@
+"""
+Lectores en streaming para archivos de importación (CSV y JSONL)
+Producen un registro a la vez para no cargar el archivo en memoria
+"""
+import csv
+import json
+from pathlib import Path
+
+FORMATOS_SOPORTADOS = ("csv", "jsonl")
+
+def detectar_formato(ruta):
+    """
+    Determina el formato del archivo a partir de su extensión
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        str: 'csv' o 'jsonl'
+
+    Raises:
+        ValueError: Si la extensión no es soportada
+    """
+    extension = Path(ruta).suffix.lower().lstrip(".")
+    if extension == "json":
+        extension = "jsonl"
+    if extension not in FORMATOS_SOPORTADOS:
+        raise ValueError(f"Formato no soportado: '{extension}' (usa .csv o .jsonl)")
+    return extension
+
+def leer_registros(ruta, formato=None):
+    """
+    Itera los registros de un archivo CSV o JSONL
+
+    Args:
+        ruta: Ruta del archivo
+        formato: 'csv' o 'jsonl' (se detecta por extensión si es None)
+
+    Yields:
+        tuple: (número de línea, registro como diccionario o None si la línea es inválida, error)
+    """
+    formato = formato or detectar_formato(ruta)
+
+    with open(ruta, "r", encoding="utf-8", newline="") as f:
+        if formato == "csv":
+            lector = csv.DictReader(f)
+            for fila in lector:
+                yield lector.line_num, fila, None
+        else:
+            for numero, linea in enumerate(f, 1):
+                linea = linea.strip()
+                if not linea:
+                    continue
+                try:
+                    yield numero, json.loads(linea), None
+                except json.JSONDecodeError as e:
+                    yield numero, None, f"JSON inválido: {e}"
@@ -0,0 +1,183 @@
+"""
+Servicios para importar empleados de forma masiva desde CSV o JSONL
+"""
+import json
+import logging
+import os
+import time
+from pymongo.errors import BulkWriteError
+from db.mongo_config import get_collection
+from services.reports.pending import marcar_departamentos, deptnos_de
+from services.shared.catalog import catalogo
+from services.shared.constants import COLUMNAS_CSV
+from services.shared.departments import para_guardar, registrar_departamentos
+from services.shared.validation import registro_a_documento
+from .readers import leer_registros, detectar_formato
+
+logger = logging.getLogger(__name__)
+
+TAMANO_LOTE_IMPORTACION = int(os.getenv("MONGO_IMPORT_BATCH_SIZE", "1000"))
+
+# Código de error de MongoDB para llave duplicada
+CODIGO_LLAVE_DUPLICADA = 11000
+
+def importar_empleados():
+    """
+    Importa empleados desde un archivo CSV o JSONL de forma interactiva
+
+    Returns:
+        None: Interacción por consola
+    """
+    print("\n📥 Importar empleados desde archivo")
+    print(f"💡 Formatos soportados: CSV ({','.join(COLUMNAS_CSV)}) o JSONL")
+    print("💡 Escribe 'cancelar' para salir\n")
+
+    ruta = input("Ruta del archivo: ").strip()
+    if not ruta or ruta.lower() == 'cancelar':
+        print("❌ Importación cancelada por el usuario.")
+        return
+
+    if not os.path.isfile(ruta):
+        print(f"❌ No se encontró el archivo: {ruta}")
+        return
+
+    entrada = input(f"Tamaño de lote [{TAMANO_LOTE_IMPORTACION}]: ").strip()
+    try:
+        tamano_lote = int(entrada) if entrada else TAMANO_LOTE_IMPORTACION
+        if tamano_lote <= 0:
+            raise ValueError
+    except ValueError:
+        print("❌ El tamaño de lote debe ser un número positivo")
+        return
+
+    importar_archivo(ruta, tamano_lote=tamano_lote)
+
+def importar_archivo(ruta, tamano_lote=TAMANO_LOTE_IMPORTACION, ruta_rechazos=None, formato=None, collection=None):
+    """
+    Importa empleados desde un archivo escribiendo en lotes con insert_many
+    Los registros inválidos o duplicados se guardan en un archivo de rechazos
+
+    Args:
+        ruta: Ruta del archivo CSV o JSONL
+        tamano_lote: Número de documentos por insert_many
+        ruta_rechazos: Archivo JSONL de rechazos (por defecto <ruta>.rechazos.jsonl)
+        formato: 'csv' o 'jsonl' (se detecta por extensión si es None)
+        collection: Colección destino (por defecto la configurada)
+
+    Returns:
+        dict: Resumen con leidos, insertados, duplicados, invalidos y segundos,
+              o None si no hay conexión o el formato no es soportado
+    """
+    if collection is None:
+        collection = get_collection()
+    if collection is None:
+        print("❌ No se pudo conectar a la base de datos")
+        return None
+
+    try:
+        formato = formato or detectar_formato(ruta)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return None
+
+    ruta_rechazos = ruta_rechazos or f"{ruta}.rechazos.jsonl"
+    resumen = {"leidos": 0, "insertados": 0, "duplicados": 0, "invalidos": 0, "segundos": 0.0}
+    inicio = time.perf_counter()
+
+    with open(ruta_rechazos, "w", encoding="utf-8") as rechazos:
+        lote = []
+        numero_lote = 0
+
+        for linea, registro, error in leer_registros(ruta, formato):
+            resumen["leidos"] += 1
+
+            if error is None:
+                documento, error = registro_a_documento(registro)
+
+            if error is not None:
+                resumen["invalidos"] += 1
+                _escribir_rechazo(rechazos, linea, error, registro)
+                continue
+
+            lote.append((linea, registro, documento))
+            if len(lote) >= tamano_lote:
+                numero_lote += 1
+                _insertar_lote(collection, lote, numero_lote, resumen, rechazos)
+                lote = []
+
+        if lote:
+            numero_lote += 1
+            _insertar_lote(collection, lote, numero_lote, resumen, rechazos)
+
+    resumen["segundos"] = time.perf_counter() - inicio
+    _mostrar_resumen(resumen, ruta_rechazos)
+
+    if resumen["duplicados"] == 0 and resumen["invalidos"] == 0:
+        os.remove(ruta_rechazos)
+
+    return resumen
+
+def _insertar_lote(collection, lote, numero_lote, resumen, rechazos):
+    """
+    Inserta un lote con insert_many(ordered=False) y registra los rechazos
+
+    Args:
+        collection: Colección de MongoDB
+        lote: Lista de tuplas (línea, registro original, documento)
+        numero_lote: Número consecutivo del lote
+        resumen: Diccionario de totales a actualizar
+        rechazos: Archivo abierto donde se escriben los rechazos
+    """
+    documentos = [documento for _, _, documento in lote]
+    inicio = time.perf_counter()
+
+    try:
+        registrar_departamentos(collection, documentos)
+        result = collection.insert_many([para_guardar(documento) for documento in documentos], ordered=False)
+        insertados = len(result.inserted_ids)
+    except BulkWriteError as e:
+        # Con ordered=False el servidor continúa después de cada error
+        insertados = e.details.get("nInserted", 0)
+        for error in e.details.get("writeErrors", []):
+            linea, registro, _ = lote[error["index"]]
+            if error.get("code") == CODIGO_LLAVE_DUPLICADA:
+                resumen["duplicados"] += 1
+                _escribir_rechazo(rechazos, linea, "Número de empleado duplicado", registro)
+            else:
+                resumen["invalidos"] += 1
+                _escribir_rechazo(rechazos, linea, error.get("errmsg", "Error de escritura"), registro)
+
+    duracion = time.perf_counter() - inicio
+    resumen["insertados"] += insertados
+
+    for documento in documentos:
+        catalogo.registrar_empleado(documento)
+    marcar_departamentos(collection, deptnos_de(documentos))
+
+    velocidad = insertados / duracion if duracion > 0 else 0
+    print(f"📦 Lote {numero_lote}: {insertados}/{len(lote)} insertados en {duracion:.2f}s ({velocidad:,.0f} docs/s)")
+
+def _escribir_rechazo(rechazos, linea, motivo, registro):
+    """Escribe un registro rechazado en el archivo de rechazos (JSONL)"""
+    rechazos.write(json.dumps(
+        {"linea": linea, "motivo": motivo, "registro": registro},
+        ensure_ascii=False,
+        default=str
+    ) + "\n")
+
+def _mostrar_resumen(resumen, ruta_rechazos):
+    """Muestra el resumen de la importación"""
+    segundos = resumen["segundos"]
+    velocidad = resumen["insertados"] / segundos if segundos > 0 else 0
+
+    print("\n📊 Resumen de importación:")
+    print(f"   Registros leídos: {resumen['leidos']}")
+    print(f"   Insertados: {resumen['insertados']}")
+    print(f"   Duplicados: {resumen['duplicados']}")
+    print(f"   Inválidos: {resumen['invalidos']}")
+    print(f"   Tiempo total: {segundos:.2f}s ({velocidad:,.0f} docs/s)")
+
+    if resumen["duplicados"] or resumen["invalidos"]:
+        print(f"⚠️ Los registros rechazados se guardaron en: {ruta_rechazos}")
+    else:
+        print("✅ Importación completada sin rechazos")
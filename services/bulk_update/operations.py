@@ -0,0 +1,76 @@
+"""
+Filtros y expresiones de las actualizaciones masivas
+La misma expresión calcula el salario nuevo en la simulación ($group) y en la
+escritura (update_many con pipeline), así la vista previa coincide con el resultado
+"""
+
+def filtro_masivo(job=None, deptno=None, sal_min=None, sal_max=None):
+    """
+    Construye el filtro de empleados de una actualización masiva
+
+    Args:
+        job: Puesto exacto
+        deptno: Número de departamento
+        sal_min: Salario mínimo (inclusive)
+        sal_max: Salario máximo (inclusive)
+
+    Returns:
+        dict: Filtro de MongoDB ({} para todos los empleados)
+    """
+    filtro = {}
+    if job:
+        filtro["job"] = job.strip().upper()
+    if deptno is not None:
+        filtro["departamento.deptno"] = deptno
+    if sal_min is not None or sal_max is not None:
+        filtro["sal"] = {}
+        if sal_min is not None:
+            filtro["sal"]["$gte"] = sal_min
+        if sal_max is not None:
+            filtro["sal"]["$lte"] = sal_max
+    return filtro
+
+def expresion_salario(porcentaje=None, monto=None):
+    """
+    Expresión de agregación del salario después de un aumento
+    El resultado se redondea a centavos y nunca queda negativo
+
+    Args:
+        porcentaje: Aumento porcentual (negativo para reducir)
+        monto: Aumento absoluto (negativo para reducir)
+
+    Returns:
+        dict: Expresión sobre el campo $sal
+
+    Raises:
+        ValueError: Si no se indica exactamente uno de los dos
+    """
+    if (porcentaje is None) == (monto is None):
+        raise ValueError("Indica un porcentaje o un monto de aumento (solo uno)")
+    if porcentaje is not None:
+        nuevo = {"$multiply": ["$sal", 1 + porcentaje / 100]}
+    else:
+        nuevo = {"$add": ["$sal", monto]}
+    return {"$round": [{"$max": [0, nuevo]}, 2]}
+
+def pipeline_totales(filtro, salario_nuevo="$sal"):
+    """
+    Pipeline que cuenta los empleados del filtro y suma su salario antes y después
+
+    Args:
+        filtro: Filtro de los empleados afectados
+        salario_nuevo: Expresión del salario después del cambio
+
+    Returns:
+        list: Pipeline con una fila {"empleados", "antes", "despues"} (ninguna si no hay coincidencias)
+    """
+    return [
+        {"$match": filtro},
+        {"$group": {
+            "_id": None,
+            "empleados": {"$sum": 1},
+            "antes": {"$sum": "$sal"},
+            "despues": {"$sum": salario_nuevo},
+            "deptnos": {"$addToSet": "$departamento.deptno"},
+        }},
+    ]
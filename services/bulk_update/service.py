@@ -0,0 +1,357 @@
+"""
+Servicios de actualización masiva de empleados
+Aumentos de salario por filtro y reasignaciones de departamento con un solo update_many,
+y cambios por empleado desde un archivo en lotes de bulk_write.
+Todos permiten simular: muestran los empleados que coinciden y el total de salarios antes/después
+"""
+import logging
+import os
+import time
+from db.mongo_config import get_collection
+from services.bulk_import.readers import leer_registros, detectar_formato
+from services.reports.pending import marcar_departamentos
+from services.repository import EmployeeRepository
+from services.shared.cache import cache_empleados
+from services.shared.catalog import catalogo
+from services.shared.departments import para_guardar, registrar_departamentos
+from services.shared.input_utils import obtener_dato_opcional
+from services.shared.validation import registro_a_cambios
+from .operations import filtro_masivo, expresion_salario, pipeline_totales
+
+logger = logging.getLogger(__name__)
+
+TAMANO_LOTE_ACTUALIZACION = int(os.getenv("MONGO_UPDATE_BATCH_SIZE", "1000"))
+
+def _conectar(collection):
+    """Colección indicada o la configurada; lanza ConnectionError si no hay conexión"""
+    if collection is None:
+        collection = get_collection()
+    if collection is None:
+        raise ConnectionError("No se pudo conectar a la base de datos")
+    return collection
+
+def _totales(collection, filtro, salario_nuevo="$sal"):
+    """Empleados del filtro y su total de salarios antes y después (una sola agregación)"""
+    for fila in collection.aggregate(pipeline_totales(filtro, salario_nuevo)):
+        return fila
+    return {"empleados": 0, "antes": 0.0, "despues": 0.0, "deptnos": []}
+
+def _resumen(totales, simular):
+    return {
+        "simulado": simular,
+        "coincidencias": totales["empleados"],
+        "modificados": 0,
+        "total_antes": round(totales["antes"], 2),
+        "total_despues": round(totales["despues"], 2),
+        "segundos": 0.0,
+        "docs_s": 0.0,
+    }
+
+def _registrar_escritura(resumen, modificados, segundos):
+    """Completa el resumen con lo escrito y la velocidad de la escritura"""
+    resumen["modificados"] = modificados
+    resumen["segundos"] = segundos
+    resumen["docs_s"] = modificados / segundos if segundos > 0 else 0.0
+
+def aumentar_salarios(porcentaje=None, monto=None, job=None, deptno=None, sal_min=None, sal_max=None,
+                      simular=False, collection=None):
+    """
+    Aumenta (o reduce) el salario de todos los empleados que cumplen un filtro
+
+    Args:
+        porcentaje: Aumento porcentual, por ejemplo 5 para +5%
+        monto: Aumento absoluto, por ejemplo 250 (se usa uno de los dos)
+        job: Solo este puesto
+        deptno: Solo este departamento
+        sal_min: Solo salarios desde este valor
+        sal_max: Solo salarios hasta este valor
+        simular: Calcular sin escribir
+        collection: Colección de empleados (por defecto la configurada)
+
+    Returns:
+        dict: {"simulado", "coincidencias", "modificados", "total_antes", "total_despues", "segundos", "docs_s"}
+
+    Raises:
+        ValueError: Si no se indica exactamente uno de porcentaje o monto
+        ConnectionError: Si no hay conexión
+    """
+    salario = expresion_salario(porcentaje, monto)
+    collection = _conectar(collection)
+    filtro = filtro_masivo(job, deptno, sal_min, sal_max)
+
+    totales = _totales(collection, filtro, salario)
+    resumen = _resumen(totales, simular)
+    if simular or not totales["empleados"]:
+        return resumen
+
+    # Un solo update_many con pipeline: el salario nuevo se calcula en el servidor
+    inicio = time.perf_counter()
+    resultado = collection.update_many(filtro, [{"$set": {"sal": salario}}])
+    _registrar_escritura(resumen, resultado.modified_count, time.perf_counter() - inicio)
+
+    # No se sabe qué empno estaban en caché: se descarta completa
+    cache_empleados.limpiar()
+    marcar_departamentos(collection, totales["deptnos"])
+    logger.info(f"💰 Aumento masivo aplicado: {resumen}")
+    return resumen
+
+def reasignar_departamento(origen, destino, job=None, dname=None, loc=None, simular=False, collection=None):
+    """
+    Mueve a otro departamento a los empleados de un departamento
+
+    Args:
+        origen: Departamento actual
+        destino: Departamento nuevo
+        job: Solo los empleados de este puesto
+        dname: Nombre del destino (obligatorio si el departamento no existe; se ignora si existe)
+        loc: Ubicación del destino (obligatoria si el departamento no existe; se ignora si existe)
+        simular: Calcular sin escribir
+        collection: Colección de empleados (por defecto la configurada)
+
+    Returns:
+        dict: Resumen como en aumentar_salarios más "nomina_origen" y "nomina_destino"
+              ({"antes", "despues"} del total de salarios de cada departamento)
+
+    Raises:
+        ValueError: Si origen y destino son iguales o el destino es desconocido
+        ConnectionError: Si no hay conexión
+    """
+    if origen == destino:
+        raise ValueError("El departamento de origen y el de destino son el mismo")
+    collection = _conectar(collection)
+    # Un departamento existente conserva su nombre y ubicación (se renombra con actualizar_departamento)
+    conocido = catalogo.departamento(destino, collection) or {}
+    dname = conocido.get("dname") or dname
+    loc = conocido.get("loc") or loc
+    if not dname or not loc:
+        raise ValueError(f"Departamento {destino} desconocido: indica dname y loc")
+    departamento = {"deptno": destino, "dname": dname.strip().upper(), "loc": loc.strip().upper()}
+
+    filtro = filtro_masivo(job=job, deptno=origen)
+    totales = _totales(collection, filtro)
+    nomina_origen = _totales(collection, {"departamento.deptno": origen})["antes"]
+    nomina_destino = _totales(collection, {"departamento.deptno": destino})["antes"]
+    resumen = _resumen(totales, simular)
+    resumen["nomina_origen"] = {"antes": round(nomina_origen, 2), "despues": round(nomina_origen - totales["antes"], 2)}
+    resumen["nomina_destino"] = {"antes": round(nomina_destino, 2), "despues": round(nomina_destino + totales["antes"], 2)}
+    if simular or not totales["empleados"]:
+        return resumen
+
+    cambios = {"departamento": departamento}
+    registrar_departamentos(collection, [cambios])
+    inicio = time.perf_counter()
+    resultado = collection.update_many(filtro, {"$set": para_guardar(cambios)})
+    _registrar_escritura(resumen, resultado.modified_count, time.perf_counter() - inicio)
+
+    cache_empleados.limpiar()
+    catalogo.registrar_empleado(cambios)
+    marcar_departamentos(collection, (origen, destino))
+    logger.info(f"🏢 Reasignación masiva aplicada: {resumen}")
+    return resumen
+
+def actualizar_desde_archivo(ruta, tamano_lote=TAMANO_LOTE_ACTUALIZACION, simular=False, formato=None, collection=None):
+    """
+    Aplica cambios por empleado leídos de un archivo CSV o JSONL (empno y campos a modificar)
+    Cada lote se escribe con un solo bulk_write del repositorio
+
+    Args:
+        ruta: Ruta del archivo
+        tamano_lote: Empleados por bulk_write
+        simular: Calcular sin escribir
+        formato: 'csv' o 'jsonl' (se detecta por extensión si es None)
+        collection: Colección de empleados (por defecto la configurada)
+
+    Returns:
+        dict: Resumen como en aumentar_salarios más "leidos", "no_encontrados" (empno)
+              e "invalidos" ({"linea", "motivo"})
+
+    Raises:
+        ValueError: Si el formato no es soportado
+        ConnectionError: Si no hay conexión
+    """
+    formato = formato or detectar_formato(ruta)
+    repositorio = EmployeeRepository(_conectar(collection))
+    departamentos = catalogo.departamentos(repositorio.collection)
+
+    resumen = _resumen({"empleados": 0, "antes": 0.0, "despues": 0.0}, simular)
+    resumen.update(leidos=0, no_encontrados=[], invalidos=[])
+    escritura = 0.0
+    lote = {}
+    numero_lote = 0
+
+    for linea, registro, error in leer_registros(ruta, formato):
+        resumen["leidos"] += 1
+        if error is None:
+            # En CSV las columnas vacías significan "sin cambio"
+            registro = {campo: valor for campo, valor in registro.items() if valor not in ("", None)}
+            cambios, error = registro_a_cambios(registro, departamentos)
+        if error is None:
+            try:
+                empno = int(registro.get("empno"))
+            except (TypeError, ValueError):
+                error = f"empno inválido: {registro.get('empno')!r}"
+        if error is not None:
+            resumen["invalidos"].append({"linea": linea, "motivo": error})
+            continue
+
+        # Si un empno se repite en el lote, los cambios posteriores tienen prioridad
+        lote.setdefault(empno, {}).update(cambios)
+        if len(lote) >= tamano_lote:
+            numero_lote += 1
+            escritura += _aplicar_lote(repositorio, lote, numero_lote, resumen, simular)
+            lote = {}
+
+    if lote:
+        numero_lote += 1
+        escritura += _aplicar_lote(repositorio, lote, numero_lote, resumen, simular)
+
+    resumen["total_antes"] = round(resumen["total_antes"], 2)
+    resumen["total_despues"] = round(resumen["total_despues"], 2)
+    if not simular:
+        _registrar_escritura(resumen, resumen["modificados"], escritura)
+    return resumen
+
+def _aplicar_lote(repositorio, lote, numero_lote, resumen, simular):
+    """
+    Calcula los totales de un lote y, si no se simula, lo escribe con bulk_write
+
+    Args:
+        repositorio: EmployeeRepository de la colección
+        lote: empno -> campos a modificar
+        numero_lote: Número consecutivo del lote
+        resumen: Diccionario de totales a actualizar
+        simular: Calcular sin escribir
+
+    Returns:
+        float: Segundos de escritura
+    """
+    salarios = {
+        documento["empno"]: documento.get("sal") or 0.0
+        for documento in repositorio.collection.find({"empno": {"$in": list(lote)}}, {"_id": 0, "empno": 1, "sal": 1})
+    }
+    for empno in lote:
+        if empno not in salarios:
+            resumen["no_encontrados"].append(empno)
+    encontrados = {empno: cambios for empno, cambios in lote.items() if empno in salarios}
+
+    resumen["coincidencias"] += len(encontrados)
+    resumen["total_antes"] += sum(salarios[empno] for empno in encontrados)
+    resumen["total_despues"] += sum(cambios.get("sal", salarios[empno]) for empno, cambios in encontrados.items())
+    if simular or not encontrados:
+        return 0.0
+
+    inicio = time.perf_counter()
+    modificados = repositorio.update_many(encontrados)["modificados"]
+    duracion = time.perf_counter() - inicio
+    resumen["modificados"] += modificados
+
+    velocidad = modificados / duracion if duracion > 0 else 0
+    logger.info(f"📦 Lote {numero_lote}: {modificados}/{len(lote)} modificados en {duracion:.2f}s ({velocidad:,.0f} docs/s)")
+    return duracion
+
+def actualizar_masivo():
+    """
+    Actualización masiva interactiva: muestra una vista previa y pide confirmación
+
+    Returns:
+        None: Interacción por consola
+    """
+    print("\n🧮 Actualización masiva")
+    print("1. Aumento de salario por filtro")
+    print("2. Reasignar departamento")
+    print("3. Cambios por empleado desde archivo (CSV/JSONL)")
+    opcion = input("\nSelecciona una opción (1-3): ").strip()
+
+    try:
+        if opcion == "1":
+            operacion = _pedir_aumento()
+        elif opcion == "2":
+            operacion = _pedir_reasignacion()
+        elif opcion == "3":
+            operacion = _pedir_archivo()
+        else:
+            print("❌ Opción inválida")
+            return
+        if operacion is None:
+            print("❌ Operación cancelada por el usuario.")
+            return
+
+        vista_previa = operacion(simular=True)
+        _mostrar_resumen(vista_previa)
+        if not vista_previa["coincidencias"]:
+            print("⚠️ Ningún empleado coincide; no hay nada que actualizar.")
+            return
+
+        confirmar = input("\n¿Aplicar los cambios? (S/N): ").strip().upper()
+        if confirmar != "S":
+            print("Operación cancelada.")
+            return
+        _mostrar_resumen(operacion(simular=False))
+
+    except (ValueError, ConnectionError) as e:
+        print(f"❌ {e}")
+    except Exception as e:
+        logger.error(f"Error en la actualización masiva: {e}")
+        print("❌ Error en la actualización masiva:", e)
+
+def _pedir_aumento():
+    """Pide el aumento y el filtro; devuelve la operación lista para simular o aplicar"""
+    print("💡 Deja un filtro vacío para no filtrar por ese campo")
+    aumento = input("Aumento (ej. 5% o 250; negativo para reducir): ").strip().replace(",", "")
+    if not aumento or aumento.lower() == "cancelar":
+        return None
+    try:
+        porcentaje, monto = (float(aumento[:-1]), None) if aumento.endswith("%") else (None, float(aumento))
+    except ValueError:
+        raise ValueError(f"Aumento inválido: '{aumento}'")
+
+    collection = _conectar(None)
+    job = obtener_dato_opcional(f"Puesto ({', '.join(catalogo.puestos(collection))}): ")
+    deptno = obtener_dato_opcional(f"Departamento ({catalogo.descripcion_departamentos(collection)}): ", int)
+    sal_min = obtener_dato_opcional("Salario mínimo: ", float)
+    sal_max = obtener_dato_opcional("Salario máximo: ", float)
+    return lambda simular: aumentar_salarios(porcentaje, monto, job, deptno, sal_min, sal_max,
+                                             simular=simular, collection=collection)
+
+def _pedir_reasignacion():
+    """Pide origen, destino y puesto; devuelve la operación lista para simular o aplicar"""
+    collection = _conectar(None)
+    print(f"🏢 Departamentos: {catalogo.descripcion_departamentos(collection)}")
+    origen = obtener_dato_opcional("Departamento de origen: ", int)
+    destino = obtener_dato_opcional("Departamento de destino: ", int)
+    if origen is None or destino is None:
+        return None
+    dname = loc = None
+    if catalogo.departamento(destino, collection) is None:
+        print(f"🆕 El departamento {destino} no existe")
+        dname = obtener_dato_opcional("Nombre del departamento: ")
+        loc = obtener_dato_opcional("Ubicación del departamento: ")
+    job = obtener_dato_opcional("Solo el puesto (ENTER para todos): ")
+    return lambda simular: reasignar_departamento(origen, destino, job, dname, loc, simular=simular,
+                                                  collection=collection)
+
+def _pedir_archivo():
+    """Pide el archivo de cambios; devuelve la operación lista para simular o aplicar"""
+    print("💡 Cada registro lleva empno y los campos a modificar (ename, job, sal, deptno, dname, loc)")
+    ruta = input("Ruta del archivo: ").strip()
+    if not ruta or ruta.lower() == "cancelar":
+        return None
+    if not os.path.isfile(ruta):
+        raise ValueError(f"No se encontró el archivo: {ruta}")
+    return lambda simular: actualizar_desde_archivo(ruta, simular=simular)
+
+def _mostrar_resumen(resumen):
+    """Muestra la vista previa o el resultado de una actualización masiva"""
+    print("\n📊 Vista previa (sin cambios):" if resumen["simulado"] else "\n📊 Resultado:")
+    print(f"   Empleados que coinciden: {resumen['coincidencias']:,}")
+    diferencia = resumen["total_despues"] - resumen["total_antes"]
+    print(f"   Total de salarios: ${resumen['total_antes']:,.2f} → ${resumen['total_despues']:,.2f} ({diferencia:+,.2f})")
+    for clave, titulo in (("nomina_origen", "Nómina del origen"), ("nomina_destino", "Nómina del destino")):
+        if clave in resumen:
+            print(f"   {titulo}: ${resumen[clave]['antes']:,.2f} → ${resumen[clave]['despues']:,.2f}")
+    if resumen.get("no_encontrados"):
+        print(f"   ⚠️ No existen: {', '.join(map(str, resumen['no_encontrados']))}")
+    for invalido in resumen.get("invalidos", []):
+        print(f"   ⚠️ Línea {invalido['linea']}: {invalido['motivo']}")
+    if not resumen["simulado"]:
+        print(f"   Modificados: {resumen['modificados']:,} en {resumen['segundos']:.2f}s ({resumen['docs_s']:,.0f} docs/s)")
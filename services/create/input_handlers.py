@@ -1,7 +1,9 @@
 """
 Manejadores de entrada para creación de empleados
 """
-from services.shared import constants, input_utils
+from services.shared import input_utils
+from services.repository import EmployeeRepository
+from services.shared.catalog import catalogo
 from db.mongo_config import get_collection
 from pymongo.errors import DuplicateKeyError
 
@@ -18,9 +20,8 @@ def obtener_empno():
         elif empno == 'atras':
             return 'atras'
         
-        # Verificar existencia previa
-        collection = get_collection()
-        if collection.find_one({"empno": empno}):
+        # Verificar existencia previa (caché o consulta cubierta por el índice de empno)
+        if EmployeeRepository(get_collection()).exists(empno):
             print(f"❌ Ya existe un empleado con el número {empno}.")
             continue
         
@@ -36,15 +37,16 @@ def obtener_nombre():
 
 def obtener_puesto():
     """Obtiene el puesto del empleado con validación"""
+    collection = get_collection()
     while True:
-        print("\nPuestos disponibles:", ', '.join(sorted(constants.PUESTOS_VALIDOS)))
+        print("\nPuestos disponibles:", ', '.join(catalogo.puestos(collection)))
         job = input("Puesto (o escribe 'nuevo' para crear uno): ").strip().upper()
         
         if job.lower() == 'cancelar':
             return None
         elif job.lower() == 'atras':
             return 'atras'
-        elif job == 'NUEVO' or (job and job not in constants.PUESTOS_VALIDOS):
+        elif job == 'NUEVO' or (job and not catalogo.es_puesto_valido(job, collection)):
             print("\n⚠️ Puesto no reconocido. Puedes:")
             print("1. Crear un nuevo puesto")
             print("2. Elegir uno de los disponibles")
@@ -62,7 +64,7 @@ def obtener_puesto():
                     return None
                 elif nuevo_puesto == 'atras':
                     continue
-                constants.PUESTOS_VALIDOS.add(nuevo_puesto)
+                catalogo.registrar_puesto(nuevo_puesto)
                 return nuevo_puesto
             elif opcion == '2':
                 continue  # Volver a mostrar puestos disponibles
@@ -72,7 +74,7 @@ def obtener_puesto():
                 return None
             else:
                 print("❌ Opción no válida")
-        elif job in constants.PUESTOS_VALIDOS:
+        elif catalogo.es_puesto_valido(job, collection):
             return job
         elif job == '':
             print("❌ Debes seleccionar un puesto")
@@ -90,10 +92,11 @@ def obtener_salario():
 
 def obtener_departamento():
     """Obtiene el departamento con validación"""
+    collection = get_collection()
     while True:
         print("\nDatos del departamento:")
         deptno = input_utils.obtener_dato_numerico(
-            "Número de departamento (10=ACCOUNTING, 20=RESEARCH, 30=SALES): ",
+            f"Número de departamento ({catalogo.descripcion_departamentos(collection)}): ",
             mensaje_error="❌ Número de departamento inválido"
         )
         if deptno is None:  # Usuario canceló
@@ -101,12 +104,8 @@ def obtener_departamento():
         elif deptno == 'atras':
             return 'atras'
         
-        # Mapeo de departamentos predefinidos
-        departamentos = {
-            10: {"deptno": 10, "dname": "ACCOUNTING", "loc": "NEW YORK"},
-            20: {"deptno": 20, "dname": "RESEARCH", "loc": "DALLAS"},
-            30: {"deptno": 30, "dname": "SALES", "loc": "CHICAGO"}
-        }
+        # Departamentos conocidos (catálogo)
+        departamentos = catalogo.departamentos(collection)
         
         if deptno in departamentos:
             return departamentos[deptno]
@@ -4,6 +4,7 @@ Servicios para crear nuevos empleados
 import logging
 from db.mongo_config import get_collection
 from pymongo.errors import DuplicateKeyError
+from services.repository import EmployeeRepository
 from .input_handlers import (
     obtener_empno,
     obtener_nombre,
@@ -120,8 +121,8 @@ def crear_empleado():
                         "departamento": departamento
                     }
                     
-                    result = collection.insert_one(nuevo_empleado)
-                    print(f"\n✅ Empleado creado exitosamente con ID: {result.inserted_id}")
+                    EmployeeRepository(collection).insert(nuevo_empleado)
+                    print(f"\n✅ Empleado creado exitosamente con ID: {empno}")
                     return
                 elif confirmacion == 'N':
                     print("❌ Creación cancelada por el usuario")
@@ -2,13 +2,14 @@
 Control de flujo para eliminación de empleados
 """
 from services.shared.input_utils import obtener_dato_numerico, obtener_dato_texto
+from services.repository import EmployeeRepository
 
 def confirmar_eliminacion(empleado, collection):
     """
     Maneja la confirmación de eliminación de un empleado
     
     Args:
-        empleado: Documento del empleado a eliminar
+        empleado: Empleado a eliminar
         collection: Colección de MongoDB
         
     Returns:
@@ -16,20 +17,19 @@ def confirmar_eliminacion(empleado, collection):
     """
     while True:
         print(f"\n⚠️ Vas a eliminar al empleado:")
-        print(f"   ID: {empleado['empno']}")
-        print(f"   Nombre: {empleado['ename']}")
-        print(f"   Puesto: {empleado['job']}")
-        print(f"   Salario: ${empleado['sal']:,.2f}")
-        if 'departamento' in empleado:
-            print(f"   Departamento: {empleado['departamento']['dname']} ({empleado['departamento']['loc']})")
+        print(f"   ID: {empleado.empno}")
+        print(f"   Nombre: {empleado.ename}")
+        print(f"   Puesto: {empleado.job}")
+        print(f"   Salario: ${empleado.sal:,.2f}")
+        if empleado.departamento.deptno is not None:
+            print(f"   Departamento: {empleado.departamento.dname} ({empleado.departamento.loc})")
         
         print("\n⚠️ Esta acción NO se puede deshacer.")
         confirmar = input("¿Estás seguro de que quieres eliminar este empleado? (S/N/cancelar): ").strip().upper()
         
         if confirmar == 'S':
             # Proceder con eliminación
-            result = collection.delete_one({"empno": empleado['empno']})
-            if result.deleted_count > 0:
+            if EmployeeRepository(collection).delete(empleado.empno) > 0:
                 return 'eliminado'
             else:
                 print("❌ No se pudo eliminar el empleado. Error interno.")
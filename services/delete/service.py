@@ -3,6 +3,7 @@ Servicios para eliminar empleados
 """
 import logging
 from db.mongo_config import get_collection
+from services.repository import EmployeeRepository
 from services.read.service import leer_empleados
 from ui.menus import limpiar_pantalla
 from .flow_control import (
@@ -30,7 +31,7 @@ def eliminar_empleado():
         while True:  # Bucle principal para permitir eliminar múltiples empleados
             # Limpiar pantalla y mostrar lista actual de empleados
             limpiar_pantalla()
-            leer_empleados()
+            leer_empleados(navegar=False, en_vivo=False)
             
             print("\n🗑️ Eliminar empleado")
             print("💡 Puedes escribir 'cancelar' en cualquier momento para salir\n")
@@ -42,7 +43,7 @@ def eliminar_empleado():
                 return
                 
             # Buscar empleado
-            empleado = collection.find_one({"empno": empno})
+            empleado = EmployeeRepository(collection).get(empno)
             if not empleado:
                 print(f"❌ No se encontró un empleado con ID: {empno}")
                 opcion = obtener_opcion_reintento("empleado no encontrado")
@@ -59,8 +60,8 @@ def eliminar_empleado():
                 if resultado_confirmacion == 'eliminado':
                     # Empleado eliminado exitosamente, preguntar si quiere eliminar otro
                     limpiar_pantalla()
-                    leer_empleados()  # Mostrar lista actualizada
-                    print(f"✅ Empleado {empleado['ename']} (ID: {empno}) eliminado exitosamente.\n")
+                    leer_empleados(navegar=False, en_vivo=False)  # Mostrar lista actualizada
+                    print(f"✅ Empleado {empleado.ename} (ID: {empno}) eliminado exitosamente.\n")
                     
                     if preguntar_continuar():
                         continue  # Volver al inicio para eliminar otro empleado
@@ -0,0 +1,182 @@
+"""
+Servicios para exportar empleados a JSONL o CSV en streaming
+"""
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from db.mongo_config import get_collection
+from models.employee import Empleado
+from services.search.queries import CRITERIOS, construir_filtro
+from services.shared.constants import COLUMNAS_CSV
+from services.shared.departments import departamentos_conocidos
+from services.shared.projections import PROYECCION_LISTA
+
+logger = logging.getLogger(__name__)
+
+TAMANO_LOTE_EXPORTACION = int(os.getenv("MONGO_EXPORT_BATCH_SIZE", "1000"))
+FORMATOS_EXPORTACION = ("jsonl", "csv")
+
+def exportar_empleados():
+    """
+    Exporta empleados a un archivo de forma interactiva
+
+    Returns:
+        None: Interacción por consola
+    """
+    print("\n📤 Exportar empleados")
+    print("💡 Escribe 'cancelar' para salir\n")
+
+    formato = input("Formato (jsonl/csv) [jsonl]: ").strip().lower() or "jsonl"
+    if formato == 'cancelar':
+        print("❌ Exportación cancelada por el usuario.")
+        return
+    if formato not in FORMATOS_EXPORTACION:
+        print("❌ Formato no válido. Usa 'jsonl' o 'csv'")
+        return
+
+    print(f"\nCriterios de filtro: {', '.join(CRITERIOS)} (ENTER para exportar todos)")
+    criterio = input("Criterio: ").strip().lower() or None
+    valor = None
+    if criterio == 'cancelar':
+        print("❌ Exportación cancelada por el usuario.")
+        return
+    if criterio is not None:
+        if criterio not in CRITERIOS:
+            print("❌ Criterio no válido")
+            return
+        valor = input("Valor a buscar: ").strip().upper()
+
+    comprimir = input("¿Comprimir con gzip? (S/N) [N]: ").strip().upper() == 'S'
+    extension = f".{formato}.gz" if comprimir else f".{formato}"
+    destino = input(f"Archivo destino [empleados{extension}]: ").strip() or f"empleados{extension}"
+
+    try:
+        filtro = construir_filtro(criterio, valor)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    exportar(destino, formato=formato, filtro=filtro, comprimir=comprimir)
+
+def exportar(destino, formato="jsonl", filtro=None, batch_size=TAMANO_LOTE_EXPORTACION,
+             comprimir=False, collection=None):
+    """
+    Exporta empleados iterando un cursor del servidor por lotes
+    Cada documento se convierte en Empleado y se escribe en cuanto llega, sin acumularlos en memoria
+
+    Args:
+        destino: Ruta del archivo o '-' para la salida estándar
+        formato: 'jsonl' o 'csv'
+        filtro: Filtro de MongoDB (ver services.search.queries)
+        batch_size: Documentos por lote del cursor
+        comprimir: Comprimir la salida con gzip
+        collection: Colección origen (por defecto la configurada)
+
+    Returns:
+        int: Número de empleados exportados o None si hubo un error
+    """
+    if formato not in FORMATOS_EXPORTACION:
+        print(f"❌ Formato no válido: '{formato}'")
+        return None
+
+    if collection is None:
+        collection = get_collection()
+    if collection is None:
+        print("❌ No se pudo conectar a la base de datos")
+        return None
+
+    # Los mensajes de progreso no deben mezclarse con los datos en stdout
+    salida_mensajes = sys.stderr if destino == "-" else sys.stdout
+    cursor = (
+        collection.find(filtro or {}, PROYECCION_LISTA)
+        .sort("empno", 1)
+        .batch_size(batch_size)
+    )
+
+    exportados = 0
+    inicio = time.perf_counter()
+    try:
+        with _abrir_destino(destino, comprimir) as salida:
+            escribir = _crear_escritor(salida, formato)
+            for empleado in Empleado.iter_documents(cursor, departamentos_conocidos(collection)):
+                escribir(empleado)
+                exportados += 1
+                if exportados % (batch_size * 10) == 0:
+                    print(f"📦 {exportados:,} empleados exportados...", file=salida_mensajes)
+    except OSError as e:
+        logger.error(f"Error al exportar empleados: {e}")
+        print(f"❌ Error al escribir el archivo: {e}", file=salida_mensajes)
+        return None
+    finally:
+        cursor.close()
+
+    segundos = time.perf_counter() - inicio
+    velocidad = exportados / segundos if segundos > 0 else 0
+    print(
+        f"✅ Se exportaron {exportados:,} empleados en {segundos:.2f}s ({velocidad:,.0f} docs/s)",
+        file=salida_mensajes
+    )
+    return exportados
+
+@contextmanager
+def _abrir_destino(destino, comprimir):
+    """
+    Abre el destino de la exportación en modo texto
+
+    Args:
+        destino: Ruta del archivo o '-' para la salida estándar
+        comprimir: Envolver la salida con gzip
+    """
+    if destino == "-":
+        if comprimir:
+            with gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb") as gz:
+                with io.TextIOWrapper(gz, encoding="utf-8", newline="") as salida:
+                    yield salida
+        else:
+            yield sys.stdout
+            sys.stdout.flush()
+    elif comprimir:
+        with gzip.open(destino, "wt", encoding="utf-8", newline="") as salida:
+            yield salida
+    else:
+        with open(destino, "w", encoding="utf-8", newline="") as salida:
+            yield salida
+
+def _crear_escritor(salida, formato):
+    """
+    Crea la función que escribe un empleado en el formato solicitado
+
+    Args:
+        salida: Archivo de texto abierto
+        formato: 'jsonl' o 'csv'
+
+    Returns:
+        callable: Función que recibe un Empleado y lo escribe
+    """
+    if formato == "jsonl":
+        def escribir_jsonl(empleado):
+            datos = empleado.to_dict(incluir_busqueda=False)
+            salida.write(json.dumps(datos, ensure_ascii=False, default=str) + "\n")
+        return escribir_jsonl
+
+    escritor = csv.writer(salida)
+    escritor.writerow(COLUMNAS_CSV)
+
+    def escribir_csv(empleado):
+        dept = empleado.departamento
+        escritor.writerow([
+            empleado.empno,
+            empleado.ename,
+            empleado.job,
+            empleado.sal,
+            dept.deptno,
+            dept.dname,
+            dept.loc,
+        ])
+    return escribir_csv
@@ -0,0 +1,65 @@
+"""
+Paginación por rango (keyset) sobre empno
+Evita cargar toda la colección en memoria y el costo de skip()
+"""
+from services.shared.constants import TAMANO_PAGINA, TAMANO_LOTE_CURSOR
+from services.shared.projections import PROYECCION_LISTA
+from services.shared.raw_documents import coleccion_perezosa
+
+def consultar_pagina(collection, despues_de=None, limite=TAMANO_PAGINA, batch_size=TAMANO_LOTE_CURSOR, perezoso=False):
+    """
+    Obtiene un cursor con la página de empleados posterior a un empno
+
+    Args:
+        collection: Colección de MongoDB
+        despues_de: Último empno visto (None para la primera página)
+        limite: Número máximo de empleados a devolver
+        batch_size: Documentos por lote que envía el servidor
+        perezoso: Entregar RawBSONDocument (sin decodificar)
+
+    Returns:
+        Cursor: Cursor ordenado por empno que se consume bajo demanda
+    """
+    filtro = {} if despues_de is None else {"empno": {"$gt": despues_de}}
+    if perezoso:
+        collection = coleccion_perezosa(collection)
+    return (
+        collection.find(filtro, PROYECCION_LISTA)
+        .sort("empno", 1)
+        .limit(limite)
+        .batch_size(min(batch_size, limite))
+    )
+
+class Paginador:
+    """
+    Mantiene el estado de navegación entre páginas
+    Solo guarda el empno de inicio de cada página visitada, no los documentos
+    """
+
+    def __init__(self, tamano_pagina=TAMANO_PAGINA):
+        self.tamano_pagina = tamano_pagina
+        self.despues_de = None   # Cursor de inicio de la página actual
+        self._anteriores = []    # Inicios de las páginas ya visitadas
+        self.numero = 1
+
+    @property
+    def hay_anterior(self):
+        """Indica si existe una página previa"""
+        return bool(self._anteriores)
+
+    def siguiente(self, ultimo_empno):
+        """
+        Avanza a la página que inicia después del último empno mostrado
+
+        Args:
+            ultimo_empno: Último empno de la página actual
+        """
+        self._anteriores.append(self.despues_de)
+        self.despues_de = ultimo_empno
+        self.numero += 1
+
+    def anterior(self):
+        """Regresa a la página previa (si existe)"""
+        if self._anteriores:
+            self.despues_de = self._anteriores.pop()
+            self.numero -= 1
@@ -2,44 +2,174 @@
 Servicios relacionados con la lectura de datos de empleados
 """
 import logging
+from itertools import islice
 from db.mongo_config import get_collection
+from models.employee import Empleado
+from services.shared.change_stream import vigilante_cambios
+from services.shared.constants import LECTURA_PEREZOSA, TAMANO_PAGINA
+from services.shared.departments import departamentos_conocidos
+from .pagination import consultar_pagina, Paginador
 
 logger = logging.getLogger(__name__)
 
-def leer_empleados():
+def leer_empleados(tamano_pagina=TAMANO_PAGINA, navegar=True, en_vivo=True, perezoso=LECTURA_PEREZOSA):
     """
-    Lista todos los empleados ordenados por empno
-    
+    Lista los empleados ordenados por empno, página por página
+    Las filas se imprimen conforme llegan del cursor
+
+    Args:
+        tamano_pagina: Número de empleados por página
+        navegar: Si es False solo muestra la primera página
+        en_vivo: Mostrar los cambios de otros usuarios en la página abierta
+                 (solo si la vigilancia de cambios está activa)
+        perezoso: Pedir documentos sin decodificar; solo se decodifican las filas mostradas
+
     Returns:
         None: Imprime resultados directamente en consola
     """
+    aviso = None
     try:
         collection = get_collection()
         if collection is None:
             print("❌ No se pudo conectar a la base de datos")
             return
 
-        empleados = list(collection.find({}).sort("empno", 1))
-        
-        if not empleados:
-            print("⚠️ No hay empleados registrados.")
-            return
-            
-        print("\n📋 Lista de empleados:")
-        print("-" * 80)
-        print(f"{'ID':<6} {'NOMBRE':<10} {'PUESTO':<12} {'SALARIO':<10} {'DEPARTAMENTO':<15} {'UBICACIÓN'}")
-        print("-" * 80)
-        
-        for emp in empleados:
-            dept = emp.get("departamento", {})
-            print(
-                f"{emp['empno']:<6} {emp['ename']:<10} "
-                f"{emp['job']:<12} ${emp['sal']:<9.2f} "
-                f"{dept.get('dname', 'N/A'):<15} {dept.get('loc', 'N/A')}"
-            )
-            
-        print("-" * 80)
-        
+        paginador = Paginador(tamano_pagina)
+        # Rango de empno de la página abierta: (desde, hasta]; hasta None si es la última
+        pagina = {"desde": None, "hasta": None}
+        if en_vivo and vigilante_cambios.activo:
+            aviso = lambda evento: _mostrar_cambio(evento, pagina, collection)
+            vigilante_cambios.suscribir(aviso)
+
+        while True:
+            mostrados, ultimo_empno, hay_siguiente = _imprimir_pagina(collection, paginador, perezoso)
+
+            if mostrados == 0:
+                print("⚠️ No hay empleados registrados.")
+                return
+
+            if not navegar or not (hay_siguiente or paginador.hay_anterior):
+                return
+
+            pagina.update(desde=paginador.despues_de, hasta=ultimo_empno if hay_siguiente else None)
+            opcion = _obtener_opcion_navegacion(hay_siguiente, paginador.hay_anterior)
+            if opcion == 'S':
+                paginador.siguiente(ultimo_empno)
+            elif opcion == 'A':
+                paginador.anterior()
+            else:
+                return
+
     except Exception as e:
         logger.error(f"Error al leer empleados: {e}")
-        print("❌ Error al leer empleados:", e)
\ No newline at end of file
+        print("❌ Error al leer empleados:", e)
+    finally:
+        if aviso is not None:
+            vigilante_cambios.desuscribir(aviso)
+
+def _mostrar_cambio(evento, pagina, collection):
+    """
+    Imprime un cambio de otro usuario si afecta a la página abierta
+    Se llama desde el hilo de vigilancia mientras la consola espera la navegación
+
+    Args:
+        evento: Evento del vigilante de cambios
+        pagina: Rango de empno de la página abierta
+        collection: Colección de MongoDB
+    """
+    if evento["tipo"] == "recargar":
+        print("\n🔄 La colección cambió por completo; vuelve a listar para ver los datos actuales")
+        return
+
+    empno = evento["empno"]
+    if empno is None:
+        print("\n🗑️ Otro usuario eliminó un empleado")
+        return
+    if (pagina["desde"] is not None and empno <= pagina["desde"]) or (pagina["hasta"] is not None and empno > pagina["hasta"]):
+        return
+
+    if evento["tipo"] == "baja":
+        print(f"\n🗑️ {empno:<6} eliminado por otro usuario")
+    else:
+        simbolo = "➕" if evento["tipo"] == "alta" else "✏️"
+        empleado = Empleado.from_dict(evento["empleado"], departamentos_conocidos(collection))
+        print(f"\n{simbolo} {_fila(empleado)}")
+
+def _imprimir_pagina(collection, paginador, perezoso=False):
+    """
+    Imprime una página de empleados a medida que llegan del servidor
+
+    Args:
+        collection: Colección de MongoDB
+        paginador: Estado de la paginación
+        perezoso: Pedir RawBSONDocument al cursor (el documento extra no se decodifica)
+
+    Returns:
+        tuple: (filas mostradas, último empno mostrado, hay página siguiente)
+    """
+    # Se pide un documento extra solo para saber si existe otra página
+    cursor = consultar_pagina(collection, paginador.despues_de, paginador.tamano_pagina + 1, perezoso=perezoso)
+
+    mostrados = 0
+    ultimo_empno = None
+
+    try:
+        filas = islice(cursor, paginador.tamano_pagina)
+        for empleado in Empleado.iter_documents(filas, departamentos_conocidos(collection)):
+            if mostrados == 0:
+                print(f"\n📋 Lista de empleados (página {paginador.numero}):")
+                print("-" * 80)
+                print(f"{'ID':<6} {'NOMBRE':<10} {'PUESTO':<12} {'SALARIO':<10} {'DEPARTAMENTO':<15} {'UBICACIÓN'}")
+                print("-" * 80)
+
+            print(_fila(empleado))
+            mostrados += 1
+            ultimo_empno = empleado.empno
+        # El documento extra solo indica si hay otra página: se lee sin convertirlo
+        hay_siguiente = mostrados == paginador.tamano_pagina and next(cursor, None) is not None
+    finally:
+        cursor.close()
+
+    if mostrados:
+        print("-" * 80)
+
+    return mostrados, ultimo_empno, hay_siguiente
+
+def _fila(empleado):
+    """Texto de un Empleado con el formato de las columnas del listado"""
+    dept = empleado.departamento
+    return (
+        f"{empleado.empno:<6} {empleado.ename:<10} "
+        f"{empleado.job:<12} ${empleado.sal:<9.2f} "
+        f"{dept.dname or 'N/A':<15} {dept.loc or 'N/A'}"
+    )
+
+def _obtener_opcion_navegacion(hay_siguiente, hay_anterior):
+    """
+    Pregunta al usuario hacia dónde navegar
+
+    Args:
+        hay_siguiente: Si existe una página siguiente
+        hay_anterior: Si existe una página anterior
+
+    Returns:
+        str: 'S' (siguiente), 'A' (anterior) o '' para terminar
+    """
+    opciones = []
+    if hay_siguiente:
+        opciones.append("[S] Siguiente")
+    if hay_anterior:
+        opciones.append("[A] Anterior")
+    opciones.append("ENTER para terminar")
+
+    while True:
+        opcion = input(f"{'  '.join(opciones)}: ").strip().upper()
+
+        if opcion == 'S' and hay_siguiente:
+            return 'S'
+        elif opcion == 'A' and hay_anterior:
+            return 'A'
+        elif opcion in ('', 'CANCELAR'):
+            return ''
+        else:
+            print("❌ Opción no válida")
@@ -0,0 +1,64 @@
+"""
+Registro de departamentos con cambios pendientes de reflejar en el resumen de salarios
+Cada escritura marca los departamentos que toca; la actualización incremental
+del resumen recalcula solo esos departamentos
+"""
+import logging
+from pymongo import UpdateOne
+from services.shared.constants import COLECCION_PENDIENTES
+
+logger = logging.getLogger(__name__)
+
+# Marca especial: el resumen debe recalcularse completo
+TODOS = "todos"
+
+def coleccion_pendientes(collection):
+    """Colección de marcas de la misma base de datos que la de empleados"""
+    return collection.database[COLECCION_PENDIENTES]
+
+def deptnos_de(documentos):
+    """
+    Obtiene los números de departamento de documentos de empleado o cambios
+
+    Returns:
+        set: deptno encontrados
+    """
+    deptnos = set()
+    for documento in documentos:
+        dept = documento.get("departamento")
+        if isinstance(dept, dict) and dept.get("deptno") is not None:
+            deptnos.add(dept["deptno"])
+    return deptnos
+
+def operaciones_marca(deptnos):
+    """Operaciones que marcan departamentos; la versión permite detectar marcas nuevas"""
+    return [UpdateOne({"_id": deptno}, {"$inc": {"version": 1}}, upsert=True) for deptno in deptnos]
+
+def marcar_departamentos(collection, deptnos):
+    """
+    Marca departamentos como pendientes de recalcular en el resumen
+    Un fallo al marcar no debe impedir la escritura que ya se hizo
+
+    Args:
+        collection: Colección de empleados
+        deptnos: Números de departamento (o TODOS)
+    """
+    deptnos = set(deptnos)
+    if not deptnos:
+        return
+    try:
+        coleccion_pendientes(collection).bulk_write(operaciones_marca(deptnos), ordered=False)
+    except Exception as e:
+        logger.error(f"Error al marcar departamentos pendientes del resumen: {e}")
+
+def deptnos_actuales(collection, empnos):
+    """
+    Departamentos actuales de los empleados indicados, antes de modificarlos o eliminarlos
+
+    Returns:
+        set: deptno de esos empleados
+    """
+    empnos = list(empnos)
+    if not empnos:
+        return set()
+    return set(collection.distinct("departamento.deptno", {"empno": {"$in": empnos}}))
@@ -0,0 +1,116 @@
+"""
+Pipelines de agregación del resumen de salarios por departamento y puesto
+"""
+from services.shared.constants import COLECCION_RESUMEN
+
+# Percentiles de salario que se guardan en el resumen
+PERCENTILES_SALARIO = (25, 50, 75, 90)
+
+# Versión del protocolo de MongoDB 7.0, la primera con el acumulador $percentile
+WIRE_VERSION_PERCENTILE = 21
+
+def _clave(por_puesto):
+    """Clave de agrupación: departamento y puesto, o solo departamento"""
+    return {"deptno": "$departamento.deptno", "job": "$job" if por_puesto else None}
+
+def _etapas_rango(por_puesto):
+    """
+    Posición de cada empleado dentro de su grupo ordenado por salario, en ambos sentidos
+    Con el desempate por _id los dos órdenes son exactamente inversos, así que
+    rango + rango_inverso - 1 es el número de empleados del grupo. $documentNumber no
+    guarda la partición en memoria y el ordenamiento usa disco con allowDiskUse
+    """
+    particion = _clave(por_puesto) if por_puesto else "$departamento.deptno"
+    return [
+        {"$setWindowFields": {
+            "partitionBy": particion,
+            "sortBy": {"sal": 1, "_id": 1},
+            "output": {"rango": {"$documentNumber": {}}},
+        }},
+        {"$setWindowFields": {
+            "partitionBy": particion,
+            "sortBy": {"sal": -1, "_id": -1},
+            "output": {"rango_inverso": {"$documentNumber": {}}},
+        }},
+    ]
+
+def _percentil(p):
+    """
+    Acumulador del percentil por rango más cercano a partir de 'rango' y 'rango_inverso'
+    El salario en la posición ceil(p% de los empleados) del grupo ordenado: el más
+    bajo de los que tienen un rango igual o mayor. No junta los salarios en un arreglo
+    """
+    empleados = {"$subtract": [{"$add": ["$rango", "$rango_inverso"]}, 1]}
+    umbral = {"$ceil": {"$multiply": [p / 100, empleados]}}
+    return {"$min": {"$cond": [{"$gte": ["$rango", umbral]}, "$sal", None]}}
+
+def pipeline_resumen(deptnos=None, por_puesto=True, calculado=None, percentil_nativo=False):
+    """
+    Agrega salario total, promedio, mínimo, máximo y percentiles
+    Ningún grupo acumula sus salarios, así que el tamaño de un departamento no
+    está limitado por la memoria de $group ni por el tamaño máximo de un documento
+
+    Args:
+        deptnos: Limitar a estos departamentos (None para todos)
+        por_puesto: Agrupar por departamento y puesto; si es False, solo por departamento
+        calculado: Fecha del cálculo que se guarda en cada fila
+        percentil_nativo: Usar el acumulador $percentile (MongoDB 7.0+, aproximado con
+                          memoria acotada); si es False, percentil exacto por rango
+                          con $setWindowFields (MongoDB 5.0+)
+
+    Returns:
+        list: Pipeline cuyas filas tienen _id {"deptno", "job"} (job None en el total del departamento)
+    """
+    pipeline = []
+    if deptnos is not None:
+        pipeline.append({"$match": {"departamento.deptno": {"$in": list(deptnos)}}})
+
+    grupo = {
+        "_id": _clave(por_puesto),
+        "empleados": {"$sum": 1},
+        "total": {"$sum": "$sal"},
+        "promedio": {"$avg": "$sal"},
+        "minimo": {"$min": "$sal"},
+        "maximo": {"$max": "$sal"},
+    }
+    if percentil_nativo:
+        grupo["percentiles"] = {"$percentile": {
+            "input": "$sal", "p": [p / 100 for p in PERCENTILES_SALARIO], "method": "approximate",
+        }}
+        percentiles = {f"p{p}": {"$arrayElemAt": ["$percentiles", i]} for i, p in enumerate(PERCENTILES_SALARIO)}
+    else:
+        pipeline += _etapas_rango(por_puesto)
+        grupo.update({f"p{p}": _percentil(p) for p in PERCENTILES_SALARIO})
+        percentiles = {f"p{p}": f"$p{p}" for p in PERCENTILES_SALARIO}
+
+    pipeline += [
+        {"$group": grupo},
+        {"$set": {
+            "deptno": "$_id.deptno",
+            "job": "$_id.job",
+            "percentiles": percentiles,
+            "calculado": calculado,
+        }},
+    ]
+    if not percentil_nativo:
+        pipeline.append({"$unset": [f"p{p}" for p in PERCENTILES_SALARIO]})
+    return pipeline
+
+def etapa_merge():
+    """Etapa que materializa las filas en el resumen reemplazando las anteriores"""
+    return {"$merge": {"into": COLECCION_RESUMEN, "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}}
+
+# Totales por puesto a partir de las filas del resumen (sin volver a recorrer los empleados)
+PIPELINE_POR_PUESTO = [
+    {"$match": {"job": {"$ne": None}}},
+    {"$group": {
+        "_id": "$job",
+        "empleados": {"$sum": "$empleados"},
+        "total": {"$sum": "$total"},
+        "minimo": {"$min": "$minimo"},
+        "maximo": {"$max": "$maximo"},
+    }},
+    {"$set": {"job": "$_id", "promedio": {"$divide": ["$total", "$empleados"]}}},
+    {"$project": {"_id": 0}},
+    {"$sort": {"job": 1}},
+]
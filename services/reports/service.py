@@ -0,0 +1,203 @@
+"""
+Reportes de salarios y plantilla por departamento y puesto
+El resumen se materializa con $merge en una colección pequeña y se actualiza de forma
+incremental: solo se recalculan los departamentos que las escrituras marcaron
+"""
+import datetime
+import logging
+import time
+from pymongo import DeleteOne
+from pymongo.errors import PyMongoError
+from db.mongo_config import get_collection
+from services.shared.catalog import catalogo
+from services.shared.constants import COLECCION_RESUMEN
+from .pending import coleccion_pendientes, TODOS
+from .pipelines import pipeline_resumen, etapa_merge, PIPELINE_POR_PUESTO, PERCENTILES_SALARIO, WIRE_VERSION_PERCENTILE
+
+logger = logging.getLogger(__name__)
+
+NIVELES_REPORTE = ("departamento", "departamento_puesto", "puesto")
+
+def coleccion_resumen(collection):
+    """Colección del resumen en la misma base de datos que la de empleados"""
+    return collection.database[COLECCION_RESUMEN]
+
+def _materializar(collection, pipeline):
+    """Escribe las filas del pipeline en el resumen con $merge (sin pasar por el cliente)"""
+    collection.aggregate(pipeline + [etapa_merge()], allowDiskUse=True)
+
+def _percentil_nativo(collection):
+    """
+    Indica si el servidor tiene el acumulador $percentile (MongoDB 7.0+)
+
+    Returns:
+        bool: False también si no se pudo consultar la versión (se usa el cálculo por rango)
+    """
+    try:
+        hello = collection.database.client.admin.command("hello")
+    except PyMongoError as e:
+        logger.warning(f"No se pudo consultar la versión del servidor: {e}")
+        return False
+    return hello.get("maxWireVersion", 0) >= WIRE_VERSION_PERCENTILE
+
+def refrescar_resumen(collection=None, completo=False):
+    """
+    Actualiza el resumen de salarios
+
+    Args:
+        collection: Colección de empleados (por defecto la configurada)
+        completo: Recalcular todos los departamentos aunque no estén marcados
+
+    Returns:
+        dict: {"completo": bool, "departamentos": [deptno] o None si fue completo,
+               "filas": int, "segundos": float} o None si no hay conexión
+    """
+    if collection is None:
+        collection = get_collection()
+    if collection is None:
+        logger.error("No se pudo conectar a la colección")
+        return None
+
+    inicio = time.perf_counter()
+    resumen = coleccion_resumen(collection)
+    pendientes = list(coleccion_pendientes(collection).find())
+    if not completo:
+        # Sin resumen previo no hay nada que actualizar de forma incremental
+        completo = any(marca["_id"] == TODOS for marca in pendientes) or resumen.estimated_document_count() == 0
+
+    deptnos = None if completo else sorted(marca["_id"] for marca in pendientes)
+    if deptnos == []:
+        return {"completo": False, "departamentos": [], "filas": 0, "segundos": time.perf_counter() - inicio}
+
+    # BSON guarda milisegundos: se trunca para poder comparar con lo guardado
+    calculado = datetime.datetime.now(datetime.timezone.utc)
+    calculado = calculado.replace(microsecond=calculado.microsecond // 1000 * 1000)
+    percentil_nativo = _percentil_nativo(collection)
+    for por_puesto in (True, False):
+        _materializar(collection, pipeline_resumen(deptnos, por_puesto, calculado, percentil_nativo))
+
+    # Las filas no recalculadas corresponden a combinaciones que ya no tienen empleados
+    obsoletas = {"calculado": {"$lt": calculado}}
+    if deptnos is not None:
+        obsoletas["deptno"] = {"$in": deptnos}
+    resumen.delete_many(obsoletas)
+
+    # Solo se quitan las marcas que no cambiaron durante el cálculo
+    if pendientes:
+        coleccion_pendientes(collection).bulk_write(
+            [DeleteOne({"_id": marca["_id"], "version": marca.get("version")}) for marca in pendientes],
+            ordered=False,
+        )
+
+    filtro = {} if deptnos is None else {"deptno": {"$in": deptnos}}
+    resultado = {
+        "completo": completo,
+        "departamentos": deptnos,
+        "filas": resumen.count_documents(filtro),
+        "segundos": time.perf_counter() - inicio,
+    }
+    logger.info(f"📊 Resumen de salarios actualizado: {resultado}")
+    return resultado
+
+def obtener_reporte(nivel="departamento", collection=None):
+    """
+    Lee un reporte del resumen materializado
+
+    Args:
+        nivel: 'departamento', 'departamento_puesto' o 'puesto'
+        collection: Colección de empleados (por defecto la configurada)
+
+    Returns:
+        list: Filas del reporte (los percentiles no se incluyen en el nivel 'puesto')
+
+    Raises:
+        ValueError: Si el nivel no existe
+    """
+    if nivel not in NIVELES_REPORTE:
+        raise ValueError(f"Nivel no válido: '{nivel}' (usa {', '.join(NIVELES_REPORTE)})")
+    if collection is None:
+        collection = get_collection()
+    resumen = coleccion_resumen(collection)
+
+    if nivel == "puesto":
+        return list(resumen.aggregate(PIPELINE_POR_PUESTO))
+
+    filtro = {"job": None} if nivel == "departamento" else {"job": {"$ne": None}}
+    filas = list(resumen.find(filtro, {"_id": 0, "calculado": 0}).sort([("deptno", 1), ("job", 1)]))
+    for fila in filas:
+        dept = catalogo.departamento(fila["deptno"], collection) or {}
+        fila["dname"] = dept.get("dname")
+    return filas
+
+def mostrar_reportes():
+    """
+    Muestra los reportes de salarios de forma interactiva
+    Antes de mostrarlos actualiza el resumen con los departamentos pendientes
+
+    Returns:
+        None: Interacción por consola
+    """
+    try:
+        collection = get_collection()
+        if collection is None:
+            print("❌ No se pudo conectar a la base de datos")
+            return
+
+        resultado = refrescar_resumen(collection)
+        if resultado["completo"]:
+            print(f"🔄 Resumen recalculado completo en {resultado['segundos']:.2f}s")
+        elif resultado["departamentos"]:
+            print(
+                f"🔄 Resumen actualizado para {len(resultado['departamentos'])} departamento(s) "
+                f"en {resultado['segundos']:.2f}s"
+            )
+
+        print("\n📊 Reportes de salarios")
+        print("1. Por departamento")
+        print("2. Por departamento y puesto")
+        print("3. Por puesto")
+        opcion = input("\nSelecciona una opción (1-3): ").strip()
+        niveles = {"1": "departamento", "2": "departamento_puesto", "3": "puesto"}
+        if opcion not in niveles:
+            print("❌ Opción inválida")
+            return
+
+        filas = obtener_reporte(niveles[opcion], collection)
+        if not filas:
+            print("⚠️ No hay empleados registrados.")
+            return
+        _imprimir_reporte(filas, niveles[opcion])
+
+    except Exception as e:
+        logger.error(f"Error al mostrar reportes: {e}")
+        print("❌ Error al mostrar reportes:", e)
+
+def _imprimir_reporte(filas, nivel):
+    """Imprime las filas de un reporte como tabla"""
+    con_percentiles = nivel != "puesto"
+    encabezado = f"{'DEPTO':<6} {'NOMBRE':<12} " if nivel != "puesto" else ""
+    if nivel != "departamento":
+        encabezado += f"{'PUESTO':<12} "
+    encabezado += f"{'EMPL.':>7} {'TOTAL':>14} {'PROMEDIO':>10} {'MÍNIMO':>9} {'MÁXIMO':>9}"
+    if con_percentiles:
+        encabezado += "".join(f" {'P' + str(p):>9}" for p in PERCENTILES_SALARIO)
+
+    print("-" * len(encabezado))
+    print(encabezado)
+    print("-" * len(encabezado))
+    for fila in filas:
+        linea = f"{fila['deptno']:<6} {(fila.get('dname') or 'N/A'):<12} " if nivel != "puesto" else ""
+        if nivel != "departamento":
+            linea += f"{fila['job']:<12} "
+        linea += (
+            f"{fila['empleados']:>7,} {_moneda(fila['total']):>14} {_moneda(fila['promedio']):>10} "
+            f"{_moneda(fila['minimo']):>9} {_moneda(fila['maximo']):>9}"
+        )
+        if con_percentiles:
+            linea += "".join(f" {_moneda(fila['percentiles'][f'p{p}']):>9}" for p in PERCENTILES_SALARIO)
+        print(linea)
+    print("-" * len(encabezado))
+
+def _moneda(valor):
+    """Formatea un importe con signo de pesos y separador de miles"""
+    return f"${valor:,.2f}"
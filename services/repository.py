@@ -0,0 +1,303 @@
+"""
+Repositorio de empleados sin interacción por consola
+Concentra el acceso a datos (caché, catálogo, consultas por lotes) para que los
+flujos interactivos, la CLI y los benchmarks usen exactamente el mismo camino
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Union
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from db.mongo_config import get_collection
+from models.employee import Empleado, normalizar_nombre
+from services.search.queries import construir_filtro, filtro_por_departamento, orden_por_nombre
+from services.reports.pending import marcar_departamentos, deptnos_de, deptnos_actuales
+from services.shared.cache import cache_empleados, obtener_empleado, empleado_existe
+from services.shared.catalog import catalogo
+from services.shared.constants import TAMANO_LOTE_CURSOR
+from services.shared.departments import para_guardar, registrar_departamentos, departamentos_conocidos, modo_normalizado
+from services.shared.projections import PROYECCION_LISTA, PROYECCION_DETALLE, PROYECCION_EXISTENCIA
+
+logger = logging.getLogger(__name__)
+
+# Código de error de MongoDB para llave duplicada
+CODIGO_LLAVE_DUPLICADA = 11000
+
+# Campos que cambian el resumen de salarios (services/reports)
+CAMPOS_RESUMEN = ("sal", "job", "departamento")
+
+Documento = Dict
+EmpleadoODocumento = Union[Empleado, Documento]
+
+def _a_documento(empleado: EmpleadoODocumento) -> Documento:
+    """Convierte un Empleado o diccionario en el documento que se guarda"""
+    if isinstance(empleado, Empleado):
+        return empleado.to_dict()
+    documento = dict(empleado)
+    if "ename" in documento:
+        documento["ename_search"] = normalizar_nombre(documento["ename"])
+    return documento
+
+class EmployeeRepository:
+    """
+    Operaciones CRUD por lotes sobre la colección de empleados
+    Los métodos de lectura devuelven objetos Empleado; los de escritura aceptan
+    objetos Empleado o diccionarios
+    """
+
+    def __init__(self, collection=None):
+        """
+        Args:
+            collection: Colección de MongoDB (por defecto la configurada, obtenida al primer uso)
+        """
+        self._collection = collection
+
+    @property
+    def collection(self):
+        """Colección de MongoDB; lanza ConnectionError si no hay conexión"""
+        if self._collection is None:
+            self._collection = get_collection()
+            if self._collection is None:
+                raise ConnectionError("No se pudo conectar a la base de datos")
+        return self._collection
+
+    def _departamentos(self):
+        """Departamentos para completar los modelos en modo normalizado (None en modo embebido)"""
+        return departamentos_conocidos(self.collection)
+
+    # Lectura
+    def get(self, empno: int) -> Optional[Empleado]:
+        """
+        Obtiene un empleado por empno pasando primero por la caché
+
+        Returns:
+            Empleado: El empleado o None si no existe
+        """
+        return obtener_empleado(self.collection, empno)
+
+    def get_many(self, empnos: Iterable[int]) -> List[Empleado]:
+        """
+        Obtiene varios empleados: los que no están en caché se traen con una sola consulta $in
+
+        Args:
+            empnos: Números de empleado
+
+        Returns:
+            list: Empleados encontrados, en el orden solicitado
+        """
+        empnos = list(dict.fromkeys(empnos))
+        encontrados = {}
+        faltantes = []
+        for empno in empnos:
+            empleado = cache_empleados.obtener(empno)
+            if empleado is None:
+                faltantes.append(empno)
+            else:
+                encontrados[empno] = empleado
+
+        if faltantes:
+            cursor = self.collection.find({"empno": {"$in": faltantes}}, PROYECCION_DETALLE)
+            for empleado in Empleado.iter_documents(cursor, self._departamentos()):
+                encontrados[empleado.empno] = empleado
+                cache_empleados.guardar(empleado.empno, empleado)
+
+        return [encontrados[empno] for empno in empnos if empno in encontrados]
+
+    def exists(self, empno: int) -> bool:
+        """Indica si existe un empleado (consulta cubierta por el índice de empno)"""
+        return empleado_existe(self.collection, empno)
+
+    def existing(self, empnos: Iterable[int]) -> set:
+        """
+        Obtiene cuáles de los empno indicados existen, con una sola consulta $in
+
+        Returns:
+            set: empno existentes
+        """
+        empnos = list(empnos)
+        if not empnos:
+            return set()
+        return {
+            documento["empno"]
+            for documento in self.collection.find({"empno": {"$in": empnos}}, PROYECCION_EXISTENCIA)
+        }
+
+    def iter_search(self, filtro: Optional[Dict] = None, limit: int = 0, sort=None,
+                    batch_size: int = TAMANO_LOTE_CURSOR):
+        """
+        Recorre los empleados que cumplen un filtro sin cargarlos todos en memoria
+        Solo se leen los campos del modelo (PROYECCION_LISTA)
+
+        Args:
+            filtro: Filtro de MongoDB (por defecto todos)
+            limit: Máximo de resultados (0 sin límite)
+            sort: Especificación de orden para cursor.sort() (None conserva el orden del servidor)
+            batch_size: Documentos por lote que envía el servidor
+
+        Yields:
+            Empleado: Cada empleado encontrado
+        """
+        cursor = self.collection.find(filtro or {}, PROYECCION_LISTA)
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+        with cursor.batch_size(batch_size) as cursor:
+            # Los empleados comparten departamentos y puestos mientras dura el cursor
+            yield from Empleado.iter_documents(cursor, self._departamentos())
+
+    def search(self, filtro: Optional[Dict] = None, limit: int = 0, sort=None) -> List[Empleado]:
+        """
+        Busca empleados con un filtro de MongoDB (mismos argumentos que iter_search)
+
+        Returns:
+            list: Empleados encontrados
+        """
+        return list(self.iter_search(filtro, limit, sort))
+
+    def search_by(self, criterio: str, valor, limit: int = 0) -> List[Empleado]:
+        """
+        Busca con los criterios de la búsqueda interactiva ('id', 'nombre', 'puesto', 'departamento')
+
+        Raises:
+            ValueError: Si el criterio no existe
+        """
+        orden = orden_por_nombre() if criterio == "nombre" else None
+        return self.search(self.filtro_busqueda(criterio, valor), limit=limit, sort=orden)
+
+    def filtro_busqueda(self, criterio: str, valor) -> Dict:
+        """
+        Filtro de MongoDB de un criterio de búsqueda (ver construir_filtro)
+
+        Raises:
+            ValueError: Si el criterio no existe
+        """
+        if criterio == "departamento" and modo_normalizado():
+            # El nombre se traduce a deptno con el catálogo de esta colección
+            return filtro_por_departamento(valor, departamentos=catalogo.departamentos(self.collection))
+        return construir_filtro(criterio, valor)
+
+    # Escritura
+    def insert(self, empleado: EmpleadoODocumento) -> Documento:
+        """
+        Inserta un empleado
+
+        Returns:
+            dict: Documento insertado (sin _id)
+
+        Raises:
+            DuplicateKeyError: Si el empno ya existe
+        """
+        documento = _a_documento(empleado)
+        registrar_departamentos(self.collection, [documento])
+        self.collection.insert_one(dict(para_guardar(documento)))
+        cache_empleados.guardar(documento["empno"], Empleado.from_dict(documento, self._departamentos()))
+        catalogo.registrar_empleado(documento)
+        marcar_departamentos(self.collection, deptnos_de([documento]))
+        return documento
+
+    def insert_many(self, empleados: Iterable[EmpleadoODocumento]) -> Dict:
+        """
+        Inserta varios empleados con un solo insert_many(ordered=False)
+
+        Returns:
+            dict: {"insertados": int, "duplicados": [empno], "errores": [mensajes]}
+        """
+        documentos = [_a_documento(empleado) for empleado in empleados]
+        resultado = {"insertados": 0, "duplicados": [], "errores": []}
+        if not documentos:
+            return resultado
+
+        registrar_departamentos(self.collection, documentos)
+        try:
+            resultado["insertados"] = len(self.collection.insert_many(
+                [para_guardar(documento) for documento in documentos], ordered=False
+            ).inserted_ids)
+        except BulkWriteError as e:
+            # Con ordered=False el servidor continúa después de cada error
+            resultado["insertados"] = e.details.get("nInserted", 0)
+            fallidos = set()
+            for error in e.details.get("writeErrors", []):
+                fallidos.add(error["index"])
+                if error.get("code") == CODIGO_LLAVE_DUPLICADA:
+                    resultado["duplicados"].append(documentos[error["index"]]["empno"])
+                else:
+                    resultado["errores"].append(error.get("errmsg"))
+            documentos = [documento for i, documento in enumerate(documentos) if i not in fallidos]
+
+        for documento in documentos:
+            catalogo.registrar_empleado(documento)
+        marcar_departamentos(self.collection, deptnos_de(documentos))
+        return resultado
+
+    def update(self, empno: int, cambios: Dict) -> int:
+        """
+        Actualiza los campos indicados de un empleado
+
+        Returns:
+            int: 1 si el empleado existe, 0 si no
+        """
+        return self.update_many({empno: cambios})["coincidencias"]
+
+    def update_many(self, cambios_por_empno: Dict[int, Dict]) -> Dict:
+        """
+        Actualiza varios empleados con un solo bulk_write
+
+        Args:
+            cambios_por_empno: empno -> campos a modificar ($set)
+
+        Returns:
+            dict: {"coincidencias": int, "modificados": int}
+        """
+        registrar_departamentos(self.collection, cambios_por_empno.values())
+        operaciones = [
+            UpdateOne({"empno": empno}, {"$set": para_guardar(_a_documento(cambios))})
+            for empno, cambios in cambios_por_empno.items()
+        ]
+        if not operaciones:
+            return {"coincidencias": 0, "modificados": 0}
+
+        # El resumen cambia en el departamento anterior y en el nuevo
+        afecta_resumen = any(campo in cambios for cambios in cambios_por_empno.values() for campo in CAMPOS_RESUMEN)
+        anteriores = deptnos_actuales(self.collection, cambios_por_empno) if afecta_resumen else set()
+
+        resultado = self.collection.bulk_write(operaciones, ordered=False)
+        for empno in cambios_por_empno:
+            cache_empleados.invalidar(empno)
+        # El catálogo solo aprende puestos y departamentos de empleados que existen
+        if resultado.matched_count:
+            existentes = (
+                cambios_por_empno if resultado.matched_count == len(operaciones)
+                else self.existing(cambios_por_empno)
+            )
+            for empno in existentes:
+                catalogo.registrar_empleado(cambios_por_empno[empno])
+        if resultado.modified_count and afecta_resumen:
+            marcar_departamentos(self.collection, anteriores | deptnos_de(cambios_por_empno.values()))
+        return {"coincidencias": resultado.matched_count, "modificados": resultado.modified_count}
+
+    def delete(self, empno: int) -> int:
+        """
+        Elimina un empleado
+
+        Returns:
+            int: Número de empleados eliminados (0 o 1)
+        """
+        return self.delete_many([empno])
+
+    def delete_many(self, empnos: Iterable[int]) -> int:
+        """
+        Elimina varios empleados con un solo delete_many $in
+
+        Returns:
+            int: Número de empleados eliminados
+        """
+        empnos = list(empnos)
+        if not empnos:
+            return 0
+        deptnos = deptnos_actuales(self.collection, empnos)
+        resultado = self.collection.delete_many({"empno": {"$in": empnos}})
+        for empno in empnos:
+            cache_empleados.invalidar(empno)
+        if resultado.deleted_count:
+            marcar_departamentos(self.collection, deptnos)
+        return resultado.deleted_count
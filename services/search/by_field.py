@@ -3,6 +3,9 @@ Búsqueda de empleados por diferentes campos
 """
 from services.shared.input_utils import obtener_dato_texto, obtener_dato_numerico
 from db.mongo_config import get_collection
+from services.repository import EmployeeRepository
+from services.shared.catalog import catalogo
+from .queries import filtro_por_nombre, orden_por_nombre, filtro_por_puesto, filtro_por_departamento
 from .display import mostrar_detalles_empleado, mostrar_lista_empleados, manejar_despues_resultado
 
 def buscar_por_id(collection):
@@ -14,7 +17,7 @@ def buscar_por_id(collection):
         if empno is None:  # Usuario canceló
             return 'salir'
             
-        empleado = collection.find_one({"empno": empno})
+        empleado = EmployeeRepository(collection).get(empno)
         
         if not empleado:
             print(f"❌ No se encontró un empleado con ID: {empno}")
@@ -32,20 +35,18 @@ def buscar_por_id(collection):
 def buscar_por_nombre(collection):
     """Busca empleados por nombre (búsqueda parcial)"""
     print("\n👤 Búsqueda por nombre")
-    print("💡 Puedes buscar por nombre completo o parcial")
+    print("💡 Puedes buscar por nombre completo o por el inicio del nombre")
     
     while True:
         nombre = obtener_dato_texto("Nombre a buscar: ")
         if nombre is None:  # Usuario canceló
             return 'salir'
             
-        # Búsqueda case-insensitive y parcial
-        empleados = list(collection.find({
-            "ename": {"$regex": nombre, "$options": "i"}
-        }))
+        # Búsqueda sin distinguir mayúsculas, ordenada por relevancia
+        empleados = EmployeeRepository(collection).search(filtro_por_nombre(nombre), sort=orden_por_nombre())
         
         if not empleados:
-            print(f"❌ No se encontraron empleados con nombre que contenga: '{nombre}'")
+            print(f"❌ No se encontraron empleados con el nombre: '{nombre}'")
             opcion = obtener_opcion_reintento("no se encontraron empleados")
             if opcion == 'cancelar':
                 return 'salir'
@@ -62,16 +63,16 @@ def buscar_por_puesto(collection):
     print("\n💼 Búsqueda por puesto")
     
     # Mostrar puestos disponibles
-    puestos_disponibles = collection.distinct("job")
+    puestos_disponibles = catalogo.puestos(collection)
     if puestos_disponibles:
-        print("Puestos disponibles:", ', '.join(sorted(puestos_disponibles)))
+        print("Puestos disponibles:", ', '.join(puestos_disponibles))
     
     while True:
         puesto = obtener_dato_texto("Puesto a buscar: ")
         if puesto is None:  # Usuario canceló
             return 'salir'
             
-        empleados = list(collection.find({"job": puesto}))
+        empleados = EmployeeRepository(collection).search(filtro_por_puesto(puesto))
         
         if not empleados:
             print(f"❌ No se encontraron empleados con puesto: '{puesto}'")
@@ -91,18 +92,16 @@ def buscar_por_departamento(collection):
     print("\n🏢 Búsqueda por departamento")
     
     # Mostrar departamentos disponibles
-    departamentos = collection.distinct("departamento.dname")
+    departamentos = catalogo.nombres_departamentos(collection)
     if departamentos:
-        print("Departamentos disponibles:", ', '.join(sorted(departamentos)))
+        print("Departamentos disponibles:", ', '.join(departamentos))
     
     while True:
         dept_nombre = obtener_dato_texto("Nombre del departamento a buscar: ")
         if dept_nombre is None:  # Usuario canceló
             return 'salir'
             
-        empleados = list(collection.find({
-            "departamento.dname": {"$regex": dept_nombre, "$options": "i"}
-        }))
+        empleados = EmployeeRepository(collection).search(filtro_por_departamento(dept_nombre))
         
         if not empleados:
             print(f"❌ No se encontraron empleados en departamento: '{dept_nombre}'")
@@ -1,36 +1,36 @@
 """
 Visualización de resultados de búsqueda
 """
+from models.employee import Empleado
 
-def mostrar_detalles_empleado(empleado: dict):
+def mostrar_detalles_empleado(empleado: Empleado):
     """Muestra los detalles completos de un empleado"""
     print("\n📋 Información del empleado:")
     print("-" * 60)
-    print(f"ID: {empleado['empno']}")
-    print(f"Nombre: {empleado['ename']}")
-    print(f"Puesto: {empleado['job']}")
-    print(f"Salario: ${empleado['sal']:,.2f}")
+    print(f"ID: {empleado.empno}")
+    print(f"Nombre: {empleado.ename}")
+    print(f"Puesto: {empleado.job}")
+    print(f"Salario: ${empleado.sal:,.2f}")
     
-    dept = empleado.get('departamento', {})
-    if dept:
-        print(f"Departamento: {dept.get('dname', 'N/A')} (#{dept.get('deptno', 'N/A')})")
-        print(f"Ubicación: {dept.get('loc', 'N/A')}")
+    dept = empleado.departamento
+    if dept.deptno is not None:
+        print(f"Departamento: {dept.dname or 'N/A'} (#{dept.deptno})")
+        print(f"Ubicación: {dept.loc or 'N/A'}")
     else:
         print("Departamento: Sin asignar")
     print("-" * 60)
 
 def mostrar_lista_empleados(empleados: list):
-    """Muestra una lista resumida de empleados"""
+    """Muestra una lista resumida de empleados (objetos Empleado)"""
     print("\n" + "="*90)
     print(f"{'ID':<6} {'NOMBRE':<12} {'PUESTO':<12} {'SALARIO':<12} {'DEPARTAMENTO':<20} {'UBICACIÓN'}")
     print("="*90)
     
     for emp in empleados:
-        dept = emp.get('departamento', {})
-        dept_name = dept.get('dname', 'N/A')[:19]  # Truncar si es muy largo
-        dept_loc = dept.get('loc', 'N/A')
+        dept_name = (emp.departamento.dname or 'N/A')[:19]  # Truncar si es muy largo
+        dept_loc = emp.departamento.loc or 'N/A'
         
-        print(f"{emp['empno']:<6} {emp['ename']:<12} {emp['job']:<12} ${emp['sal']:<11,.2f} {dept_name:<20} {dept_loc}")
+        print(f"{emp.empno:<6} {emp.ename:<12} {emp.job:<12} ${emp.sal:<11,.2f} {dept_name:<20} {dept_loc}")
     
     print("="*90)
     
@@ -42,7 +42,7 @@ def mostrar_lista_empleados(empleados: list):
         if ver_detalles:
             try:
                 empno = int(ver_detalles)
-                empleado_detalle = next((emp for emp in empleados if emp['empno'] == empno), None)
+                empleado_detalle = next((emp for emp in empleados if emp.empno == empno), None)
                 if empleado_detalle:
                     mostrar_detalles_empleado(empleado_detalle)
                 else:
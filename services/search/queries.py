@@ -0,0 +1,114 @@
+"""
+Construcción de filtros de búsqueda de empleados
+Compartido por la búsqueda interactiva y la exportación
+"""
+import re
+from models.employee import normalizar_nombre
+from services.shared.catalog import catalogo
+from services.shared.constants import MOTOR_BUSQUEDA, MODO_DEPARTAMENTOS
+
+def filtro_por_id(empno):
+    """Filtro por número de empleado exacto"""
+    return {"empno": int(empno)}
+
+def filtro_por_nombre(nombre, motor=None):
+    """
+    Filtro por nombre según el motor de búsqueda configurado
+    La entrada del usuario siempre se escapa antes de formar una expresión regular
+
+    Args:
+        nombre: Nombre completo o inicio del nombre
+        motor: 'prefijo', 'texto' o 'regex' (por defecto MONGO_SEARCH_ENGINE)
+
+    Returns:
+        dict: Filtro de MongoDB
+    """
+    motor = motor or MOTOR_BUSQUEDA
+    if motor == "texto":
+        return {"$text": {"$search": nombre}}
+    if motor == "regex":
+        return {"ename": {"$regex": re.escape(nombre), "$options": "i"}}
+    # Prefijo anclado: puede recorrer el índice de ename_search
+    return {"ename_search": {"$regex": "^" + re.escape(normalizar_nombre(nombre))}}
+
+def orden_por_nombre(motor=None):
+    """
+    Orden por relevancia para los resultados de la búsqueda por nombre
+
+    Args:
+        motor: 'prefijo', 'texto' o 'regex' (por defecto MONGO_SEARCH_ENGINE)
+
+    Returns:
+        list: Especificación de orden para cursor.sort()
+    """
+    motor = motor or MOTOR_BUSQUEDA
+    if motor == "texto":
+        return [("score", {"$meta": "textScore"})]
+    if motor == "regex":
+        return [("ename", 1)]
+    # La coincidencia exacta es la más corta, por lo que queda primero
+    return [("ename_search", 1)]
+
+def filtro_por_puesto(puesto):
+    """Filtro por puesto exacto"""
+    return {"job": puesto}
+
+def filtro_por_departamento(dept_nombre, motor=None, departamentos=None):
+    """
+    Filtro por nombre de departamento
+    Los nombres se guardan en mayúsculas, por lo que un prefijo anclado
+    sin opciones puede usar el índice de departamento.dname
+
+    Args:
+        dept_nombre: Nombre completo o inicio del nombre del departamento
+        motor: 'regex' conserva la búsqueda parcial en cualquier posición
+        departamentos: deptno -> departamento (modo normalizado; por defecto el catálogo)
+
+    Returns:
+        dict: Filtro de MongoDB
+    """
+    motor = motor or MOTOR_BUSQUEDA
+    if MODO_DEPARTAMENTOS == "normalizado":
+        # Los empleados solo guardan deptno: el nombre se traduce con el catálogo
+        if departamentos is None:
+            from db.mongo_config import get_collection
+            departamentos = catalogo.departamentos(None if catalogo.cargado() else get_collection())
+        buscado = dept_nombre.upper()
+        deptnos = sorted(
+            deptno for deptno, dept in departamentos.items()
+            if dept.get("dname") and (
+                buscado in dept["dname"].upper() if motor == "regex" else dept["dname"].startswith(buscado)
+            )
+        )
+        return {"departamento.deptno": {"$in": deptnos}}
+    if motor == "regex":
+        return {"departamento.dname": {"$regex": re.escape(dept_nombre), "$options": "i"}}
+    return {"departamento.dname": {"$regex": "^" + re.escape(dept_nombre.upper())}}
+
+# Criterios disponibles y la función que construye su filtro
+CRITERIOS = {
+    "id": filtro_por_id,
+    "nombre": filtro_por_nombre,
+    "puesto": filtro_por_puesto,
+    "departamento": filtro_por_departamento,
+}
+
+def construir_filtro(criterio=None, valor=None):
+    """
+    Construye el filtro de MongoDB para un criterio de búsqueda
+
+    Args:
+        criterio: 'id', 'nombre', 'puesto', 'departamento' o None (sin filtro)
+        valor: Valor a buscar
+
+    Returns:
+        dict: Filtro de MongoDB
+
+    Raises:
+        ValueError: Si el criterio no existe
+    """
+    if criterio is None:
+        return {}
+    if criterio not in CRITERIOS:
+        raise ValueError(f"Criterio no válido: '{criterio}' (usa {', '.join(CRITERIOS)})")
+    return CRITERIOS[criterio](valor)
@@ -5,7 +5,8 @@ from .input_utils import (
     obtener_opcion_reintento,
     obtener_dato_texto_opcional
 )
-from .validation import validar_empleado_data
+from .validation import validar_empleado_data, registro_a_documento, registro_a_cambios
+from .projections import PROYECCION_LISTA, PROYECCION_DETALLE, PROYECCION_EXISTENCIA
 
 __all__ = [
     'PUESTOS_VALIDOS',
@@ -13,5 +14,10 @@ __all__ = [
     'obtener_dato_texto',
     'obtener_opcion_reintento',
     'obtener_dato_texto_opcional',
-    'validar_empleado_data'
+    'validar_empleado_data',
+    'registro_a_documento',
+    'registro_a_cambios',
+    'PROYECCION_LISTA',
+    'PROYECCION_DETALLE',
+    'PROYECCION_EXISTENCIA'
 ]
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+Caché en memoria de empleados por empno (LRU con expiración)
+Evita repetir find_one del mismo empleado dentro de una sesión
+Guarda objetos Empleado con el departamento ya resuelto
+"""
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from models.employee import Empleado
+from services.shared.departments import departamentos_conocidos
+from services.shared.projections import PROYECCION_DETALLE, PROYECCION_EXISTENCIA
+
+class CacheEmpleados:
+    """
+    Caché LRU con tiempo de vida (TTL) y tamaño máximo
+    Es segura para usarse desde varios hilos
+    """
+
+    def __init__(self, capacidad=1024, ttl=60.0, habilitado=True):
+        """
+        Args:
+            capacidad: Número máximo de empleados en caché
+            ttl: Segundos que una entrada se considera válida
+            habilitado: Si es False la caché no guarda nada
+        """
+        self.capacidad = capacidad
+        self.ttl = ttl
+        self.habilitado = habilitado and capacidad > 0
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()  # empno -> (expira_en, empleado)
+        self._lock = threading.Lock()
+
+    def obtener(self, empno):
+        """
+        Obtiene una copia del empleado en caché
+        La copia es superficial: el departamento es inmutable y se comparte
+
+        Args:
+            empno: Número de empleado
+
+        Returns:
+            Empleado: El empleado o None si no está o expiró
+        """
+        if not self.habilitado:
+            return None
+
+        with self._lock:
+            entrada = self._entradas.get(empno)
+            if entrada is None or entrada[0] < time.monotonic():
+                if entrada is not None:
+                    del self._entradas[empno]
+                self.fallos += 1
+                return None
+
+            self._entradas.move_to_end(empno)
+            self.aciertos += 1
+            return copy.copy(entrada[1])
+
+    def contiene(self, empno):
+        """Indica si el empleado está en caché y vigente (sin contar acierto/fallo)"""
+        if not self.habilitado:
+            return False
+        with self._lock:
+            entrada = self._entradas.get(empno)
+            return entrada is not None and entrada[0] >= time.monotonic()
+
+    def guardar(self, empno, empleado):
+        """
+        Guarda una copia del empleado, descartando el menos usado si está llena
+
+        Args:
+            empno: Número de empleado
+            empleado: Empleado con el departamento completo
+        """
+        if not self.habilitado:
+            return
+
+        with self._lock:
+            self._entradas[empno] = (time.monotonic() + self.ttl, copy.copy(empleado))
+            self._entradas.move_to_end(empno)
+            while len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+
+    def invalidar(self, empno):
+        """Elimina un empleado de la caché"""
+        with self._lock:
+            self._entradas.pop(empno, None)
+
+    def limpiar(self):
+        """Vacía la caché (por ejemplo, después de operaciones masivas)"""
+        with self._lock:
+            self._entradas.clear()
+
+    def estadisticas(self):
+        """
+        Devuelve los contadores de la caché
+
+        Returns:
+            dict: aciertos, fallos, tasa de aciertos, tamaño y capacidad
+        """
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                "habilitado": self.habilitado,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / total if total else 0.0,
+                "tamano": len(self._entradas),
+                "capacidad": self.capacidad,
+            }
+
+# Instancia global compartida por todos los servicios
+cache_empleados = CacheEmpleados(
+    capacidad=int(os.getenv("MONGO_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("MONGO_CACHE_TTL", "60")),
+    habilitado=os.getenv("MONGO_CACHE_DISABLED", "0") != "1",
+)
+
+def obtener_empleado(collection, empno):
+    """
+    Obtiene un empleado por empno pasando primero por la caché
+
+    Args:
+        collection: Colección de MongoDB
+        empno: Número de empleado
+
+    Returns:
+        Empleado: El empleado o None si no existe
+    """
+    empleado = cache_empleados.obtener(empno)
+    if empleado is not None:
+        return empleado
+
+    documento = collection.find_one({"empno": empno}, PROYECCION_DETALLE)
+    if documento is None:
+        return None
+    empleado = Empleado.from_dict(documento, departamentos_conocidos(collection))
+    cache_empleados.guardar(empno, empleado)
+    return empleado
+
+def empleado_existe(collection, empno):
+    """
+    Verifica si existe un empleado sin traer el documento completo
+
+    Args:
+        collection: Colección de MongoDB
+        empno: Número de empleado
+
+    Returns:
+        bool: True si el empleado existe
+    """
+    if cache_empleados.contiene(empno):
+        return True
+    # Consulta cubierta por el índice único de empno
+    return collection.find_one({"empno": empno}, PROYECCION_EXISTENCIA) is not None
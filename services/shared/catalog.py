@@ -0,0 +1,189 @@
+"""
+Catálogo en memoria de puestos y departamentos
+Se construye una sola vez con agregaciones sobre campos indexados
+y se actualiza de forma incremental cuando las escrituras agregan valores nuevos
+"""
+import logging
+import threading
+from services.shared.constants import (
+    PUESTOS_VALIDOS, DEPARTAMENTOS_PREDEFINIDOS, MODO_DEPARTAMENTOS, COLECCION_DEPARTAMENTOS
+)
+
+logger = logging.getLogger(__name__)
+
+# $sort sobre el campo indexado antes de $group permite recorrer el índice
+PIPELINE_PUESTOS = [
+    {"$sort": {"job": 1}},
+    {"$group": {"_id": "$job"}},
+]
+
+PIPELINE_DEPARTAMENTOS = [
+    {"$match": {"departamento.deptno": {"$exists": True}}},
+    {"$sort": {"departamento.deptno": 1}},
+    {"$group": {
+        "_id": "$departamento.deptno",
+        "dname": {"$first": "$departamento.dname"},
+        "loc": {"$first": "$departamento.loc"},
+    }},
+]
+
+class CatalogoEmpleados:
+    """
+    Catálogo de puestos y departamentos compartido por menús y validaciones
+    """
+
+    def __init__(self):
+        self._puestos = None          # set de puestos
+        self._departamentos = None    # deptno -> {"deptno", "dname", "loc"}
+        self._lock = threading.Lock()
+
+    def _cargar(self, collection):
+        """
+        Construye el catálogo desde la base de datos si aún no se ha cargado
+        Sin colección (o si la consulta falla) devuelve los valores predefinidos
+        sin marcarlo como cargado, para que la siguiente llamada con colección lo construya
+
+        Returns:
+            tuple: (puestos, departamentos); leerlos solo con self._lock tomado
+        """
+        with self._lock:
+            if self._puestos is not None:
+                return self._puestos, self._departamentos
+
+        puestos = set(PUESTOS_VALIDOS)
+        departamentos = {deptno: dict(dept) for deptno, dept in DEPARTAMENTOS_PREDEFINIDOS.items()}
+        if collection is None:
+            return puestos, departamentos
+
+        try:
+            puestos.update(doc["_id"] for doc in collection.aggregate(PIPELINE_PUESTOS) if doc["_id"])
+            if MODO_DEPARTAMENTOS == "normalizado":
+                # La colección de departamentos es la fuente; el catálogo es su caché
+                origen = collection.database[COLECCION_DEPARTAMENTOS].find({}, {"_id": 0})
+            else:
+                origen = (
+                    {"deptno": doc["_id"], "dname": doc.get("dname"), "loc": doc.get("loc")}
+                    for doc in collection.aggregate(PIPELINE_DEPARTAMENTOS)
+                )
+            for doc in origen:
+                departamentos[doc["deptno"]] = {
+                    "deptno": doc["deptno"],
+                    "dname": doc.get("dname"),
+                    "loc": doc.get("loc"),
+                }
+        except Exception as e:
+            # Sin conexión el catálogo funciona con los valores predefinidos
+            logger.error(f"Error al cargar el catálogo: {e}")
+            return puestos, departamentos
+
+        with self._lock:
+            if self._puestos is None:
+                self._puestos = puestos
+                self._departamentos = departamentos
+            return self._puestos, self._departamentos
+
+    def cargado(self):
+        """Indica si el catálogo ya se construyó"""
+        with self._lock:
+            return self._puestos is not None
+
+    def puestos(self, collection=None):
+        """
+        Obtiene los puestos conocidos
+
+        Args:
+            collection: Colección usada para la carga inicial (sin ella, solo los predefinidos
+                        hasta que alguna llamada con colección construya el catálogo)
+
+        Returns:
+            list: Puestos ordenados alfabéticamente
+        """
+        puestos, _ = self._cargar(collection)
+        with self._lock:
+            return sorted(puestos)
+
+    def es_puesto_valido(self, job, collection=None):
+        """Indica si el puesto existe en el catálogo"""
+        puestos, _ = self._cargar(collection)
+        with self._lock:
+            return job in puestos
+
+    def departamentos(self, collection=None):
+        """
+        Obtiene los departamentos conocidos
+
+        Args:
+            collection: Colección usada para la carga inicial
+
+        Returns:
+            dict: deptno -> {"deptno", "dname", "loc"}
+        """
+        _, departamentos = self._cargar(collection)
+        with self._lock:
+            return {deptno: dict(dept) for deptno, dept in departamentos.items()}
+
+    def departamento(self, deptno, collection=None):
+        """
+        Obtiene un departamento por número
+
+        Returns:
+            dict: {"deptno", "dname", "loc"} o None si no existe
+        """
+        _, departamentos = self._cargar(collection)
+        with self._lock:
+            dept = departamentos.get(deptno)
+            return dict(dept) if dept is not None else None
+
+    def nombres_departamentos(self, collection=None):
+        """Obtiene los nombres de departamento ordenados alfabéticamente"""
+        return sorted({dept["dname"] for dept in self.departamentos(collection).values() if dept["dname"]})
+
+    def descripcion_departamentos(self, collection=None):
+        """Texto para los prompts, por ejemplo '10=ACCOUNTING, 20=RESEARCH'"""
+        departamentos = self.departamentos(collection)
+        return ", ".join(f"{deptno}={departamentos[deptno]['dname']}" for deptno in sorted(departamentos))
+
+    def registrar_puesto(self, job):
+        """Agrega un puesto nuevo al catálogo"""
+        with self._lock:
+            if self._puestos is not None and job:
+                self._puestos.add(job)
+
+    def registrar_empleado(self, empleado):
+        """
+        Actualiza el catálogo con el puesto y departamento de un empleado escrito
+
+        Args:
+            empleado: Documento del empleado
+        """
+        dept = empleado.get("departamento") or {}
+        with self._lock:
+            if self._puestos is None:
+                return  # Se cargará completo en el siguiente uso
+            if empleado.get("job"):
+                self._puestos.add(empleado["job"])
+            if dept.get("deptno") is not None and dept["deptno"] not in self._departamentos:
+                self._departamentos[dept["deptno"]] = {
+                    "deptno": dept["deptno"],
+                    "dname": dept.get("dname"),
+                    "loc": dept.get("loc"),
+                }
+
+    def registrar_departamento(self, dept):
+        """Agrega o reemplaza un departamento (por ejemplo, después de renombrarlo)"""
+        with self._lock:
+            if self._departamentos is not None and dept.get("deptno") is not None:
+                self._departamentos[dept["deptno"]] = {
+                    "deptno": dept["deptno"],
+                    "dname": dept.get("dname"),
+                    "loc": dept.get("loc"),
+                }
+
+    def refrescar(self):
+        """Descarta el catálogo para reconstruirlo en el siguiente uso"""
+        with self._lock:
+            self._puestos = None
+            self._departamentos = None
+
+# Instancia global compartida por todos los servicios
+catalogo = CatalogoEmpleados()
@@ -0,0 +1,268 @@
+"""
+Vigilancia de cambios de la colección con change streams
+Un hilo de fondo recibe las escrituras de otros procesos (otras consolas, la API, la CLI),
+invalida las cachés en memoria y avisa a los listados abiertos sin volver a consultar.
+Requiere un replica set (un solo nodo local basta); el resume token se guarda en disco
+para continuar desde el último cambio procesado después de reiniciar
+"""
+import datetime
+import json
+import logging
+import os
+import threading
+from pymongo.errors import OperationFailure, PyMongoError
+from services.shared.cache import cache_empleados
+from services.shared.catalog import catalogo
+from services.shared.constants import ARCHIVO_RESUME_TOKEN, COLECCION_DEPARTAMENTOS, VIGILAR_CAMBIOS
+
+logger = logging.getLogger(__name__)
+
+# Errores del servidor cuando el token ya no está en el oplog o no es válido
+CODIGOS_TOKEN_PERDIDO = {260, 280, 286}
+
+# Versión del protocolo de MongoDB 6.0, la primera con imágenes previas en change streams
+WIRE_VERSION_IMAGEN_PREVIA = 17
+
+# Operaciones que dejan sin validez todo lo que hay en caché
+OPERACIONES_RECARGA = ("drop", "rename", "dropDatabase", "invalidate")
+
+class VigilanteCambios:
+    """
+    Hilo que sigue el change stream de la base de datos y mantiene las cachés al día
+    Los suscriptores reciben un evento por cada cambio de empleado:
+    {"tipo": "alta" | "cambio" | "baja" | "recargar", "empno", "empleado"}
+    """
+
+    def __init__(self, archivo_token=ARCHIVO_RESUME_TOKEN, espera_ms=1000, guardar_cada=100):
+        """
+        Args:
+            archivo_token: Archivo donde se guarda el resume token
+            espera_ms: Espera máxima del servidor por cambios nuevos en cada consulta
+            guardar_cada: Cambios procesados entre escrituras del token
+        """
+        self.archivo_token = archivo_token
+        self.espera_ms = espera_ms
+        self.guardar_cada = guardar_cada
+        self.procesados = 0
+        self._suscriptores = []
+        self._lock = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo = None
+        self._token_guardado = None
+
+    @property
+    def activo(self):
+        """Indica si el hilo de vigilancia está corriendo"""
+        return self._hilo is not None and self._hilo.is_alive()
+
+    def iniciar(self, collection):
+        """
+        Inicia la vigilancia en un hilo de fondo
+
+        Args:
+            collection: Colección de empleados
+
+        Returns:
+            bool: True si quedó activa; False sin replica set o si está desactivada
+        """
+        if self.activo:
+            return True
+        if collection is None or not VIGILAR_CAMBIOS:
+            return False
+
+        hello = _hello(collection)
+        if hello is None or ("setName" not in hello and hello.get("msg") != "isdbgrid"):
+            logger.info("ℹ️ Vigilancia de cambios desactivada: el servidor no es un replica set")
+            return False
+
+        self._detener.clear()
+        imagen_previa = hello.get("maxWireVersion", 0) >= WIRE_VERSION_IMAGEN_PREVIA
+        self._hilo = threading.Thread(
+            target=self._ejecutar, args=(collection, imagen_previa), name="mongo-change-stream", daemon=True
+        )
+        self._hilo.start()
+        logger.info("🔄 Vigilancia de cambios iniciada")
+        return True
+
+    def detener(self, timeout=5.0):
+        """Detiene el hilo; el token se guarda al salir del change stream"""
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+            self._hilo = None
+
+    def suscribir(self, funcion):
+        """Registra una función que recibe cada evento (se llama desde el hilo de vigilancia)"""
+        with self._lock:
+            self._suscriptores.append(funcion)
+
+    def desuscribir(self, funcion):
+        """Quita una función registrada con suscribir()"""
+        with self._lock:
+            if funcion in self._suscriptores:
+                self._suscriptores.remove(funcion)
+
+    def _ejecutar(self, collection, imagen_previa):
+        """Ciclo del hilo: abre el change stream y lo reabre si se cae"""
+        while not self._detener.is_set():
+            try:
+                self._seguir(collection, imagen_previa)
+            except OperationFailure as e:
+                if e.code not in CODIGOS_TOKEN_PERDIDO:
+                    logger.error(f"Error en el change stream: {e}")
+                    self._detener.wait(5)
+                    continue
+                # Los cambios intermedios se perdieron: se empieza de cero sin datos viejos
+                logger.warning(f"⚠️ No se pudo continuar desde el resume token: {e}")
+                self._borrar_token()
+                self._recargar()
+            except PyMongoError as e:
+                # PyMongo ya reintenta una vez los errores reanudables
+                logger.error(f"Error en el change stream: {e}")
+                self._detener.wait(5)
+
+    def _seguir(self, collection, imagen_previa):
+        """Procesa cambios hasta que se pida detener o el stream se invalide"""
+        opciones = {"full_document": "updateLookup", "max_await_time_ms": self.espera_ms}
+        if imagen_previa:
+            # Solo llega si la colección tiene activado changeStreamPreAndPostImages
+            opciones["full_document_before_change"] = "whenAvailable"
+        token = self._leer_token(collection)
+        if token is not None:
+            opciones["start_after"] = token
+
+        pipeline = [{"$match": {"$or": [
+            {"ns.coll": {"$in": [collection.name, COLECCION_DEPARTAMENTOS]}},
+            {"operationType": {"$in": ["dropDatabase", "invalidate"]}},
+        ]}}]
+        pendientes = 0
+        with collection.database.watch(pipeline, **opciones) as stream:
+            try:
+                while stream.alive and not self._detener.is_set():
+                    cambio = stream.try_next()
+                    if cambio is not None:
+                        self._procesar(cambio, collection.name)
+                        pendientes += 1
+                        if pendientes < self.guardar_cada:
+                            continue
+                    # Sin cambios en espera (o tras varios) se guarda el token más reciente
+                    self._guardar_token(collection, stream.resume_token)
+                    pendientes = 0
+            finally:
+                self._guardar_token(collection, stream.resume_token)
+
+    def _procesar(self, cambio, coleccion_empleados):
+        """
+        Aplica un cambio a las cachés y avisa a los suscriptores
+
+        Args:
+            cambio: Documento del change stream
+            coleccion_empleados: Nombre de la colección de empleados
+        """
+        self.procesados += 1
+        operacion = cambio["operationType"]
+        if operacion in OPERACIONES_RECARGA:
+            self._recargar()
+            return
+
+        documento = cambio.get("fullDocument")
+        if cambio.get("ns", {}).get("coll") != coleccion_empleados:
+            # Departamentos del modo normalizado: el catálogo es su caché, y los
+            # empleados en caché llevan la copia anterior del departamento
+            if documento is not None:
+                catalogo.registrar_departamento(documento)
+            else:
+                catalogo.refrescar()
+            cache_empleados.limpiar()
+            return
+
+        if operacion in ("insert", "update", "replace") and documento is not None:
+            documento.pop("_id", None)
+            cache_empleados.invalidar(documento.get("empno"))
+            catalogo.registrar_empleado(documento)
+            evento = {"tipo": "alta" if operacion == "insert" else "cambio", "empno": documento.get("empno"), "empleado": documento}
+        elif operacion in ("update", "replace", "delete"):
+            # Sin el documento no se sabe el empno: se descarta la caché completa
+            previo = cambio.get("fullDocumentBeforeChange") or {}
+            empno = previo.get("empno")
+            if empno is None:
+                cache_empleados.limpiar()
+            else:
+                cache_empleados.invalidar(empno)
+            evento = {"tipo": "baja", "empno": empno, "empleado": None}
+        else:
+            return
+        self._notificar(evento)
+
+    def _recargar(self):
+        """Vacía las cachés y pide a los listados que vuelvan a consultar"""
+        cache_empleados.limpiar()
+        catalogo.refrescar()
+        self._notificar({"tipo": "recargar", "empno": None, "empleado": None})
+
+    def _notificar(self, evento):
+        with self._lock:
+            suscriptores = list(self._suscriptores)
+        for funcion in suscriptores:
+            try:
+                funcion(evento)
+            except Exception as e:
+                logger.error(f"Error al notificar un cambio: {e}")
+
+    def _leer_token(self, collection):
+        """
+        Lee el resume token guardado para esta colección
+
+        Returns:
+            dict: Token o None si no hay uno válido
+        """
+        try:
+            with open(self.archivo_token, "r", encoding="utf-8") as f:
+                datos = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Resume token ilegible, se ignora: {e}")
+            return None
+        if datos.get("ns") != collection.full_name:
+            return None
+        self._token_guardado = datos.get("token")
+        return self._token_guardado
+
+    def _guardar_token(self, collection, token):
+        """Guarda el token de forma atómica (solo si cambió)"""
+        if token is None or token == self._token_guardado:
+            return
+        datos = {
+            "ns": collection.full_name,
+            "token": token,
+            "guardado": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        temporal = f"{self.archivo_token}.tmp"
+        try:
+            with open(temporal, "w", encoding="utf-8") as f:
+                json.dump(datos, f)
+            os.replace(temporal, self.archivo_token)
+            self._token_guardado = token
+        except OSError as e:
+            logger.error(f"No se pudo guardar el resume token: {e}")
+
+    def _borrar_token(self):
+        self._token_guardado = None
+        try:
+            os.remove(self.archivo_token)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"No se pudo borrar el resume token: {e}")
+
+def _hello(collection):
+    """Respuesta del comando hello o None si no se pudo consultar"""
+    try:
+        return collection.database.client.admin.command("hello")
+    except Exception as e:
+        logger.error(f"No se pudo consultar el tipo de servidor: {e}")
+        return None
+
+# Instancia global compartida por la consola y la API
+vigilante_cambios = VigilanteCambios()
@@ -1,6 +1,72 @@
 """
 Constantes compartidas entre servicios
 """
+import logging
+import os
+# El motor de búsqueda por nombre se define junto a los índices que requiere
+from db.indexes import MOTORES_BUSQUEDA, MOTOR_BUSQUEDA
+
+logger = logging.getLogger(__name__)
+
+def entero_env(variable, defecto, minimo=1):
+    """
+    Lee un entero positivo de una variable de entorno
+    Un valor no numérico o menor que el mínimo usa el valor por defecto con un aviso,
+    en lugar de impedir que se importe el módulo
+
+    Args:
+        variable: Nombre de la variable de entorno
+        defecto: Valor si la variable no existe o no es válida
+        minimo: Menor valor aceptado
+
+    Returns:
+        int: Valor configurado o el valor por defecto
+    """
+    valor = os.getenv(variable)
+    if valor is None or not valor.strip():
+        return defecto
+    try:
+        numero = int(valor)
+    except ValueError:
+        numero = None
+    if numero is None or numero < minimo:
+        logger.warning(f"⚠️ Valor inválido para {variable}: {valor!r}; se usa {defecto}")
+        return defecto
+    return numero
+
 PUESTOS_VALIDOS = {
     'CLERK', 'SALESMAN', 'MANAGER', 'ANALYST', 'PRESIDENT'
-}
\ No newline at end of file
+}
+
+# Departamentos base del esquema SCOTT (el catálogo agrega los de la base de datos)
+DEPARTAMENTOS_PREDEFINIDOS = {
+    10: {"deptno": 10, "dname": "ACCOUNTING", "loc": "NEW YORK"},
+    20: {"deptno": 20, "dname": "RESEARCH", "loc": "DALLAS"},
+    30: {"deptno": 30, "dname": "SALES", "loc": "CHICAGO"},
+}
+
+# Paginación de listados (configurable desde .env)
+TAMANO_PAGINA = entero_env("MONGO_PAGE_SIZE", 20)
+TAMANO_LOTE_CURSOR = entero_env("MONGO_BATCH_SIZE", 100)
+# Listados y búsquedas en consola: decodificar cada documento solo al mostrarlo
+LECTURA_PEREZOSA = os.getenv("MONGO_LAZY_DECODE", "0") == "1"
+
+# Columnas de los archivos CSV de importación/exportación
+COLUMNAS_CSV = ("empno", "ename", "job", "sal", "deptno", "dname", "loc")
+
+# Almacenamiento de departamentos: 'embebido' (cada empleado guarda una copia completa)
+# o 'normalizado' (el empleado guarda solo departamento.deptno y los datos viven
+# en la colección de departamentos)
+MODOS_DEPARTAMENTOS = ("embebido", "normalizado")
+MODO_DEPARTAMENTOS = os.getenv("MONGO_DEPT_MODE", "embebido").lower()
+COLECCION_DEPARTAMENTOS = os.getenv("MONGO_DEPT_COLLECTION", "departamentos")
+
+# Reportes materializados: resumen de salarios por departamento/puesto y
+# departamentos con cambios pendientes de reflejar en el resumen
+COLECCION_RESUMEN = os.getenv("MONGO_REPORT_COLLECTION", "resumen_salarios")
+COLECCION_PENDIENTES = os.getenv("MONGO_REPORT_PENDING_COLLECTION", "resumen_pendientes")
+
+# Vigilancia de cambios con change streams (requiere replica set) y archivo
+# donde se guarda el resume token para continuar después de reiniciar
+VIGILAR_CAMBIOS = os.getenv("MONGO_CHANGE_STREAM", "1") != "0"
+ARCHIVO_RESUME_TOKEN = os.getenv("MONGO_RESUME_TOKEN_FILE", ".resume_token.json")
@@ -0,0 +1,194 @@
+"""
+Almacenamiento de departamentos embebido o normalizado (MONGO_DEPT_MODE)
+En modo normalizado los empleados guardan solo departamento.deptno; el nombre y la
+ubicación viven en la colección de departamentos y se resuelven con el catálogo
+en memoria (al crear los Empleado) o con $lookup (agregaciones en el servidor)
+"""
+import logging
+from pymongo import ASCENDING, UpdateOne
+from services.shared.catalog import catalogo
+from services.shared.constants import (
+    DEPARTAMENTOS_PREDEFINIDOS, MODO_DEPARTAMENTOS, COLECCION_DEPARTAMENTOS
+)
+
+logger = logging.getLogger(__name__)
+
+# Reconstruye el departamento completo en el servidor a partir de departamento.deptno
+ETAPAS_LOOKUP = [
+    {"$lookup": {
+        "from": COLECCION_DEPARTAMENTOS,
+        "localField": "departamento.deptno",
+        "foreignField": "deptno",
+        "as": "_departamento",
+    }},
+    {"$unwind": {"path": "$_departamento", "preserveNullAndEmptyArrays": True}},
+    {"$set": {
+        "departamento.dname": "$_departamento.dname",
+        "departamento.loc": "$_departamento.loc",
+    }},
+    {"$project": {"_departamento": 0}},
+]
+
+def modo_normalizado():
+    """Indica si los empleados guardan solo la referencia a su departamento"""
+    return MODO_DEPARTAMENTOS == "normalizado"
+
+def coleccion_departamentos(collection):
+    """Colección de departamentos de la misma base de datos que la de empleados"""
+    return collection.database[COLECCION_DEPARTAMENTOS]
+
+def reducir_departamento(documento):
+    """
+    Deja en el documento solo la referencia departamento.deptno
+
+    Args:
+        documento: Documento de empleado o cambios de una actualización
+
+    Returns:
+        dict: Copia del documento (o el mismo si no había nada que reducir)
+    """
+    dept = documento.get("departamento")
+    if not isinstance(dept, dict) or set(dept) <= {"deptno"}:
+        return documento
+    documento = dict(documento)
+    documento["departamento"] = {"deptno": dept.get("deptno")}
+    return documento
+
+def para_guardar(documento):
+    """Prepara un documento para escribirlo según el modo configurado"""
+    return reducir_departamento(documento) if modo_normalizado() else documento
+
+def completar_departamento(documento, departamentos):
+    """
+    Agrega dname y loc a un documento que solo tiene departamento.deptno (lo modifica)
+
+    Args:
+        documento: Documento de empleado
+        departamentos: deptno -> {"deptno", "dname", "loc"}
+
+    Returns:
+        dict: El mismo documento
+    """
+    dept = documento.get("departamento")
+    if isinstance(dept, dict) and "dname" not in dept:
+        conocido = departamentos.get(dept.get("deptno"))
+        if conocido is not None:
+            dept["dname"] = conocido.get("dname")
+            dept["loc"] = conocido.get("loc")
+    return documento
+
+def departamentos_conocidos(collection=None):
+    """
+    Departamentos para completar los modelos Empleado (ver Empleado.iter_documents)
+
+    Args:
+        collection: Colección de empleados usada para la carga inicial del catálogo
+
+    Returns:
+        dict: deptno -> departamento en modo normalizado, None en modo embebido
+    """
+    return catalogo.departamentos(collection) if modo_normalizado() else None
+
+def etapas_lookup():
+    """
+    Etapas a insertar en un pipeline sobre la colección de empleados para contar
+    con dname y loc; en modo embebido no se necesita ninguna
+
+    Returns:
+        list: Etapas de agregación
+    """
+    return list(ETAPAS_LOOKUP) if modo_normalizado() else []
+
+def operaciones_alta(departamentos):
+    """Operaciones que crean los departamentos que falten sin modificar los existentes"""
+    return [
+        UpdateOne(
+            {"deptno": dept["deptno"]},
+            {"$setOnInsert": {"deptno": dept["deptno"], "dname": dept.get("dname"), "loc": dept.get("loc")}},
+            upsert=True,
+        )
+        for dept in departamentos
+    ]
+
+def preparar_departamentos(collection):
+    """
+    Crea el índice único de deptno y los departamentos predefinidos en la colección
+    de departamentos (idempotente)
+
+    Args:
+        collection: Colección de empleados
+    """
+    departamentos = coleccion_departamentos(collection)
+    departamentos.create_index([("deptno", ASCENDING)], name="deptno_unico", unique=True)
+    departamentos.bulk_write(operaciones_alta(DEPARTAMENTOS_PREDEFINIDOS.values()), ordered=False)
+
+def registrar_departamentos(collection, documentos):
+    """
+    En modo normalizado crea en la colección de departamentos los que traen los
+    documentos y aún no existen; los existentes no se modifican (ver actualizar_departamento)
+
+    Args:
+        collection: Colección de empleados
+        documentos: Documentos de empleado o cambios con el departamento completo
+
+    Returns:
+        int: Departamentos nuevos
+    """
+    if not modo_normalizado():
+        return 0
+
+    nuevos = {}
+    for documento in documentos:
+        dept = documento.get("departamento")
+        if not isinstance(dept, dict) or dept.get("deptno") is None or not dept.get("dname"):
+            continue
+        if dept["deptno"] not in nuevos and catalogo.departamento(dept["deptno"], collection) is None:
+            nuevos[dept["deptno"]] = dept
+
+    if nuevos:
+        coleccion_departamentos(collection).bulk_write(operaciones_alta(nuevos.values()), ordered=False)
+        for dept in nuevos.values():
+            catalogo.registrar_departamento(dept)
+    return len(nuevos)
+
+def actualizar_departamento(collection, deptno, dname=None, loc=None):
+    """
+    Renombra o reubica un departamento
+    En modo normalizado se escribe un solo documento; en modo embebido se reescribe
+    además cada empleado del departamento
+
+    Args:
+        collection: Colección de empleados
+        deptno: Número de departamento
+        dname: Nuevo nombre (None lo conserva)
+        loc: Nueva ubicación (None la conserva)
+
+    Returns:
+        dict: {"departamentos": int, "empleados": int} documentos modificados
+    """
+    cambios = {campo: valor for campo, valor in (("dname", dname), ("loc", loc)) if valor is not None}
+    if not cambios:
+        return {"departamentos": 0, "empleados": 0}
+
+    resultado = {"departamentos": 0, "empleados": 0}
+    if modo_normalizado():
+        actualizado = coleccion_departamentos(collection).update_one(
+            {"deptno": deptno}, {"$set": cambios}
+        )
+        resultado["departamentos"] = actualizado.modified_count
+    else:
+        actualizado = collection.update_many(
+            {"departamento.deptno": deptno},
+            {"$set": {f"departamento.{campo}": valor for campo, valor in cambios.items()}},
+        )
+        resultado["empleados"] = actualizado.modified_count
+
+    # Las entradas en caché tienen la copia anterior del departamento (en ambos modos)
+    from services.shared.cache import cache_empleados
+    cache_empleados.limpiar()
+
+    actual = catalogo.departamento(deptno, collection) or {"deptno": deptno}
+    actual.update(cambios)
+    catalogo.registrar_departamento(actual)
+    logger.info(f"🏢 Departamento {deptno} actualizado: {resultado}")
+    return resultado
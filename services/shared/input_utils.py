@@ -158,4 +158,26 @@ def obtener_dato_texto_opcional(
         return valor.upper()
     
     print("❌ Demasiados intentos fallidos. Operación cancelada.")
-    return None
\ No newline at end of file
+    return None
+
+def obtener_dato_opcional(prompt: str, tipo=str):
+    """
+    Obtiene un dato que puede dejarse vacío (por ejemplo, un filtro opcional)
+    
+    Args:
+        prompt: Mensaje para mostrar
+        tipo: Tipo del valor (str, int o float)
+        
+    Returns:
+        Valor convertido o None si se dejó vacío
+        
+    Raises:
+        ValueError: Si el valor no es del tipo esperado
+    """
+    valor = input(prompt).strip()
+    if not valor:
+        return None
+    try:
+        return tipo(valor)
+    except ValueError:
+        raise ValueError(f"Valor inválido: '{valor}'")
@@ -0,0 +1,22 @@
+"""
+Proyecciones compartidas para las consultas de empleados
+Cada vista solicita únicamente los campos que va a mostrar
+"""
+
+# Campos que muestran los listados y la vista de detalle desde un listado
+PROYECCION_LISTA = {
+    "_id": 0,
+    "empno": 1,
+    "ename": 1,
+    "job": 1,
+    "sal": 1,
+    "departamento.deptno": 1,
+    "departamento.dname": 1,
+    "departamento.loc": 1,
+}
+
+# Documento completo sin el _id interno (detalle, actualización, eliminación)
+PROYECCION_DETALLE = {"_id": 0}
+
+# Solo el empno: la consulta queda cubierta por el índice único de empno
+PROYECCION_EXISTENCIA = {"_id": 0, "empno": 1}
@@ -0,0 +1,37 @@
+"""
+Documentos BSON sin decodificar para el listado de la consola
+El cursor entrega RawBSONDocument (solo los bytes); cada fila se decodifica completa,
+con el decodificador en C, cuando se convierte en Empleado para mostrarla. El documento
+extra que solo indica si existe otra página nunca se decodifica. Como el listado ya pide
+solo los campos que muestra (PROYECCION_LISTA), el ahorro es ese documento por página
+"""
+import logging
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+logger = logging.getLogger(__name__)
+
+OPCIONES_PEREZOSAS = CodecOptions(document_class=RawBSONDocument)
+
+# Evita repetir el aviso de backend sin soporte en cada página
+_aviso_sin_soporte = False
+
+def coleccion_perezosa(collection):
+    """
+    La misma colección pero con cursores que entregan RawBSONDocument
+
+    Args:
+        collection: Colección de MongoDB
+
+    Returns:
+        Collection: Colección con OPCIONES_PEREZOSAS (solo para lecturas), o la misma
+                    colección si el backend no admite otro document_class (mongomock)
+    """
+    global _aviso_sin_soporte
+    try:
+        return collection.with_options(codec_options=OPCIONES_PEREZOSAS)
+    except NotImplementedError:
+        if not _aviso_sin_soporte:
+            _aviso_sin_soporte = True
+            logger.warning("⚠️ MONGO_LAZY_DECODE=1 ignorado: el backend no admite RawBSONDocument")
+        return collection
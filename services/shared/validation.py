@@ -1,10 +1,11 @@
 """
 Funciones de validación para datos de empleados
 """
+from models.employee import Empleado
 
-def validar_empleado_data(empno: int, ename: str, job: str, sal: float) -> bool:
+def motivo_invalido(empno: int, ename: str, job: str, sal: float):
     """
-    Valida los datos básicos de un empleado
+    Revisa los datos básicos de un empleado sin imprimir nada
     
     Args:
         empno: Número de empleado
@@ -13,22 +14,145 @@ def validar_empleado_data(empno: int, ename: str, job: str, sal: float) -> bool:
         sal: Salario del empleado
         
     Returns:
-        bool: True si los datos son válidos, False de lo contrario
+        str: Motivo por el que los datos no son válidos o None si son válidos
     """
     if empno <= 0:
-        print("❌ El número de empleado debe ser positivo")
-        return False
+        return "El número de empleado debe ser positivo"
     
     if not ename or len(ename.strip()) == 0:
-        print("❌ El nombre no puede estar vacío")
-        return False
+        return "El nombre no puede estar vacío"
     
     if not job or len(job.strip()) == 0:
-        print("❌ El puesto no puede estar vacío")
-        return False
+        return "El puesto no puede estar vacío"
     
     if sal < 0:
-        print("❌ El salario no puede ser negativo")
+        return "El salario no puede ser negativo"
+    
+    return None
+
+def validar_empleado_data(empno: int, ename: str, job: str, sal: float) -> bool:
+    """
+    Valida los datos básicos de un empleado
+    
+    Args:
+        empno: Número de empleado
+        ename: Nombre del empleado
+        job: Puesto del empleado
+        sal: Salario del empleado
+        
+    Returns:
+        bool: True si los datos son válidos, False de lo contrario
+    """
+    motivo = motivo_invalido(empno, ename, job, sal)
+    if motivo:
+        print(f"❌ {motivo}")
         return False
     
-    return True
\ No newline at end of file
+    return True
+
+def registro_a_documento(registro, departamentos=None):
+    """
+    Convierte un registro externo (archivo, stdin) en un documento de empleado validado
+    Acepta el departamento anidado o en columnas deptno/dname/loc
+    
+    Args:
+        registro: Diccionario con los datos del empleado
+        departamentos: deptno -> departamento, para completar dname/loc faltantes
+        
+    Returns:
+        tuple: (documento, None) si es válido o (None, motivo) si no lo es
+    """
+    try:
+        dept = registro.get("departamento")
+        if not isinstance(dept, dict):
+            dept = {
+                "deptno": registro.get("deptno"),
+                "dname": registro.get("dname"),
+                "loc": registro.get("loc"),
+            }
+        
+        deptno = int(dept["deptno"])
+        conocido = (departamentos or {}).get(deptno, {})
+        dname = dept.get("dname") or conocido.get("dname")
+        loc = dept.get("loc") or conocido.get("loc")
+        if dname is None:
+            raise KeyError("dname")
+        if loc is None:
+            raise KeyError("loc")
+        
+        # None se convertiría en el texto "NONE": se trata como campo faltante
+        for campo in ("empno", "ename", "job", "sal"):
+            if registro.get(campo) is None:
+                raise KeyError(campo)
+        
+        data = {
+            "empno": int(registro["empno"]),
+            "ename": str(registro["ename"]).strip().upper(),
+            "job": str(registro["job"]).strip().upper(),
+            "sal": float(registro["sal"]),
+            "departamento": {
+                "deptno": deptno,
+                "dname": str(dname).strip().upper(),
+                "loc": str(loc).strip().upper(),
+            },
+        }
+    except KeyError as e:
+        return None, f"Campo faltante: {e}"
+    except (TypeError, ValueError) as e:
+        return None, f"Valor inválido: {e}"
+    
+    empleado = Empleado.from_dict(data)
+    motivo = motivo_invalido(empleado.empno, empleado.ename, empleado.job, empleado.sal)
+    if motivo:
+        return None, motivo
+    
+    return empleado.to_dict(), None
+
+def registro_a_cambios(registro, departamentos=None):
+    """
+    Convierte un registro parcial en los campos a modificar de un empleado
+    Solo se incluyen los campos presentes; el departamento acepta deptno solo si ya existe
+    
+    Args:
+        registro: Diccionario con ename, job, sal y/o departamento (anidado o deptno/dname/loc)
+        departamentos: deptno -> departamento, para completar dname/loc faltantes
+        
+    Returns:
+        tuple: (cambios, None) si es válido o (None, motivo) si no lo es
+    """
+    cambios = {}
+    try:
+        if registro.get("ename") is not None:
+            cambios["ename"] = str(registro["ename"]).strip().upper()
+            if not cambios["ename"]:
+                return None, "El nombre no puede estar vacío"
+        if registro.get("job") is not None:
+            cambios["job"] = str(registro["job"]).strip().upper()
+            if not cambios["job"]:
+                return None, "El puesto no puede estar vacío"
+        if registro.get("sal") is not None:
+            cambios["sal"] = float(registro["sal"])
+            if cambios["sal"] < 0:
+                return None, "El salario no puede ser negativo"
+        
+        dept = registro.get("departamento")
+        if not isinstance(dept, dict):
+            dept = registro
+        if dept.get("deptno") is not None:
+            deptno = int(dept["deptno"])
+            conocido = (departamentos or {}).get(deptno, {})
+            dname = dept.get("dname") or conocido.get("dname")
+            loc = dept.get("loc") or conocido.get("loc")
+            if dname is None or loc is None:
+                return None, f"Departamento {deptno} desconocido: indica dname y loc"
+            cambios["departamento"] = {
+                "deptno": deptno,
+                "dname": str(dname).strip().upper(),
+                "loc": str(loc).strip().upper(),
+            }
+    except (TypeError, ValueError) as e:
+        return None, f"Valor inválido: {e}"
+    
+    if not cambios:
+        return None, "Sin campos para actualizar (usa ename, job, sal o departamento)"
+    return cambios, None
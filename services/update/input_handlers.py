@@ -1,8 +1,10 @@
 """
 Manejadores de entrada para actualización de empleados
 """
-from services.shared import constants, input_utils
+from services.shared import input_utils
 from services.shared.input_utils import obtener_dato_texto, obtener_dato_numerico
+from services.shared.catalog import catalogo
+from db.mongo_config import get_collection
 
 def obtener_nuevo_nombre(nombre_actual):
     """Obtiene el nuevo nombre del empleado"""
@@ -14,9 +16,10 @@ def obtener_nuevo_nombre(nombre_actual):
 
 def obtener_nuevo_puesto(puesto_actual):
     """Obtiene el nuevo puesto del empleado"""
+    collection = get_collection()
     while True:
         print(f"\nPuesto actual: {puesto_actual}")
-        print("Puestos disponibles:", ', '.join(sorted(constants.PUESTOS_VALIDOS)))
+        print("Puestos disponibles:", ', '.join(catalogo.puestos(collection)))
         entrada = input(f"Nuevo puesto [{puesto_actual}] (o 'nuevo' para crear uno): ").strip()
         
         if entrada.lower() == 'cancelar':
@@ -28,7 +31,7 @@ def obtener_nuevo_puesto(puesto_actual):
             
         job = entrada.upper()
         
-        if job == 'NUEVO' or (job and job not in constants.PUESTOS_VALIDOS):
+        if job == 'NUEVO' or (job and not catalogo.es_puesto_valido(job, collection)):
             print("\n⚠️ Puesto no reconocido. Puedes:")
             print("1. Crear un nuevo puesto")
             print("2. Elegir uno de los disponibles")
@@ -47,7 +50,7 @@ def obtener_nuevo_puesto(puesto_actual):
                     return None
                 elif nuevo_puesto == 'atras':
                     continue
-                constants.PUESTOS_VALIDOS.add(nuevo_puesto)
+                catalogo.registrar_puesto(nuevo_puesto)
                 return nuevo_puesto
             elif opcion == '2':
                 continue  # Volver a mostrar puestos disponibles
@@ -59,7 +62,7 @@ def obtener_nuevo_puesto(puesto_actual):
                 return None
             else:
                 print("❌ Opción no válida")
-        elif job in constants.PUESTOS_VALIDOS:
+        elif catalogo.es_puesto_valido(job, collection):
             return job
         else:
             print("❌ Puesto no válido")
@@ -99,9 +102,10 @@ def obtener_nuevo_departamento_completo(dept_actual):
 
 def obtener_departamento_nuevo():
     """Obtiene un nuevo departamento"""
+    collection = get_collection()
     while True:
         deptno = input_utils.obtener_dato_numerico(
-            "Número de departamento (10=ACCOUNTING, 20=RESEARCH, 30=SALES): ",
+            f"Número de departamento ({catalogo.descripcion_departamentos(collection)}): ",
             mensaje_error="❌ Número de departamento inválido"
         )
         if deptno is None:
@@ -109,12 +113,8 @@ def obtener_departamento_nuevo():
         elif deptno == 'atras':
             return 'atras'
         
-        # Mapeo de departamentos predefinidos
-        departamentos = {
-            10: {"deptno": 10, "dname": "ACCOUNTING", "loc": "NEW YORK"},
-            20: {"deptno": 20, "dname": "RESEARCH", "loc": "DALLAS"},
-            30: {"deptno": 30, "dname": "SALES", "loc": "CHICAGO"}
-        }
+        # Departamentos conocidos (catálogo)
+        departamentos = catalogo.departamentos(collection)
         
         if deptno in departamentos:
             return departamentos[deptno]
@@ -3,6 +3,7 @@ Servicios para actualizar empleados existentes - Versión corregida
 """
 import logging
 from db.mongo_config import get_collection
+from services.repository import EmployeeRepository
 from services.read.service import leer_empleados
 from ui.menus import limpiar_pantalla
 from .input_handlers import obtener_nuevo_nombre, obtener_nuevo_puesto, obtener_nuevo_salario, obtener_nuevo_departamento_completo
@@ -28,7 +29,7 @@ def actualizar_empleado():
         while True:  # Bucle principal para permitir actualizar múltiples empleados
             # Limpiar pantalla y mostrar lista actual de empleados
             limpiar_pantalla()
-            leer_empleados()
+            leer_empleados(navegar=False, en_vivo=False)
             
             print("\n✏️ Actualizar empleado")
             print("💡 Puedes escribir 'cancelar' en cualquier momento para salir\n")
@@ -40,7 +41,7 @@ def actualizar_empleado():
                 return
                 
             # Buscar empleado
-            empleado = collection.find_one({"empno": empno})
+            empleado = EmployeeRepository(collection).get(empno)
             if not empleado:
                 print(f"❌ No se encontró un empleado con ID: {empno}")
                 opcion = obtener_opcion_reintento("empleado no encontrado")
@@ -57,8 +58,8 @@ def actualizar_empleado():
                 if resultado_actualizacion == 'actualizado':
                     # Empleado actualizado exitosamente, preguntar si quiere actualizar otro
                     limpiar_pantalla()
-                    leer_empleados()  # Mostrar lista actualizada
-                    print(f"✅ Empleado {empleado['ename']} (ID: {empno}) actualizado exitosamente.\n")
+                    leer_empleados(navegar=False, en_vivo=False)  # Mostrar lista actualizada
+                    print(f"✅ Empleado {empleado.ename} (ID: {empno}) actualizado exitosamente.\n")
                     
                     if preguntar_continuar():
                         continue  # Volver al inicio para actualizar otro empleado
@@ -83,13 +84,13 @@ def procesar_actualizacion(empleado, collection):
     Maneja todo el proceso de actualización de un empleado
     
     Args:
-        empleado: Documento del empleado a actualizar
+        empleado: Empleado a actualizar
         collection: Colección de MongoDB
         
     Returns:
         str: 'actualizado', 'cancelado_continuar' o 'cancelado_salir'
     """
-    print(f"\nActualizando empleado: {empleado['ename']} (ID: {empleado['empno']})")
+    print(f"\nActualizando empleado: {empleado.ename} (ID: {empleado.empno})")
     print("💡 Deja vacío para conservar el valor actual")
     print("💡 Escribe 'cancelar' para salir o 'atras' para volver al paso anterior\n")
     
@@ -104,7 +105,7 @@ def procesar_actualizacion(empleado, collection):
     
     while True:
         if paso_actual == 0:  # Nombre
-            resultado = obtener_nuevo_nombre(empleado['ename'])
+            resultado = obtener_nuevo_nombre(empleado.ename)
             if resultado is None:
                 return 'cancelado_salir'
             elif resultado == 'atras':
@@ -115,7 +116,7 @@ def procesar_actualizacion(empleado, collection):
                 paso_actual = 1
                 
         elif paso_actual == 1:  # Puesto
-            resultado = obtener_nuevo_puesto(empleado['job'])
+            resultado = obtener_nuevo_puesto(empleado.job)
             if resultado is None:
                 return 'cancelado_salir'
             elif resultado == 'atras':
@@ -126,7 +127,7 @@ def procesar_actualizacion(empleado, collection):
                 paso_actual = 2
                 
         elif paso_actual == 2:  # Salario
-            resultado = obtener_nuevo_salario(empleado['sal'])
+            resultado = obtener_nuevo_salario(empleado.sal)
             if resultado is None:
                 return 'cancelado_salir'
             elif resultado == 'atras':
@@ -137,7 +138,8 @@ def procesar_actualizacion(empleado, collection):
                 paso_actual = 3
                 
         elif paso_actual == 3:  # Departamento
-            resultado = obtener_nuevo_departamento_completo(empleado.get('departamento', {}))
+            dept_actual = empleado.departamento.to_dict() if empleado.departamento.deptno is not None else {}
+            resultado = obtener_nuevo_departamento_completo(dept_actual)
             if resultado is None:
                 return 'cancelado_salir'
             elif resultado == 'atras':
@@ -158,18 +160,16 @@ def procesar_actualizacion(empleado, collection):
                 continue
             elif confirmacion == 'S':
                 # Ejecutar actualización
-                update_data = {
-                    "$set": {
-                        "ename": nuevo_nombre,
-                        "job": nuevo_job,
-                        "sal": nuevo_sal,
-                        "departamento": nuevo_departamento
-                    }
+                cambios = {
+                    "ename": nuevo_nombre,
+                    "job": nuevo_job,
+                    "sal": nuevo_sal,
+                    "departamento": nuevo_departamento
                 }
                 
-                result = collection.update_one({"empno": empleado['empno']}, update_data)
+                result = EmployeeRepository(collection).update_many({empleado.empno: cambios})
                 
-                if result.modified_count > 0:
+                if result["modificados"] > 0:
                     return 'actualizado'
                 else:
                     print("⚠️ No se realizaron cambios (los datos son idénticos).")
@@ -105,6 +105,14 @@ def crear_archivo_env(config):
 MONGO_URI=mongodb://{config['MONGO_HOST']}:{config['MONGO_PORT']}
 MONGO_DB={config['MONGO_DB']}
 MONGO_COLLECTION={config['MONGO_COLLECTION']}
+
+# Pool de conexiones y compresión (opcional)
+# MONGO_MAX_POOL_SIZE=100
+# MONGO_MIN_POOL_SIZE=0
+# MONGO_MAX_IDLE_TIME_MS=60000
+# MONGO_WAIT_QUEUE_TIMEOUT_MS=5000
+# MONGO_COMPRESSORS=zstd,snappy,zlib
+# MONGO_READ_PREFERENCE=primary
 """
         try:
             with open('.env', 'w', encoding='utf-8') as f:
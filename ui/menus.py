@@ -34,6 +34,12 @@ def mostrar_menu():
     print("5. 🔍 Buscar empleado por ID")
     print("6. 🧪 Insertar datos de prueba")
     print("7. 🧹 Limpiar base de datos")
+    print("8. 📥 Importar empleados (CSV/JSONL)")
+    print("9. 📤 Exportar empleados (JSONL/CSV)")
+    print("10. 🩺 Diagnóstico de conexión")
+    print("11. 📊 Reportes de salarios")
+    print("12. 🧮 Actualización masiva")
+    print("13. 🗑️ Eliminación masiva")
     print("0. 🚪 Salir")
     print("=" * 40)
 